@@ -1,5 +1,15 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
+from django.db.models.signals import post_delete
 
 
 class CcvConfig(AppConfig):
     name = 'ccv'
+
+    def ready(self):
+        from .cache import invalidate_deleted_ccv
+        from .db import schedule_health_checks
+        from .models.base import CanadianCommonCv
+
+        post_delete.connect(invalidate_deleted_ccv, sender=CanadianCommonCv, dispatch_uid='invalidate_deleted_ccv')
+        request_started.connect(schedule_health_checks, dispatch_uid='schedule_health_checks')
@@ -0,0 +1,25 @@
+from django.db.backends.postgresql import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend checking a persistent connection (see CONN_MAX_AGE) once per request, with CONN_HEALTH_CHECKS,
+    which Django only supports from 4.1. The check runs when the connection is first used, so a request which doesn't
+    query the database doesn't pay for it. A connection dropped by a restart of the database or by the idle timeout of
+    a pooler is replaced instead of failing the request.
+    """
+
+    # Whether the connection was checked since the request started, see ccv.db.schedule_health_checks
+    health_check_done = True
+
+    def connect(self):
+        # A new connection is usable, and ensure_connection is called again while it is set up
+        self.health_check_done = True
+        super().connect()
+
+    def ensure_connection(self):
+        if self.connection is not None and not self.health_check_done:
+            self.health_check_done = True
+            if self.settings_dict.get('CONN_HEALTH_CHECKS') and not self.in_atomic_block and not self.is_usable():
+                self.close()
+        super().ensure_connection()
@@ -0,0 +1,179 @@
+import os
+import re
+import statistics
+import tempfile
+import time
+from io import StringIO
+
+from django.core import management
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+
+from .cache import get_cache, get_key
+from .models.base import CanadianCommonCv
+from .reader import iter_sections
+from .schema import SCHEMA
+from .serializers import CanadianCommonCvSerializer
+
+CCV_IDENTIFIER = re.compile(rb'(ccvIdentifier=")([^"]*)(")')
+
+
+class Rollback(Exception):
+    """Raised to undo the rows written by a benchmark run"""
+
+
+class StatementCounter:
+    """
+    Counts the SQL statements run while installed as a connection.execute_wrapper. Unlike the queries log, it isn't
+    reset when a request starts and costs nothing per statement
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def measure(function, repeat: int = 3, setup=None) -> dict:
+    """
+    Runs a function several times
+    :param function: function without arguments
+    :param repeat: number of runs
+    :param setup: function without arguments run before each run, it isn't measured
+    :return: best and median wall time of the runs in seconds, and number of SQL statements of the first one
+    """
+    timings = []
+    statements = None
+    for _ in range(max(repeat, 1)):
+        if setup is not None:
+            setup()
+        counter = StatementCounter()
+        with connection.execute_wrapper(counter):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        if statements is None:
+            statements = counter.count
+
+    return {'seconds': min(timings), 'median': statistics.median(timings), 'statements': statements}
+
+
+def rolled_back(function):
+    """
+    :param function: function without arguments writing to the database
+    :return: function running it in a transaction which is rolled back afterwards
+    """
+    def run():
+        try:
+            with transaction.atomic():
+                function()
+                raise Rollback
+        except Rollback:
+            pass
+    return run
+
+
+def ingest(file_path: str, bulk: bool = False) -> int:
+    """
+    :param file_path: CCV xml file
+    :param bulk: passed on to parse_ccv
+    :return: id of the ingested CV
+    """
+    output = StringIO()
+    management.call_command('parse_ccv', file_path, bulk=bulk, stdout=output, stderr=StringIO())
+    return int(output.getvalue().strip())
+
+
+def serialize(ccv_id: int) -> dict:
+    """
+    :param ccv_id:
+    :return: representation of the CV, loaded with the queries of the API
+    """
+    queryset = CanadianCommonCvSerializer.setup_eager_loading(CanadianCommonCv.objects.filter(id=ccv_id))
+    return CanadianCommonCvSerializer(queryset.get()).data
+
+
+def benchmark_file(file_path: str, repeat: int = 3) -> dict:
+    """
+    Parses, ingests and serializes a CV. Nothing is kept in the database
+    :param file_path: CCV xml file
+    :param repeat: number of runs of each measure
+    :return: measures of the file
+    """
+    def serialize_ingested():
+        ccv_id = ingest(copy_path, bulk=True)
+        results['serialize'] = measure(lambda: serialize(ccv_id), repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The copy is ingested even if the file was already ingested in the database
+        copy_path, = replicate([file_path], 1, directory)
+        results = {
+            'file': file_path,
+            'bytes': os.path.getsize(file_path),
+            'parse': measure(lambda: list(iter_sections(file_path, SCHEMA)), repeat),
+            'ingest': measure(rolled_back(lambda: ingest(copy_path)), repeat),
+            'bulk_ingest': measure(rolled_back(lambda: ingest(copy_path, bulk=True)), repeat),
+        }
+        rolled_back(serialize_ingested)()
+
+    return results
+
+
+def replicate(file_paths: list, count: int, directory: str, start: int = 0) -> list:
+    """
+    Writes copies of CCV files, taken in turn, with a ccvIdentifier of their own so that each copy is ingested as a new
+    CV, whatever was ingested before
+    :param file_paths: CCV xml files
+    :param count: number of copies
+    :param directory: directory the copies are written to
+    :param start: number of copies written before, the files are taken in turn from there
+    :return: paths of the copies
+    """
+    copies = []
+    for index in range(start, start + count):
+        file_path = file_paths[index % len(file_paths)]
+        with open(file_path, 'rb') as source:
+            content = CCV_IDENTIFIER.sub(rb'\g<1>\g<2>-benchmark-%d\g<3>' % index, source.read())
+
+        copy_path = os.path.join(directory, f'{index:06d}-{os.path.basename(file_path)}')
+        with open(copy_path, 'wb') as copy:
+            copy.write(content)
+        copies.append(copy_path)
+
+    return copies
+
+
+class ApiBenchmark:
+    """
+    Requests the API in process, with the connection and transaction of the benchmark. The cached representations of
+    the CVs are evicted before the cold requests
+    """
+
+    def __init__(self, repeat: int = 3):
+        self.repeat = repeat
+        self.client = Client()
+
+    def evict(self, ccv_ids: list) -> None:
+        states = CanadianCommonCv.objects.filter(id__in=ccv_ids).values_list('id', 'updated_at')
+        get_cache().delete_many([get_key(ccv_id, updated_at) for ccv_id, updated_at in states])
+
+    def get(self, path: str, params: dict = None) -> None:
+        response = self.client.get(path, params or {})
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} {params or ''} returned {response.status_code}")
+
+    def measure(self, path: str, params: dict, ccv_ids: list) -> dict:
+        """
+        :param path:
+        :param params: query parameters
+        :param ccv_ids: CVs the request renders
+        :return: measures of the request with the cached representations evicted, then cached
+        """
+        with override_settings(ALLOWED_HOSTS=['testserver']):
+            return {
+                'cold': measure(lambda: self.get(path, params), self.repeat, lambda: self.evict(ccv_ids)),
+                'warm': measure(lambda: self.get(path, params), self.repeat),
+            }
@@ -0,0 +1,145 @@
+from collections import defaultdict
+
+from django.db import connections
+
+
+class BulkCollector:
+    """
+    Collects unsaved model instances during an ingestion and writes them with one bulk_create per model.
+    Models are written in foreign key dependency order so that parents have a primary key before their
+    children are inserted.
+    """
+
+    def __init__(self, using: str = 'default'):
+        self.using = using
+        self.instances = defaultdict(list)
+        self.m2m_links = defaultdict(list)
+        self.written = defaultdict(int)
+        self.current_model = None
+
+    def add(self, obj):
+        """
+        Queues an unsaved instance
+        :param obj: model instance
+        :return: the queued instance
+        """
+        self.instances[type(obj)].append(obj)
+        return obj
+
+    def add_m2m(self, obj, field_name: str, target) -> None:
+        """
+        Queues a many-to-many link, written once both ends have a primary key
+        :param obj: instance owning the many-to-many field
+        :param field_name: name of the many-to-many field
+        :param target: instance to link
+        :return:
+        """
+        self.m2m_links[(type(obj), field_name)].append((obj, target))
+
+    def get_dependencies(self, model) -> set:
+        """
+        :param model:
+        :return: the queued models that the given model references through a foreign key
+        """
+        return {
+            field.related_model for field in model._meta.concrete_fields
+            if field.is_relation and field.related_model in self.instances and field.related_model is not model
+        }
+
+    def get_insert_order(self) -> list:
+        """
+        Sorts the queued models so that every model comes after the models it references
+        :return: list of models
+        """
+        pending = {model: self.get_dependencies(model) for model in self.instances}
+        ordered = []
+
+        while pending:
+            ready = [model for model, dependencies in pending.items() if not dependencies - set(ordered)]
+            if not ready:
+                raise ValueError(f"Circular foreign keys between {', '.join(m.__name__ for m in pending)}")
+            for model in ready:
+                ordered.append(model)
+                pending.pop(model)
+
+        return ordered
+
+    @staticmethod
+    def resolve_foreign_keys(obj) -> None:
+        """
+        Copies the primary key of related instances which were saved after being assigned to the given instance
+        :param obj:
+        :return:
+        """
+        for field in obj._meta.concrete_fields:
+            if not field.is_relation or getattr(obj, field.attname) is not None or not field.is_cached(obj):
+                continue
+
+            related = field.get_cached_value(obj)
+            if related is None:
+                continue
+            if related.pk is None:
+                raise ValueError(f"{type(obj).__name__}.{field.name} references an unsaved "
+                                 f"{type(related).__name__}")
+            setattr(obj, field.attname, related.pk)
+
+    def write(self, model, objs: list, referenced: bool) -> None:
+        """
+        Inserts the instances of one model
+        :param model:
+        :param objs:
+        :param referenced: whether other queued instances need the primary keys of these instances
+        :return:
+        """
+        can_return_rows = connections[self.using].features.can_return_rows_from_bulk_insert
+
+        if model._meta.parents or (referenced and not can_return_rows):
+            # bulk_create doesn't support multi-table inheritance. Without returned primary keys, parents are
+            # saved one by one as well so that their children can be wired up
+            for obj in objs:
+                self.resolve_foreign_keys(obj)
+                obj.save(using=self.using)
+        else:
+            for obj in objs:
+                obj.normalize_fields()
+                self.resolve_foreign_keys(obj)
+            model.objects.using(self.using).bulk_create(objs)
+
+        self.written[model] += len(objs)
+
+    def write_m2m_links(self) -> None:
+        """
+        Inserts the rows of the many-to-many intermediate tables
+        :return:
+        """
+        for (model, field_name), links in self.m2m_links.items():
+            field = model._meta.get_field(field_name)
+            through = field.remote_field.through
+
+            rows = [
+                through(**{field.m2m_field_name(): obj, field.m2m_reverse_field_name(): target})
+                for obj, target in links
+            ]
+            through.objects.using(self.using).bulk_create(rows)
+            self.written[through] += len(rows)
+
+    def flush(self) -> None:
+        """
+        Writes all the queued instances and many-to-many links, then empties the queue
+        :return:
+        """
+        referenced = set()
+        for model in self.instances:
+            referenced |= self.get_dependencies(model)
+        for model, field_name in self.m2m_links:
+            referenced |= {model, model._meta.get_field(field_name).related_model}
+
+        for model in self.get_insert_order():
+            self.current_model = model
+            self.write(model, self.instances[model], model in referenced)
+
+        self.current_model = None
+        self.write_m2m_links()
+
+        self.instances.clear()
+        self.m2m_links.clear()
@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .serializers import CanadianCommonCvSerializer
+
+# Part of the cache keys: bump it when the representation of a CV changes, so that the fragments cached by the
+# previous release are ignored
+REPRESENTATION_VERSION = 1
+
+
+def get_cache():
+    return caches[settings.CCV_CACHE]
+
+
+def get_key(ccv_id: int, updated_at) -> str:
+    """
+    :param ccv_id:
+    :param updated_at: updated_at of the CV: each ingestion caches the CV under a new key
+    :return:
+    """
+    return f"ccv:representation:{REPRESENTATION_VERSION}:{ccv_id}:{updated_at.isoformat()}"
+
+
+def get_representations(states: list, queryset) -> list:
+    """
+    Serialized CVs, from the cache when they are in it. The other ones are loaded and serialized together, then cached.
+    :param states: (id, updated_at) of the CVs, in the order of the representations to return
+    :param queryset: CanadianCommonCv queryset the CVs missing from the cache are loaded from
+    :return: representations of the CVs which exist
+    """
+    cache = get_cache()
+    keys = {ccv_id: get_key(ccv_id, updated_at) for ccv_id, updated_at in states}
+    cached = cache.get_many(list(keys.values()))
+    representations = {ccv_id: cached[key] for ccv_id, key in keys.items() if key in cached}
+
+    missing = [ccv_id for ccv_id in keys if ccv_id not in representations]
+    if missing:
+        ccvs = list(queryset.filter(id__in=missing))
+        serialized = {ccv.id: CanadianCommonCvSerializer(ccv).data for ccv in ccvs}
+        # Cached under the updated_at they were loaded with, which may be newer than the one of the states
+        cache.set_many({get_key(ccv.id, ccv.updated_at): serialized[ccv.id] for ccv in ccvs},
+                       timeout=settings.CCV_CACHE_TIMEOUT)
+        representations.update(serialized)
+
+    return [representations[ccv_id] for ccv_id in keys if ccv_id in representations]
+
+
+def invalidate(states: list, using: str = 'default') -> None:
+    """
+    Removes the previous representations of the changed CVs from the cache once the current transaction is committed.
+    Nothing reads them anymore: the keys include the updated_at of the CVs, which each ingestion bumps, so other
+    processes, whose caches this doesn't reach, serve the new representations as well. It only frees the memory of a
+    shared cache. A request which read a CV before the commit may still cache it after the removal, but under the key
+    of its previous updated_at, which no later request reads, until it expires
+    :param states: (id, updated_at) of the changed CVs, as they were before the transaction
+    :param using: database of the transaction
+    :return:
+    """
+    transaction.on_commit(lambda: get_cache().delete_many([
+        get_key(ccv_id, updated_at) for ccv_id, updated_at in states
+    ]), using=using)
+
+
+def invalidate_deleted_ccv(sender, instance, using, **kwargs) -> None:
+    """
+    post_delete receiver of CanadianCommonCv
+    """
+    invalidate([(instance.pk, instance.updated_at)], using)
@@ -862,7 +862,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2014-08-01",
                 "end_date": None,
                 "work_description": "",
-                "department": None,
+                "department": "Biomedical Ethics Unit",
                 "campus": "Medicine",
                 "tenure_status": "Tenure Track",
                 "tenure_start_date": None,
@@ -876,7 +876,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2014-08-01",
                 "end_date": None,
                 "work_description": "",
-                "department": None,
+                "department": "Human Genetics",
                 "campus": "Medicine",
                 "tenure_status": "Tenure Track",
                 "tenure_start_date": None,
@@ -890,7 +890,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2014-01-01",
                 "end_date": None,
                 "work_description": "",
-                "department": None,
+                "department": "Human Genetics",
                 "campus": "Medicine",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
@@ -904,7 +904,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2010-11-01",
                 "end_date": None,
                 "work_description": "",
-                "department": None,
+                "department": "Centre de recherche en droit public, RDCG",
                 "campus": "Law",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
@@ -918,7 +918,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2013-05-01",
                 "end_date": "2014-08-01",
                 "work_description": "",
-                "department": None,
+                "department": "Biomedical Ethics Unit",
                 "campus": "Medicine",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
@@ -932,7 +932,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2009-06-01",
                 "end_date": "2014-08-01",
                 "work_description": "",
-                "department": None,
+                "department": "Human Genetics",
                 "campus": "Medicine",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
@@ -946,7 +946,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2007-01-01",
                 "end_date": "2009-06-01",
                 "work_description": "",
-                "department": None,
+                "department": "Centre de recherche en droit public",
                 "campus": "Law",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
@@ -960,7 +960,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2002-05-01",
                 "end_date": "2007-01-01",
                 "work_description": "",
-                "department": None,
+                "department": "Centre de recherche en droit public",
                 "campus": "Law",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
@@ -974,7 +974,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2001-02-01",
                 "end_date": "2002-05-01",
                 "work_description": "",
-                "department": None,
+                "department": "Centre de recherche en droit public",
                 "campus": "Law",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
@@ -988,7 +988,7 @@ SAMPLE_TEST_CONSTANTS = {
                 "start_date": "2000-09-01",
                 "end_date": "2001-02-01",
                 "work_description": "",
-                "department": None,
+                "department": "Centre de recherche en droit public",
                 "campus": "Law",
                 "tenure_status": "Non Tenure Track",
                 "tenure_start_date": None,
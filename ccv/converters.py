@@ -0,0 +1,97 @@
+import datetime
+from functools import lru_cache
+
+# Number of distinct values remembered by each date converter. The dates of a CV repeat a lot (months of employment,
+# degrees, funding...), and a worker ingesting many files keeps the most recent ones
+CACHE_SIZE = 4096
+
+BOOLEANS = {'Yes': True, 'No': False}
+
+
+class ConversionError(ValueError):
+    """A value of a CCV field which can't be converted to the type of its model field"""
+
+
+def parse_year_month(value: str) -> datetime.datetime:
+    """
+    Fast path of strptime(value, '%Y/%m'), falling back to strptime for anything but 'YYYY/M' or 'YYYY/MM'. The CCV
+    exports a year month whose month wasn't picked as 'YYYY/', which is read as the year, like the fields of year type
+    """
+    year, separator, month = value.partition('/')
+    if len(year) == 4 and len(month) <= 2 and separator and (year + month).isdigit() and value.isascii():
+        return datetime.datetime(int(year), int(month or 1), 1)
+    return datetime.datetime.strptime(value, '%Y/%m')
+
+
+def parse_date(value: str) -> datetime.datetime:
+    """
+    Fast path of strptime(value, '%Y-%m-%d'), falling back to strptime for anything but 'YYYY-MM-DD'
+    """
+    if len(value) == 10 and value[4] == value[7] == '-' and value.isascii():
+        year, month, day = value[:4], value[5:7], value[8:]
+        if (year + month + day).isdigit():
+            return datetime.datetime(int(year), int(month), int(day))
+    return datetime.datetime.strptime(value, '%Y-%m-%d')
+
+
+PARSERS = {
+    '%Y/%m': parse_year_month,
+    '%Y-%m-%d': parse_date,
+}
+
+
+def date(format: str):
+    """
+    :param format: strptime format of the dates
+    :return: converter of the dates of a field, remembering the last CACHE_SIZE values it converted. It raises
+        ConversionError for a value which doesn't match the format
+    """
+    parse = PARSERS.get(format) or (lambda value: datetime.datetime.strptime(value, format))
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def parse_cached(value: str) -> datetime.datetime:
+        try:
+            return parse(value)
+        except ValueError as e:
+            raise ConversionError(f"{value!r} is not a date matching {format}") from e
+
+    def convert(value):
+        if not value:
+            return None
+        if not isinstance(value, str):
+            raise ConversionError(f"{value!r} is not a date matching {format}")
+        return parse_cached(value)
+
+    convert.cache_info = parse_cached.cache_info
+    return convert
+
+
+def boolean(value) -> bool:
+    """
+    :param value: 'Yes' or 'No', missing values are False
+    :return:
+    """
+    if not value:
+        return False
+    try:
+        return BOOLEANS[value]
+    except (KeyError, TypeError):
+        raise ConversionError(f"{value!r} is not Yes or No") from None
+
+
+def integer(value) -> int or None:
+    """
+    :param value: decimal digits, missing values are None
+    :return:
+    """
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        raise ConversionError(f"{value!r} is not an integer") from None
+
+
+DATE = date('%Y-%m-%d')
+YEAR_MONTH = date('%Y/%m')
+YEAR = date('%Y')
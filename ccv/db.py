@@ -0,0 +1,21 @@
+from django.db import connections
+
+
+def schedule_health_checks(**kwargs) -> None:
+    """
+    Checks the persistent connections again on their next use, see ccv.backends.postgresql. Runs when a request
+    starts, without querying the database
+    """
+    for connection in connections.all():
+        connection.health_check_done = False
+
+
+def refresh_connections() -> None:
+    """
+    Closes the obsolete and broken connections of a long running process outside of the request cycle, and checks the
+    other ones on their next use. Connections in a transaction are left open
+    """
+    for connection in connections.all():
+        if not connection.in_atomic_block:
+            connection.close_if_unusable_or_obsolete()
+    schedule_health_checks()
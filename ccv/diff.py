@@ -0,0 +1,189 @@
+from collections import defaultdict
+
+from django.db.models.deletion import Collector
+
+from ccv.bulk import BulkCollector
+from ccv.models.search import SearchDocument
+
+# Columns which don't tell whether the content of a row changed
+UNCOMPARED_FIELDS = ('created_at', 'updated_at', 'record_id')
+# Rows which aren't ingested from the CV but computed from its rows, and are updated after them
+DERIVED_MODELS = (SearchDocument,)
+
+
+class RecordDiff:
+    """
+    Matches the rows built while ingesting a new submission of a CV against the rows stored for the previous one.
+    Rows ingested from a section with a recordId are matched on it, the others (container sections, other organizations)
+    on their content. Unchanged rows aren't written again, changed rows are updated, new rows are inserted by the
+    caller, and the stored rows which weren't matched are deleted.
+    """
+
+    def __init__(self, ccv, using: str = 'default'):
+        self.using = using
+        self.stored = defaultdict(list)
+        self.stored_links = {}
+        self.links = defaultdict(set)
+        self.updates = []
+        self.unchanged = 0
+        self.inserted = 0
+        self.load(ccv)
+
+    @staticmethod
+    def get_compared_fields(model) -> list:
+        """
+        :param model:
+        :return: the columns holding the content of a row
+        """
+        return [
+            field for field in model._meta.concrete_fields
+            if not field.primary_key and field.name not in UNCOMPARED_FIELDS
+            and not (field.remote_field and field.remote_field.parent_link)
+        ]
+
+    def get_key(self, obj) -> tuple:
+        """
+        :param obj:
+        :return: the key a row is matched on
+        """
+        model = type(obj)
+        if obj.record_id:
+            return model, obj.record_id
+        return model, tuple(field.to_python(getattr(obj, field.attname)) for field in self.get_compared_fields(model))
+
+    def load(self, ccv) -> None:
+        """
+        Indexes the rows stored for a CV: the rows deleted along with it, and the rows they own through a one to one
+        or a many to many field
+        :param ccv: CanadianCommonCv
+        :return:
+        """
+        collector = Collector(using=self.using)
+        collector.collect([ccv])
+
+        # The collector only fetches the columns needed to cascade, the rows are loaded again in full. The rows of
+        # the many-to-many intermediate tables are compared as links, see write_links
+        pks = defaultdict(set)
+        for model, instances in collector.data.items():
+            pks[model] |= {obj.pk for obj in instances}
+        for queryset in collector.fast_deletes:
+            pks[queryset.model] |= set(queryset.values_list('pk', flat=True))
+
+        rows = defaultdict(dict)
+        for model, model_pks in pks.items():
+            if not model._meta.auto_created and model is not type(ccv) and model not in DERIVED_MODELS:
+                rows[model] = model.objects.using(self.using).in_bulk(list(model_pks))
+
+        owned = defaultdict(set)
+        for model, instances in list(rows.items()):
+            for field in model._meta.concrete_fields:
+                if field.one_to_one and not field.remote_field.parent_link:
+                    owned[field.related_model] |= {getattr(obj, field.attname) for obj in instances.values()}
+
+            for field in model._meta.local_many_to_many:
+                through = field.remote_field.through
+                links = set(through.objects.using(self.using).filter(**{
+                    f"{field.m2m_field_name()}__in": list(instances)
+                }).values_list(field.m2m_column_name(), field.m2m_reverse_name()))
+                self.stored_links[(model, field.name)] = links
+                owned[field.related_model] |= {target for _, target in links}
+
+        for model, pks in owned.items():
+            pks.discard(None)
+            rows[model].update(model.objects.using(self.using).in_bulk(list(pks)))
+        rows.pop(type(ccv), None)
+
+        # Multi-table inheritance: the parent row is matched and deleted along with the child row
+        for model, instances in list(rows.items()):
+            for parent in model._meta.get_parent_list():
+                for pk in instances:
+                    rows[parent].pop(pk, None)
+
+        for model, instances in rows.items():
+            for obj in instances.values():
+                self.stored[self.get_key(obj)].append(obj)
+
+    def match(self, obj) -> bool:
+        """
+        Looks up the stored row of an instance. When found, the instance takes its primary key, and is queued for
+        update if its content changed
+        :param obj: unsaved model instance
+        :return: whether a stored row was found, otherwise the instance has to be inserted
+        """
+        obj.normalize_fields()
+        candidates = self.stored.get(self.get_key(obj))
+        if not candidates:
+            self.inserted += 1
+            return False
+
+        stored = candidates.pop(0)
+        for parent in obj._meta.get_parent_list():
+            setattr(obj, parent._meta.pk.attname, stored.pk)
+        obj.pk = stored.pk
+        obj.created_at = stored.created_at
+        obj.updated_at = stored.updated_at
+        obj._state.adding = False
+        obj._state.db = self.using
+
+        changed = [
+            field.name for field in self.get_compared_fields(type(obj))
+            if field.to_python(getattr(obj, field.attname)) != getattr(stored, field.attname)
+        ]
+        if changed:
+            self.updates.append((obj, changed + ['updated_at']))
+        else:
+            self.unchanged += 1
+        return True
+
+    def add_link(self, obj, field_name: str, target) -> None:
+        """
+        Records a many-to-many link of the new submission
+        :param obj:
+        :param field_name:
+        :param target:
+        :return:
+        """
+        field = obj._meta.get_field(field_name)
+        self.links[(field.model, field_name)].add((obj, target))
+
+    def write_links(self) -> None:
+        """
+        Adds the many-to-many links which aren't stored yet and removes the stored ones which are gone
+        :return:
+        """
+        for key in set(self.links) | set(self.stored_links):
+            model, field_name = key
+            field = model._meta.get_field(field_name)
+            through = field.remote_field.through
+            stored = self.stored_links.get(key, set())
+            wanted = {(obj.pk, target.pk) for obj, target in self.links.get(key, ())}
+
+            through.objects.using(self.using).bulk_create([
+                through(**{field.m2m_column_name(): obj_pk, field.m2m_reverse_name(): target_pk})
+                for obj_pk, target_pk in wanted - stored
+            ])
+            for obj_pk, target_pk in stored - wanted:
+                through.objects.using(self.using).filter(**{
+                    field.m2m_column_name(): obj_pk, field.m2m_reverse_name(): target_pk
+                }).delete()
+
+    def apply(self) -> dict:
+        """
+        Writes the changed rows and links and deletes the stored rows which weren't matched. Runs once the new rows
+        are inserted, so that updated rows can reference them.
+        :return: number of rows per kind of change
+        """
+        for obj, changed in self.updates:
+            BulkCollector.resolve_foreign_keys(obj)
+            obj.save(using=self.using, update_fields=changed)
+
+        self.write_links()
+
+        deleted = [obj for candidates in self.stored.values() for obj in candidates]
+        for obj in deleted:
+            obj.delete(using=self.using)
+
+        return {
+            'inserted': self.inserted, 'updated': len(self.updates), 'unchanged': self.unchanged,
+            'deleted': len(deleted),
+        }
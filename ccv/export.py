@@ -0,0 +1,20 @@
+from rest_framework.utils.encoders import JSONEncoder
+
+from .iteration import DEFAULT_CHUNK_SIZE, iter_chunks
+from .serializers import ALL, CanadianCommonCvSerializer
+
+
+def iter_ndjson(queryset, selection=ALL, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Serializes CVs as newline delimited JSON, by id
+    :param queryset: CanadianCommonCv queryset
+    :param selection: see ccv.serializers.get_selection
+    :param chunk_size: number of CVs loaded at once
+    :return: generator of lines, one JSON document per CV
+    """
+    encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    queryset = CanadianCommonCvSerializer.setup_eager_loading(queryset.order_by('id'), selection)
+
+    for chunk in iter_chunks(queryset, chunk_size):
+        for data in CanadianCommonCvSerializer(chunk, many=True, context={'selection': selection}).data:
+            yield encoder.encode(data) + '\n'
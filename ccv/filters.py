@@ -0,0 +1,103 @@
+import datetime
+
+from django.db.models import Q
+from rest_framework.compat import coreapi, coreschema
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from . import search
+from .models.education import Degree
+from .models.employment import AcademicWorkExperience
+from .models.recognitions import AreaOfResearch, ResearchDiscipline
+
+
+class CcvFilter(BaseFilterBackend):
+    """
+    Structured filters of the CVs. A filter keeps the CVs having a row which matches one of its values, the query
+    parameter may be repeated. Each filter is a semi-join on an index of the filtered columns of the model and the
+    foreign key leading to the CV, see the indexes of the models.
+    """
+
+    # Query parameter: model, filtered column, path from the model to the id of the CV, description
+    filters = {
+        'research_area': (AreaOfResearch, 'area', 'user_profile__ccv_id', "Area of research of the user profile"),
+        'sector': (AreaOfResearch, 'sector', 'user_profile__ccv_id',
+                   "Sector of an area of research of the user profile"),
+        'discipline': (ResearchDiscipline, 'discipline', 'user_profile__ccv_id',
+                       "Research discipline of the user profile"),
+        'organization': (AcademicWorkExperience, 'organization__name', 'employment__ccv_id',
+                         "Organization of an academic work experience"),
+        'degree_type': (Degree, 'type', 'education__ccv_id', "Type of a degree, e.g. Doctorate"),
+    }
+    active_between_param = 'active_between'
+
+    @staticmethod
+    def parse_date(value: str):
+        """
+        :param value: YYYY-MM-DD, or empty
+        :return: date or None
+        """
+        try:
+            return datetime.date.fromisoformat(value) if value else None
+        except ValueError:
+            raise ValidationError({CcvFilter.active_between_param: f"{value} isn't a YYYY-MM-DD date"})
+
+    def get_active_between(self, value: str):
+        """
+        :param value: start and end dates, separated by a comma. Either one may be left out.
+        :return: ids of the CVs having an academic work experience overlapping the dates
+        """
+        start, _, end = value.partition(',')
+        start, end = self.parse_date(start.strip()), self.parse_date(end.strip())
+
+        experiences = AcademicWorkExperience.objects.all()
+        if end is not None:
+            experiences = experiences.filter(start_date__lte=end)
+        if start is not None:
+            experiences = experiences.filter(Q(end_date__gte=start) | Q(end_date__isnull=True))
+        return experiences.values('employment__ccv_id')
+
+    def filter_queryset(self, request, queryset, view):
+        for param, (model, column, path, _) in self.filters.items():
+            values = [value for value in request.query_params.getlist(param) if value]
+            if values:
+                queryset = queryset.filter(id__in=model.objects.filter(**{f'{column}__in': values}).values(path))
+
+        active_between = request.query_params.get(self.active_between_param)
+        if active_between:
+            queryset = queryset.filter(id__in=self.get_active_between(active_between))
+
+        return queryset
+
+    def get_schema_fields(self, view):
+        return [
+            coreapi.Field(name=param, required=False, location='query',
+                          schema=coreschema.String(description=description))
+            for param, (_, _, _, description) in self.filters.items()
+        ] + [
+            coreapi.Field(name=self.active_between_param, required=False, location='query',
+                          schema=coreschema.String(description="Start and end dates (YYYY-MM-DD) separated by a "
+                                                               "comma, either one may be left out: CVs with an "
+                                                               "academic work experience overlapping them"))
+        ]
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Keeps the CVs whose search document matches the q query parameter, the most relevant first. No CV matches an
+    empty query.
+    """
+
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, '').strip()
+        if not text:
+            return queryset.none()
+        return search.search(queryset, text)
+
+    def get_schema_fields(self, view):
+        return [
+            coreapi.Field(name=self.search_param, required=True, location='query',
+                          schema=coreschema.String(description="Words to search, all of them have to match"))
+        ]
@@ -0,0 +1,46 @@
+from itertools import islice
+
+from django.db import connections
+from django.db.models import prefetch_related_objects
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+def iter_chunks(queryset, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Reads a queryset in chunks. On PostgreSQL the rows are fetched from a named (server side) cursor, `chunk_size` at
+    a time, and the prefetch_related lookups of the queryset are run for each chunk, so that walking a whole table
+    keeps a single chunk and its related rows in memory, whatever the number of rows.
+    Outside of a transaction the cursor is declared WITH HOLD: PostgreSQL keeps the remaining rows on the server, and
+    the chunks are read from the snapshot of the first one.
+    Behind a pooler in transaction mode, which disables server side cursors, the ids of the rows are read first and
+    each chunk is then queried by id, so only the ids are kept in memory.
+    :param queryset: queryset of instances or of values, in the order of the chunks
+    :param chunk_size: number of rows per chunk
+    :return: generator of lists of at most chunk_size rows
+    """
+    lookups = queryset._prefetch_related_lookups
+    queryset = queryset.prefetch_related(None)
+    if connections[queryset.db].settings_dict.get('DISABLE_SERVER_SIDE_CURSORS'):
+        rows = iter_rows_by_id(queryset, chunk_size)
+    else:
+        rows = queryset.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+
+        prefetch_related_objects(chunk, *lookups)
+        yield chunk
+
+
+def iter_rows_by_id(queryset, chunk_size: int):
+    """
+    :param queryset: queryset of instances or of values
+    :param chunk_size: number of rows queried at once
+    :return: generator of the rows of the queryset, in its order
+    """
+    ids = list(queryset.values_list('pk', flat=True))
+    for start in range(0, len(ids), chunk_size):
+        # The chunk is a slice of the ordered ids, the queryset sorts it back in the same order
+        yield from queryset.filter(pk__in=ids[start:start + chunk_size])
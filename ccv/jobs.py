@@ -0,0 +1,93 @@
+import datetime
+from io import BytesIO, StringIO
+
+from django.conf import settings
+from django.core import management
+from django.db import transaction
+from django.utils import timezone
+
+from .models.ingestion import IngestionJob
+
+
+def enqueue(document: bytes, name: str = '', update: bool = False) -> IngestionJob:
+    """
+    :param document: CCV xml file, gzip compressed or zip archive, see ccv.sources
+    :param name: name of the uploaded file
+    :param update: ingest it with parse_ccv --update
+    :return: the queued job
+    """
+    return IngestionJob.objects.create(document=document, name=name[:255], update=update)
+
+
+def requeue_stale_jobs() -> int:
+    """
+    Queues the jobs again which have been running for longer than CCV_INGEST_JOB_TIMEOUT, left behind by a worker
+    which died. Ingesting a CV twice is harmless: the second ingestion of a submission is skipped. A job which already
+    ran CCV_INGEST_MAX_ATTEMPTS times, whose document likely kills the worker, fails instead
+    :return: number of jobs queued again
+    """
+    now = timezone.now()
+    started_before = now - datetime.timedelta(seconds=settings.CCV_INGEST_JOB_TIMEOUT)
+    stale = IngestionJob.objects.filter(status=IngestionJob.RUNNING, started_at__lt=started_before)
+    stale.filter(attempts__gte=settings.CCV_INGEST_MAX_ATTEMPTS).update(
+        status=IngestionJob.FAILED, finished_at=now, updated_at=now,
+        error=f"The worker stopped while ingesting it, {settings.CCV_INGEST_MAX_ATTEMPTS} times")
+    return stale.update(status=IngestionJob.QUEUED, updated_at=now)
+
+
+def claim_job():
+    """
+    Marks the oldest queued job as running. Concurrent workers skip the rows locked by each other instead of waiting
+    for them, so that each job is claimed by a single worker
+    :return: the claimed IngestionJob, without its document, or None when no job is queued
+    """
+    with transaction.atomic():
+        job = IngestionJob.objects.select_for_update(skip_locked=True).defer('document') \
+            .filter(status=IngestionJob.QUEUED).order_by('created_at').first()
+        if job is None:
+            return None
+
+        job.status = IngestionJob.RUNNING
+        job.started_at = timezone.now()
+        job.attempts += 1
+        job.save(update_fields=['status', 'started_at', 'attempts', 'updated_at'])
+
+    return job
+
+
+def run_job(job: IngestionJob) -> None:
+    """
+    Ingests the document of a claimed job with parse_ccv --bulk, each CV in its own transaction, then records the
+    outcome. The document is removed once it is ingested, and kept when it fails
+    :param job:
+    :return:
+    """
+    document = IngestionJob.objects.values_list('document', flat=True).get(pk=job.pk)
+    output, messages = StringIO(), StringIO()
+    try:
+        management.call_command('parse_ccv', '-', stdin=BytesIO(document), bulk=True, update=job.update,
+                                stdout=output, stderr=messages)
+    except Exception as e:
+        job.status = IngestionJob.FAILED
+        job.error = str(e) or type(e).__name__
+    else:
+        job.status = IngestionJob.DONE
+        job.document = None
+
+    # The ids of the CVs of an archive which were ingested before one failed are kept as well
+    job.ccv_ids = [int(line) for line in output.getvalue().split()]
+    job.messages = messages.getvalue()
+    job.finished_at = timezone.now()
+    fields = ['status', 'error', 'ccv_ids', 'messages', 'finished_at', 'updated_at']
+    job.save(update_fields=fields + (['document'] if job.status == IngestionJob.DONE else []))
+
+
+def run_next_job() -> bool:
+    """
+    :return: whether a job was run
+    """
+    job = claim_job()
+    if job is None:
+        return False
+    run_job(job)
+    return True
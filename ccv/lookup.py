@@ -0,0 +1,77 @@
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+from ccv.models.base import Organization
+
+ORGANIZATION_FIELDS = ('name', 'type', 'country', 'subdivision')
+
+
+class OrganizationLookup:
+    """
+    Hands out one Organization instance per distinct (name, type, country, subdivision) during an ingestion.
+    Organizations which aren't known yet are fetched or created with one bulk get-or-create per batch.
+    """
+
+    batch_size = 500
+
+    def __init__(self, using: str = 'default'):
+        self.using = using
+        self.known = {}
+        self.pending = {}
+
+    @staticmethod
+    def get_key(values: dict) -> tuple:
+        """
+        :param values: organization field values, missing values being None or ''
+        :return:
+        """
+        return tuple(values.get(field) or '' for field in ORGANIZATION_FIELDS)
+
+    def get(self, **values) -> Organization:
+        """
+        :param values: name, type, country and subdivision
+        :return: the shared instance of the organization, without a primary key until resolve() is called if the
+        organization isn't known yet
+        """
+        key = self.get_key(values)
+        organization = self.known.get(key) or self.pending.get(key)
+        if organization is None:
+            organization = self.pending[key] = Organization(**dict(zip(ORGANIZATION_FIELDS, key)))
+        return organization
+
+    def fetch(self, organizations: dict) -> None:
+        """
+        Sets the primary key of the given organizations which are already stored
+        :param organizations: Organization instances by key
+        :return:
+        """
+        query = reduce(or_, (Q(**dict(zip(ORGANIZATION_FIELDS, key))) for key in organizations))
+        for stored in Organization.objects.using(self.using).filter(query):
+            organization = organizations[self.get_key(stored.__dict__)]
+            organization.pk = stored.pk
+            organization._state.adding = False
+            organization._state.db = self.using
+
+    def resolve(self) -> None:
+        """
+        Gets or creates the pending organizations
+        :return:
+        """
+        # Sorted so that concurrent ingestions lock the unique keys they insert in the same order
+        pending = sorted(self.pending.items())
+        self.pending = {}
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = dict(pending[start:start + self.batch_size])
+            self.fetch(batch)
+
+            missing = {key: organization for key, organization in batch.items() if organization.pk is None}
+            if missing:
+                # Another ingestion may create the same organizations concurrently: conflicting rows are skipped and
+                # fetched afterwards
+                Organization.objects.using(self.using).bulk_create(missing.values(), ignore_conflicts=True)
+                self.fetch(missing)
+
+            self.known.update(batch)
@@ -0,0 +1,122 @@
+import functools
+import glob
+import multiprocessing
+import os
+import time
+from io import StringIO
+
+import django
+from django.core import management
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+def init_worker() -> None:
+    """
+    Sets Django up in a pool worker. Forked workers already have it set up, spawned ones start from scratch.
+    :return:
+    """
+    django.setup()
+
+
+def ingest_file(file_path: str, options: dict) -> tuple:
+    """
+    Ingests one CCV with parse_ccv. Runs in a pool worker, which opens its own database connection on first use.
+    :param file_path:
+    :param options: bulk, async_commit and update options passed to parse_ccv
+    :return: file path, ids of the ingested ccvs separated by commas (several for an archive) or None, error message
+        or None, elapsed seconds
+    """
+    start = time.perf_counter()
+    output = StringIO()
+    try:
+        management.call_command('parse_ccv', file_path, stdout=output, stderr=StringIO(), **options)
+    except Exception as e:
+        return file_path, None, str(e) or type(e).__name__, time.perf_counter() - start
+
+    return file_path, ','.join(output.getvalue().split()), None, time.perf_counter() - start
+
+
+class Command(BaseCommand):
+    help = 'Ingests many CCV files with a pool of worker processes, each one using its own database connection. ' \
+           'Every file is ingested in its own transaction.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('sources', type=str, nargs='*',
+                            help="CCV files, directories or glob patterns (quote them to keep the shell from "
+                                 "expanding them)")
+        parser.add_argument('--manifest', type=str, help="File listing one CCV file path per line")
+        parser.add_argument('--pattern', type=str, default='*.xml',
+                            help="Pattern of the files to ingest in the given directories")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+        parser.add_argument('--bulk', action='store_true', help="Passed on to parse_ccv")
+        parser.add_argument('--async-commit', action='store_true', help="Passed on to parse_ccv")
+        parser.add_argument('--update', action='store_true', help="Passed on to parse_ccv")
+
+    def collect_paths(self, sources: list, manifest: str, pattern: str) -> list:
+        """
+        Expands the directories, glob patterns and manifest into the list of files to ingest
+        :param sources:
+        :param manifest:
+        :param pattern:
+        :return: file paths without duplicates, in the order they were given
+        """
+        if manifest:
+            try:
+                with open(manifest, encoding="utf8") as manifest_file:
+                    sources = sources + [
+                        line.strip() for line in manifest_file if line.strip() and not line.startswith('#')
+                    ]
+            except (FileNotFoundError, IsADirectoryError):
+                raise CommandError(f"Manifest {manifest} doesn't exist")
+
+        paths = []
+        for source in sources:
+            if os.path.isdir(source):
+                paths += sorted(glob.glob(os.path.join(source, pattern)))
+            elif any(c in source for c in '*?['):
+                paths += sorted(glob.glob(source, recursive=True))
+            else:
+                paths.append(source)
+
+        return list(dict.fromkeys(paths))
+
+    def iter_results(self, paths: list, workers: int, options: dict):
+        """
+        :param paths:
+        :param workers:
+        :param options:
+        :return: generator of the results of ingest_file, in completion order
+        """
+        if workers == 1:
+            for file_path in paths:
+                yield ingest_file(file_path, options)
+            return
+
+        # Forked workers would otherwise share the socket of the parent's connection
+        connections.close_all()
+        with multiprocessing.Pool(workers, initializer=init_worker) as pool:
+            yield from pool.imap_unordered(functools.partial(ingest_file, options=options), paths)
+
+    def handle(self, *args, **options):
+        paths = self.collect_paths(options['sources'], options.get('manifest'), options['pattern'])
+        if not paths:
+            raise CommandError("No CCV file to ingest")
+
+        workers = max(1, min(options['workers'], len(paths)))
+        parse_options = {option: options[option] for option in ('bulk', 'async_commit', 'update')}
+
+        start = time.perf_counter()
+        failed = 0
+        for file_path, ccv_id, error, elapsed in self.iter_results(paths, workers, parse_options):
+            if error is None:
+                self.stdout.write(f"OK      {file_path} {ccv_id} {elapsed:.3f}s")
+            else:
+                failed += 1
+                self.stdout.write(f"FAILED  {file_path} {elapsed:.3f}s {error}")
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(f"{len(paths) - failed} ingested, {failed} failed in {elapsed:.3f}s with {workers} "
+                          f"worker(s), {len(paths) / elapsed:.1f} files/s")
+        if failed:
+            raise CommandError(f"{failed} of {len(paths)} CCV files failed to ingest")
@@ -0,0 +1,108 @@
+import glob
+import json
+import platform
+import subprocess
+import tempfile
+import time
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from ccv.benchmark import ApiBenchmark, benchmark_file, ingest, replicate, rolled_back
+from ccv.models.base import CanadianCommonCv
+
+
+class Command(BaseCommand):
+    help = 'Measures parsing, ingestion and serialization of CCV files, then ingestion and the latency and SQL ' \
+           'statements of the API on corpora replicating them, and writes the results as JSON. Nothing is kept in ' \
+           'the database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ccv_xml_filepaths', type=str, nargs='*', default=sorted(glob.glob('sample_ccv/*.xml')))
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100],
+                            help="Numbers of CVs of the corpora the API is measured on")
+        parser.add_argument('--page-sizes', type=int, nargs='+',
+                            help="Page sizes of the /ccv requests, PAGE_SIZE and CCV_MAX_PAGE_SIZE by default")
+        parser.add_argument('--repeat', type=int, default=3, help="Number of runs of each measure")
+        parser.add_argument('--bulk', action='store_true', help="Ingest the corpora with parse_ccv --bulk")
+        parser.add_argument('--output', type=str, help="File the results are written to, stdout by default")
+
+    def get_environment(self, options: dict) -> dict:
+        """
+        :param options:
+        :return: what the results depend on besides the code
+        """
+        try:
+            revision = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True,
+                                      text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            revision = None
+
+        return {
+            'date': timezone.now().isoformat(),
+            'revision': revision,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'database_version': getattr(connection, 'pg_version', None),
+            'cache': settings.CACHES[settings.CCV_CACHE]['BACKEND'],
+            'repeat': options['repeat'],
+            'bulk': options['bulk'],
+        }
+
+    def benchmark_corpora(self, file_paths: list, sizes: list, page_sizes: list, options: dict) -> list:
+        """
+        Ingests copies of the files until the corpus reaches each size, then requests /ccv and /ccv/<id>
+        :return: measures of each corpus
+        """
+        api = ApiBenchmark(options['repeat'])
+        ccv_ids = []
+        results = []
+
+        with tempfile.TemporaryDirectory() as directory:
+            for size in sorted(set(sizes)):
+                copies = replicate(file_paths, size - len(ccv_ids), directory, start=len(ccv_ids))
+                start = time.perf_counter()
+                ccv_ids += [ingest(copy, options['bulk']) for copy in copies]
+                elapsed = time.perf_counter() - start
+                self.stderr.write(f"Corpus of {size} CVs ingested in {elapsed:.3f}s")
+
+                results.append({
+                    'ccvs': size,
+                    'ccvs_in_database': CanadianCommonCv.objects.count(),
+                    'ingest': {'ccvs': len(copies), 'seconds': elapsed, 'per_ccv': elapsed / max(len(copies), 1)},
+                    'list': {
+                        str(page_size): api.measure('/ccv', {'page_size': page_size}, ccv_ids)
+                        for page_size in page_sizes
+                    },
+                    'detail': api.measure(f'/ccv/{ccv_ids[-1]}', {}, ccv_ids[-1:]),
+                })
+
+        api.evict(ccv_ids)
+        return results
+
+    def handle(self, *args, **options):
+        file_paths = options['ccv_xml_filepaths']
+        if not file_paths:
+            raise CommandError("No CCV file to benchmark")
+        if min(options['sizes']) < 1:
+            raise CommandError("Corpus sizes must be positive")
+        page_sizes = options['page_sizes'] or sorted({settings.REST_FRAMEWORK['PAGE_SIZE'], settings.CCV_MAX_PAGE_SIZE})
+
+        results = {'environment': self.get_environment(options), 'files': [], 'corpora': []}
+        for file_path in file_paths:
+            self.stderr.write(f"Benchmarking {file_path}")
+            results['files'].append(benchmark_file(file_path, options['repeat']))
+
+        def benchmark_corpora():
+            results['corpora'] = self.benchmark_corpora(file_paths, options['sizes'], page_sizes, options)
+        rolled_back(benchmark_corpora)()
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf8') as output:
+                json.dump(results, output, indent=2)
+        else:
+            self.stdout.write(json.dumps(results, indent=2))
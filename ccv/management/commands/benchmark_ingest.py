@@ -0,0 +1,30 @@
+import glob
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ccv.benchmark import ingest, measure, replicate, rolled_back
+
+
+class Command(BaseCommand):
+    help = 'Compares the statement count and wall time of row by row and bulk ingestion of CCV files. ' \
+           'Nothing is kept in the database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ccv_xml_filepaths', type=str, nargs='*', default=sorted(glob.glob('sample_ccv/*.xml')))
+        parser.add_argument('--repeat', type=int, default=3, help="Number of runs per file and mode")
+
+    def handle(self, *args, **options):
+        if not options['ccv_xml_filepaths']:
+            raise CommandError("No CCV file to benchmark")
+
+        self.stdout.write(f"{'file':<40} {'mode':<6} {'statements':>10} {'best (s)':>10}")
+        for file_path in options['ccv_xml_filepaths']:
+            with tempfile.TemporaryDirectory() as directory:
+                # A copy is ingested even if the file was already ingested in the database. Each run is rolled back,
+                # so that the copy is ingested again
+                copy_path, = replicate([file_path], 1, directory)
+                for mode, bulk in (('row', False), ('bulk', True)):
+                    result = measure(rolled_back(lambda: ingest(copy_path, bulk)), options['repeat'])
+                    self.stdout.write(f"{file_path:<40} {mode:<6} {result['statements']:>10} "
+                                      f"{result['seconds']:>10.3f}")
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from ccv.export import iter_ndjson
+from ccv.iteration import DEFAULT_CHUNK_SIZE
+from ccv.models.base import CanadianCommonCv
+from ccv.serializers import get_selection
+
+
+class Command(BaseCommand):
+    help = 'Exports every CV as newline delimited JSON, one document per line, in the representation of the /ccv ' \
+           'endpoint. CVs are read in chunks, memory use does not grow with the number of CVs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', type=str, help="File to write, the standard output by default")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help="Number of CVs loaded at once")
+        parser.add_argument('--fields', type=str, help="Fields to export, as the fields query parameter of the API")
+        parser.add_argument('--expand', type=str, help="Nested objects to export in full, as the expand query "
+                                                       "parameter of the API")
+
+    def handle(self, *args, **options):
+        lines = iter_ndjson(CanadianCommonCv.objects.all(), get_selection(options.get('fields'), options.get('expand')),
+                            max(options['chunk_size'], 1))
+
+        if not options.get('output'):
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+
+        count = 0
+        with open(options['output'], 'w', encoding='utf8') as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        self.stderr.write(f"{count} CVs exported to {options['output']}")
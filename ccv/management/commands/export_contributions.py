@@ -0,0 +1,158 @@
+import os
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+
+from ccv.iteration import iter_chunks
+from ccv.models.base import CanadianCommonCv, Organization, OtherOrganization
+from ccv.models.contribution import ContributionAbstract
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def get_contribution_models() -> list:
+    """
+    :return: the concrete subclasses of ContributionAbstract, except the parents of multi-table inheritance whose
+    rows are exported with their children
+    """
+    contribution_models = [
+        model for model in apps.get_models() if issubclass(model, ContributionAbstract) and not model._meta.proxy
+    ]
+    parents = {parent for model in contribution_models for parent in model._meta.get_parent_list()}
+    return [model for model in contribution_models if model not in parents]
+
+
+def get_ccv_path(model) -> str:
+    """
+    :param model:
+    :return: path of the foreign keys leading from the model to the id of its CV
+    """
+    paths = [(model, '')]
+    while paths:
+        current, path = paths.pop(0)
+        for field in current._meta.concrete_fields:
+            if not field.many_to_one and not field.one_to_one or field.remote_field.parent_link:
+                continue
+            if field.related_model is CanadianCommonCv:
+                return f'{path}{field.attname}'
+            if field.related_model not in (Organization, OtherOrganization):
+                paths.append((field.related_model, f'{path}{field.name}__'))
+
+    raise CommandError(f"{model.__name__} isn't linked to a CV")
+
+
+def get_arrow_type(pa, field):
+    """
+    :param pa: pyarrow module
+    :param field: model field
+    :return: arrow type of the column, string for the types which aren't mapped
+    """
+    if field.is_relation:
+        field = field.target_field
+    if isinstance(field, (models.AutoField, models.IntegerField)):
+        return pa.int64()
+    if isinstance(field, (models.BooleanField, models.NullBooleanField)):
+        return pa.bool_()
+    if isinstance(field, models.DateTimeField):
+        return pa.timestamp('us', tz='UTC')
+    if isinstance(field, models.DateField):
+        return pa.date32()
+    if isinstance(field, (models.FloatField, models.DecimalField)):
+        return pa.float64()
+    return pa.string()
+
+
+def get_converter(pa, arrow_type):
+    """
+    :return: the conversion of the values of a column to the values of its arrow type, None when they already are
+    """
+    if arrow_type == pa.string():
+        return lambda value: None if value is None else str(value)
+    if arrow_type == pa.float64():
+        return lambda value: None if value is None else float(value)
+    return None
+
+
+class Command(BaseCommand):
+    help = 'Exports each contribution model (journal articles, books, presentations, patents...) as a compressed ' \
+           'Parquet file, with the id of the CV of each row, and the organizations they reference. Rows are read ' \
+           'with server side cursors in chunks, which become the row groups of the files. Requires pyarrow.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output_dir', type=str, help="Directory to write the files to, created if needed")
+        parser.add_argument('--models', type=str, nargs='*', help="Names of the models to export, all by default")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help="Number of rows read at once, and written per row group")
+        parser.add_argument('--compression', type=str, default='zstd',
+                            help="Parquet compression codec: zstd, snappy, gzip, brotli, lz4 or none")
+
+    def export(self, pa, pq, queryset, columns: list, file_path: str, chunk_size: int, compression: str) -> int:
+        """
+        Writes the rows of a queryset to a Parquet file
+        :param pa: pyarrow module
+        :param pq: pyarrow.parquet module
+        :param queryset:
+        :param columns: (name, path, field) of each column
+        :param file_path:
+        :param chunk_size:
+        :param compression:
+        :return: number of rows written
+        """
+        schema = pa.schema([(name, get_arrow_type(pa, field)) for name, _, field in columns])
+        converters = [get_converter(pa, arrow_type) for arrow_type in schema.types]
+        rows = queryset.order_by('pk').values_list(*(path for _, path, _ in columns))
+
+        count = 0
+        with pq.ParquetWriter(file_path, schema, compression=compression) as writer:
+            for chunk in iter_chunks(rows, chunk_size):
+                arrays = [
+                    pa.array([row[i] if convert is None else convert(row[i]) for row in chunk], type=arrow_type)
+                    for i, (arrow_type, convert) in enumerate(zip(schema.types, converters))
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                count += len(chunk)
+        return count
+
+    def handle(self, *args, **options):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise CommandError("The columnar export requires pyarrow: pip install -r requirements-export.txt")
+
+        contribution_models = get_contribution_models()
+        if options.get('models'):
+            names = {name.lower() for name in options['models']}
+            contribution_models = [model for model in contribution_models if model._meta.model_name in names]
+            unknown = names - {model._meta.model_name for model in contribution_models}
+            if unknown:
+                raise CommandError(f"Unknown contribution models: {', '.join(sorted(unknown))}")
+
+        os.makedirs(options['output_dir'], exist_ok=True)
+        chunk_size = max(options['chunk_size'], 1)
+        compression = None if options['compression'] == 'none' else options['compression']
+
+        # Every file is read from the same snapshot of the database
+        outermost = not connection.in_atomic_block
+        with transaction.atomic():
+            if connection.vendor == 'postgresql' and outermost:
+                with connection.cursor() as cursor:
+                    cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+
+            exports = [(Organization, [
+                (field.attname, field.attname, field) for field in Organization._meta.concrete_fields
+            ])]
+            for model in contribution_models:
+                ccv_path = get_ccv_path(model)
+                exports.append((model, [('ccv_id', ccv_path, CanadianCommonCv._meta.pk)] + [
+                    (field.attname, field.attname, field) for field in model._meta.concrete_fields
+                    if not (field.remote_field and field.remote_field.parent_link)
+                ]))
+
+            for model, columns in exports:
+                start = time.perf_counter()
+                file_path = os.path.join(options['output_dir'], f'{model._meta.model_name}.parquet')
+                count = self.export(pa, pq, model.objects.all(), columns, file_path, chunk_size, compression)
+                self.stdout.write(f"{model._meta.model_name:<32} {count:>10} rows {time.perf_counter() - start:.3f}s")
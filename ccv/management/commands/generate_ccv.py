@@ -0,0 +1,62 @@
+import glob
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ccv.synthetic import CcvGenerator, observe
+
+
+def parse_count(value: str) -> tuple:
+    """
+    :param value: LABEL=COUNT
+    :return: (label, count)
+    """
+    label, separator, count = value.rpartition('=')
+    if not separator or not label or not count.isdigit():
+        raise CommandError(f"Invalid count {value}, expected LABEL=COUNT, e.g. 'Journal Articles=50'")
+    return label, int(count)
+
+
+class Command(BaseCommand):
+    help = 'Generates synthetic CCV xml files shaped like the sample CVs, for load and scale testing. The same seed ' \
+           'always generates the same files.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output_directory', type=str)
+        parser.add_argument('--count', type=int, default=100, help="Number of CVs to generate")
+        parser.add_argument('--start', type=int, default=0,
+                            help="Index of the first CV, to generate a corpus in several parts")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--set', type=str, action='append', default=[], metavar='LABEL=COUNT', dest='counts',
+                            help="Number of records of the sections of a label per record of their parent, instead "
+                                 "of the average of the samples, e.g. --set 'Journal Articles=50' --set Degrees=3")
+        parser.add_argument('--samples', type=str, nargs='+', default=sorted(glob.glob('sample_ccv/*.xml')),
+                            help="CCV files the structure and values of the generated CVs are taken from")
+
+    def handle(self, *args, **options):
+        counts = dict(parse_count(value) for value in options['counts'])
+        if not options['samples']:
+            raise CommandError("No sample CCV file to generate CVs from")
+
+        template = observe(options['samples'])
+        unknown = set(counts) - self.get_labels(template)
+        if unknown:
+            raise CommandError(f"No section of the samples is labelled {', '.join(sorted(unknown))}")
+
+        os.makedirs(options['output_directory'], exist_ok=True)
+        generator = CcvGenerator(template, options['seed'], counts)
+        for index in range(options['start'], options['start'] + options['count']):
+            generator.write(index, os.path.join(options['output_directory'],
+                                                f"synthetic-{options['seed']}-{index:06d}.xml"))
+
+        self.stdout.write(f"{options['count']} CVs written to {options['output_directory']}")
+
+    def get_labels(self, template) -> set:
+        """
+        :param template: ccv.synthetic.SectionTemplate
+        :return: labels of the section and of all its subsections
+        """
+        labels = set()
+        for label, section in template.sections.items():
+            labels |= {label} | self.get_labels(section)
+        return labels
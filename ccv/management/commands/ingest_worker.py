@@ -0,0 +1,112 @@
+import multiprocessing
+import os
+import signal
+import time
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from ccv.db import refresh_connections
+from ccv.jobs import requeue_stale_jobs, run_next_job
+
+
+class Worker:
+    """
+    Runs the queued ingestion jobs one after the other, polling the queue when it is empty. SIGTERM and SIGINT stop it
+    once the current job is done.
+    """
+
+    def __init__(self, poll_interval: float = 1.0, burst: bool = False):
+        """
+        :param poll_interval: seconds between two polls of an empty queue
+        :param burst: stop once the queue is empty instead of polling it
+        """
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.stopping = False
+
+    def stop(self, *args) -> None:
+        self.stopping = True
+
+    def run(self) -> int:
+        """
+        :return: number of jobs run
+        """
+        handlers = {signum: signal.signal(signum, self.stop) for signum in (signal.SIGTERM, signal.SIGINT)}
+        count = 0
+        try:
+            while not self.stopping:
+                refresh_connections()
+                if run_next_job():
+                    count += 1
+                    continue
+                if self.burst:
+                    break
+
+                requeue_stale_jobs()
+                # Sleeps in short steps, to stop soon after a signal
+                deadline = time.monotonic() + self.poll_interval
+                while not self.stopping and time.monotonic() < deadline:
+                    time.sleep(min(0.1, self.poll_interval))
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+        return count
+
+
+def run_worker(count, poll_interval: float, burst: bool) -> None:
+    """
+    Runs a Worker in a child process, which opens its own database connection on first use. Forked processes already
+    have Django set up, spawned ones start from scratch
+    :param count: shared multiprocessing.Value the number of jobs run is added to
+    """
+    django.setup()
+    jobs = Worker(poll_interval, burst).run()
+    with count.get_lock():
+        count.value += jobs
+
+
+class Command(BaseCommand):
+    help = 'Ingests the CCV files uploaded to /ccv/ingest. Each worker process runs one job at a time, claimed from ' \
+           'the queue table, so the number of workers bounds the number of concurrent ingestions.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help="Number of worker processes")
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help="Seconds between two polls of the queue when it is empty")
+        parser.add_argument('--burst', action='store_true', help="Stop once the queue is empty")
+
+    def handle(self, *args, **options):
+        requeue_stale_jobs()
+        if options['workers'] <= 1:
+            count = Worker(options['poll_interval'], options['burst']).run()
+            self.stdout.write(f"{count} jobs run")
+            return
+
+        # Forked workers would otherwise share the socket of the parent's connection
+        connections.close_all()
+        count = multiprocessing.Value('i', 0)
+        processes = [
+            multiprocessing.Process(target=run_worker, args=(count, options['poll_interval'], options['burst']))
+            for _ in range(options['workers'])
+        ]
+        for process in processes:
+            process.start()
+
+        def stop(*args):
+            for process in processes:
+                if process.is_alive():
+                    os.kill(process.pid, signal.SIGTERM)
+
+        # The workers finish their current job before stopping, this process waits for them
+        handlers = {signum: signal.signal(signum, stop) for signum in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            for process in processes:
+                process.join()
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write(f"{count.value} jobs run")
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+CONFIG = """\
+; PgBouncer between the API and PostgreSQL, generated by the pgbouncer_config command from the settings, see the README
+[databases]
+{name} = host={server_host} port={server_port} dbname={name}
+
+[pgbouncer]
+listen_addr = {listen_host}
+listen_port = {listen_port}
+auth_type = md5
+auth_file = {auth_file}
+
+; PG_DB_POOL_MODE: in transaction mode, a server connection is only held for the duration of a transaction
+pool_mode = {pool_mode}
+
+; PG_DB_POOL_SIZE server connections per database and user, PG_DB_POOL_MAX_CLIENTS connections of the API
+default_pool_size = {pool_size}
+reserve_pool_size = {reserve_pool_size}
+max_client_conn = {max_clients}
+
+; PG_CONN_MAX_AGE: the API replaces its own dropped connections when PG_CONN_HEALTH_CHECKS is set
+server_idle_timeout = {idle_timeout}
+"""
+
+
+class Command(BaseCommand):
+    help = 'Writes the configuration of a PgBouncer pooling the connections of the API, from the database settings. ' \
+           'It listens on PG_DB_HOST and PG_DB_PORT, and connects to PostgreSQL on PG_DB_SERVER_HOST and ' \
+           'PG_DB_SERVER_PORT.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--auth-file', type=str, default='/etc/pgbouncer/userlist.txt',
+                            help="PgBouncer file of the users and their passwords")
+
+    def handle(self, *args, **options):
+        database = settings.DATABASES['default']
+        self.stdout.write(CONFIG.format(
+            name=database['NAME'],
+            server_host=settings.PG_DB_SERVER_HOST,
+            server_port=settings.PG_DB_SERVER_PORT,
+            listen_host=database['HOST'] or '127.0.0.1',
+            listen_port=database['PORT'] or 6432,
+            auth_file=options['auth_file'],
+            pool_mode=settings.PG_DB_POOL_MODE,
+            pool_size=settings.PG_DB_POOL_SIZE,
+            reserve_pool_size=max(settings.PG_DB_POOL_SIZE // 4, 1),
+            max_clients=settings.PG_DB_POOL_MAX_CLIENTS,
+            idle_timeout=database['CONN_MAX_AGE'] or 600,
+        ), ending='')
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ccv.models.base import CanadianCommonCv
+from ccv.search import update_document
+
+
+class Command(BaseCommand):
+    help = 'Builds the search documents of the CVs again, e.g. for the CVs ingested before the search endpoint ' \
+           'existed or after changing CCV_SEARCH_CONFIG. parse_ccv builds the document of each CV it ingests.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ids', type=int, nargs='*', help="Ids of the CVs, all of them by default")
+
+    def handle(self, *args, **options):
+        ccvs = CanadianCommonCv.objects.order_by('id')
+        if options['ids']:
+            ccvs = ccvs.filter(id__in=options['ids'])
+
+        count = 0
+        for ccv_id in ccvs.values_list('id', flat=True).iterator():
+            # One transaction per CV, so that an interrupted run keeps the documents it built
+            with transaction.atomic():
+                update_document(ccv_id)
+            count += 1
+
+        self.stdout.write(f"{count} search documents updated")
@@ -0,0 +1,32 @@
+# Generated by Django 3.0.7 on 2026-10-17 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0024_auto_20200825_0958'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='canadiancommoncv',
+            options={'ordering': ['-id']},
+        ),
+        migrations.AddField(
+            model_name='canadiancommoncv',
+            name='ccv_identifier',
+            field=models.CharField(blank=True, help_text='Identifier of the CV in the CCV system, the same for every submission', max_length=50, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='canadiancommoncv',
+            name='confirmation_number',
+            field=models.CharField(blank=True, help_text='Confirmation number of the submission', max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='canadiancommoncv',
+            name='date_time_generated',
+            field=models.DateTimeField(blank=True, help_text='Date and time the xml export was generated', null=True),
+        ),
+    ]
@@ -0,0 +1,563 @@
+# Generated by Django 3.0.7 on 2026-10-17 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0025_canadiancommoncv_submission'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='academicworkexperience',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='activity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='address',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='administrativeactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='advisoryactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='affiliation',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='areaofresearch',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='artisticcontribution',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='artisticexhibition',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='assessmentandreviewactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='audiorecording',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='bookreview',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='broadcast',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='broadcastinterview',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='canadiancommoncv',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='choreography',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='clinicalcareguideline',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='codeveloper',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='coinstructor',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='committeemembership',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='communityandvolunteeractivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='conferencereviewactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='contribution',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='contributionfundingsource',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='countryofcitizenship',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='coursedevelopment',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='coursetaught',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='credential',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='degree',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='dictionaryentry',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='disciplinetrainedin',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='disclosure',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='email',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='employment',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='eventactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='exhibitioncatalogue',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='fiction',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='fieldofapplication',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='fundingbyyear',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='fundingsource',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='geographicalregion',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='graduationexaminationactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='identification',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='intellectualproperty',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='internationalcollaborationactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='journal',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='journalreviewactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='knowledgetranslation',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='languageskill',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='leavesofabsence',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='license',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='lightdesign',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='litigation',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='majorperformancedate',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='membership',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='mostsignificantcontribution',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='museumexhibition',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='musicalcompilation',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='musicalperformance',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='nonacademicworkexperience',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='organization',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='organizationalreviewactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='otherartisticcontribution',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='otherinvestigator',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='othermembership',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='otherorganization',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='participationactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='patent',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='performanceart',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='performancedate',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='poetry',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='presentation',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='programdevelopment',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='promotiontenureassessmentactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='publication',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='publicationstaticabstract',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='radioandtvprogram',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='recognition',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='registeredcopyright',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='report',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchcentre',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchdiscipline',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchfundingapplicationassessmentactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchfundinghistory',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchsetting',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchspecializationkeyword',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='researchuptakeholder',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='scripts',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='setdesign',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='sounddesign',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='studentcountryofcitizenship',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='studentrecognition',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='studentsupervision',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='supervisor',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='supervisoryactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='teachingactivity',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='technologicalapplication',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='telephone',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='temporalperiod',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='test',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='textinterview',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='theatreperformanceandproduction',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='thesisdissertation',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='trademark',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='videorecording',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='visualartwork',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='website',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+        migrations.AddField(
+            model_name='workingpaper',
+            name='record_id',
+            field=models.CharField(blank=True, editable=False, help_text='recordId of the CCV section the row was ingested from', max_length=40, null=True),
+        ),
+    ]
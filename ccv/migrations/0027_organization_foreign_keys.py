@@ -0,0 +1,99 @@
+# Generated by Django 3.0.7 on 2026-10-17 19:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0026_record_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='academicworkexperience',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='affiliation',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The organization with which the person is affiliated.', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='committeemembership',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The name of the organisation of which the person is a member', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='communityandvolunteeractivity',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The name of the organization for which the service was undertaken', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='coursetaught',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The organization where the course was taught ', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='credential',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The organization that conferred this credential', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='degree',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The institution that conferred the degree.', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='graduationexaminationactivity',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The institution for which the examination was conducted.', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='leavesofabsence',
+            name='organization',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='nonacademicworkexperience',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The name of the organization where the person worked', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='organizationalreviewactivity',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The organization for which the assessment was made', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='othermembership',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The name of the organisation of which the person is a member', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='promotiontenureassessmentactivity',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The organization for which the assessment was made', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='recognition',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The organization that gave the recognition', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The name of the institution that consigned the report', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='researchfundingapplicationassessmentactivity',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The organization for which the assessment was made', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+        migrations.AlterField(
+            model_name='thesisdissertation',
+            name='organization',
+            field=models.ForeignKey(blank=True, help_text='The name of the institution that consigned the report', null=True, on_delete=django.db.models.deletion.PROTECT, to='ccv.Organization'),
+        ),
+    ]
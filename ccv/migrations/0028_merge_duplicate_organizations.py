@@ -0,0 +1,46 @@
+from django.db import migrations
+
+ORGANIZATION_FIELDS = ('name', 'type', 'country', 'subdivision')
+
+
+def merge_duplicate_organizations(apps, schema_editor):
+    """
+    Points every reference to an organization at the oldest row with the same values, then deletes the other rows
+    """
+    Organization = apps.get_model('ccv', 'Organization')
+    for field in ORGANIZATION_FIELDS:
+        Organization.objects.filter(**{f"{field}__isnull": True}).update(**{field: ''})
+
+    quote = schema_editor.quote_name
+    organizations = quote(Organization._meta.db_table)
+    duplicates = f"""
+        SELECT id, MIN(id) OVER (PARTITION BY {', '.join(quote(field) for field in ORGANIZATION_FIELDS)}) AS kept_id
+        FROM {organizations}
+    """
+
+    with schema_editor.connection.cursor() as cursor:
+        for model in apps.get_app_config('ccv').get_models():
+            for field in model._meta.local_fields:
+                if field.is_relation and field.related_model is Organization:
+                    table, column = quote(model._meta.db_table), quote(field.column)
+                    cursor.execute(f"""
+                        UPDATE {table} SET {column} = duplicates.kept_id
+                        FROM ({duplicates}) duplicates
+                        WHERE {table}.{column} = duplicates.id AND duplicates.id <> duplicates.kept_id
+                    """)
+
+        cursor.execute(f"""
+            DELETE FROM {organizations} USING ({duplicates}) duplicates
+            WHERE {organizations}.id = duplicates.id AND duplicates.id <> duplicates.kept_id
+        """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0027_organization_foreign_keys'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_organizations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.0.7 on 2026-10-17 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0028_merge_duplicate_organizations'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organization',
+            name='country',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='name',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='subdivision',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='type',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddConstraint(
+            model_name='organization',
+            constraint=models.UniqueConstraint(fields=('name', 'type', 'country', 'subdivision'), name='unique_organization'),
+        ),
+    ]
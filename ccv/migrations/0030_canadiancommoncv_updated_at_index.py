@@ -0,0 +1,17 @@
+# Generated by Django 3.0.7 on 2026-10-17 19:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0029_unique_organization'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='canadiancommoncv',
+            index=models.Index(fields=['updated_at'], name='ccv_updated_at_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.0.7 on 2026-10-17 19:21
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0030_canadiancommoncv_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('document', django.contrib.postgres.search.SearchVectorField(help_text='Weighted lexemes of the names, research interests and publications')),
+                ('ccv', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='ccv.CanadianCommonCv')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['document'], name='ccv_search_document_idx'),
+        ),
+    ]
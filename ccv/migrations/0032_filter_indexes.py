@@ -0,0 +1,37 @@
+# Generated by Django 3.0.7 on 2026-10-17 19:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0031_search_document'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academicworkexperience',
+            index=models.Index(fields=['organization', 'employment'], name='awe_organization_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='academicworkexperience',
+            index=models.Index(fields=['start_date', 'end_date', 'employment'], name='awe_dates_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='areaofresearch',
+            index=models.Index(fields=['area', 'user_profile'], name='aor_area_user_profile_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='areaofresearch',
+            index=models.Index(fields=['sector', 'user_profile'], name='aor_sector_user_profile_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='degree',
+            index=models.Index(fields=['type', 'education'], name='degree_type_education_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='researchdiscipline',
+            index=models.Index(fields=['discipline', 'user_profile'], name='discipline_user_profile_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.0.7 on 2026-10-17 20:03
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ccv', '0032_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngestionJob',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(blank=True, default='', help_text='Name of the uploaded file', max_length=255)),
+                ('document', models.BinaryField(help_text='Uploaded file, removed once it is ingested', null=True)),
+                ('update', models.BooleanField(default=False, help_text='Ingest it with parse_ccv --update')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('ccv_ids', django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, help_text='Ids of the CVs ingested from the file, several for an archive', size=None)),
+                ('messages', models.TextField(blank=True, default='', help_text='Warnings of the ingestion')),
+                ('error', models.TextField(blank=True, default='')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='ingestionjob',
+            index=models.Index(fields=['status', 'created_at'], name='ingestion_job_status_idx'),
+        ),
+    ]
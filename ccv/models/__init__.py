@@ -1,3 +1,4 @@
 from ccv.models import (
-    base, personal_information, education, activity, contribution, employment, user_profile, recognitions
+    base, personal_information, education, activity, contribution, employment, user_profile, recognitions, search,
+    ingestion
 )
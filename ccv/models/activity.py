@@ -82,8 +82,8 @@ class CourseTaught(ActivityAbstract):
     guest_lecture = models.CharField(max_length=5, null=True, blank=True, choices=BOOLEAN_CHOICES,
                                      help_text="Indicate whether you were a guest lecturer for this course")
 
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The organization where the course was taught ")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The organization where the course was taught ")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
     teaching_activity = models.ForeignKey(TeachingActivity, on_delete=models.CASCADE)
 
@@ -295,8 +295,8 @@ class GraduationExaminationActivity(ActivityAbstract):
                                   help_text="The department within the given institution")
     student_name = models.CharField(max_length=100, null=True, blank=True,
                                     help_text="The family and first name of the student")
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The institution for which the examination was conducted.")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The institution for which the examination was conducted.")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
 
     assessment_review_activity = models.ForeignKey(AssessmentAndReviewActivity, on_delete=models.CASCADE)
@@ -338,8 +338,8 @@ class ResearchFundingApplicationAssessmentActivity(ActivityAbstract):
                                                       "scholarship")
     applications_assessed_count = models.IntegerField(null=True, blank=True,
                                                       help_text="The number of applications that the person assessed")
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The organization for which the assessment was made")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The organization for which the assessment was made")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
 
     assessment_review_activity = models.ForeignKey(AssessmentAndReviewActivity, on_delete=models.CASCADE)
@@ -361,8 +361,8 @@ class PromotionTenureAssessmentActivity(ActivityAbstract):
                                              "with the consideration of an application for promotion/tenure, "
                                              "to examine something, formulate a judgement, and a statement of that "
                                              "judgement.")
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The organization for which the assessment was made")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The organization for which the assessment was made")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
 
     assessment_review_activity = models.ForeignKey(AssessmentAndReviewActivity, on_delete=models.CASCADE)
@@ -379,8 +379,8 @@ class OrganizationalReviewActivity(ActivityAbstract):
                                              "with the consideration of an application for promotion/tenure, "
                                              "to examine something, formulate a judgement, and a statement of that "
                                              "judgement.")
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The organization for which the assessment was made")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The organization for which the assessment was made")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
 
     assessment_review_activity = models.ForeignKey(AssessmentAndReviewActivity, on_delete=models.CASCADE)
@@ -425,8 +425,8 @@ class CommunityAndVolunteerActivity(ActivityAbstract):
     description = models.CharField(max_length=1000, null=True, blank=True,
                                    help_text="Description of the unpaid services")
 
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The name of the organization for which the service was undertaken")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The name of the organization for which the service was undertaken")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
     participation_activity = models.ForeignKey(ParticipationActivity, on_delete=models.CASCADE)
 
@@ -7,8 +7,14 @@ class Base(models.Model):
     """Abstract class """
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
     updated_at = models.DateTimeField(auto_now=True)
+    record_id = models.CharField(max_length=40, null=True, blank=True, editable=False,
+                                 help_text="recordId of the CCV section the row was ingested from")
+
+    def normalize_fields(self):
+        """Hook to clean up field values before the row is written. It also runs for rows written with bulk_create"""
 
     def save(self, *args, **kwargs):
+        self.normalize_fields()
         super().save(*args, **kwargs)
 
     class Meta:
@@ -16,10 +22,22 @@ class Base(models.Model):
 
 
 class Organization(Base):
-    name = models.CharField(max_length=DEFAULT_COLUMN_LENGTH, null=True, blank=True)
-    type = models.CharField(max_length=50, null=True, blank=True)
-    country = models.CharField(max_length=50, null=True, blank=True)
-    subdivision = models.CharField(max_length=50, null=True, blank=True)
+    """Lookup table shared by all the rows referencing an organization. Missing values are stored as ''"""
+
+    name = models.CharField(max_length=DEFAULT_COLUMN_LENGTH, blank=True, default='')
+    type = models.CharField(max_length=50, blank=True, default='')
+    country = models.CharField(max_length=50, blank=True, default='')
+    subdivision = models.CharField(max_length=50, blank=True, default='')
+
+    def normalize_fields(self):
+        for field in ('name', 'type', 'country', 'subdivision'):
+            if getattr(self, field) is None:
+                setattr(self, field, '')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'type', 'country', 'subdivision'], name='unique_organization'),
+        ]
 
 
 class OtherOrganization(Base):
@@ -34,6 +52,16 @@ class CanadianCommonCv(Base):
 
     _id = models.UUIDField(max_length=40, db_index=True, editable=False, default=uuid.uuid4)
     slug = models.SlugField(help_text="Short label to be used in URL")
+    ccv_identifier = models.CharField(max_length=50, unique=True, null=True, blank=True,
+                                      help_text="Identifier of the CV in the CCV system, the same for every submission")
+    confirmation_number = models.CharField(max_length=50, null=True, blank=True,
+                                           help_text="Confirmation number of the submission")
+    date_time_generated = models.DateTimeField(null=True, blank=True,
+                                               help_text="Date and time the xml export was generated")
 
     class Meta:
         ordering = ["-id"]
+        indexes = [
+            # Latest change of the CVs, the validator of the list endpoint
+            models.Index(fields=['updated_at'], name='ccv_updated_at_idx'),
+        ]
@@ -307,8 +307,8 @@ class ThesisDissertation(PublicationAbstract):
                                    help_text="The designation of the person's degree")
     pages_count = models.IntegerField(null=True, blank=True, help_text="Number of pages of the dissertation")
 
-    organization = models.OneToOneField(Organization, on_delete=models.CASCADE, null=True, blank=True,
-                                        help_text="The name of the institution that consigned the report")
+    organization = models.ForeignKey(Organization, on_delete=models.PROTECT, null=True, blank=True,
+                                     help_text="The name of the institution that consigned the report")
     other_organization = models.OneToOneField(OtherOrganization, on_delete=models.CASCADE, null=True, blank=True)
     publication = models.ForeignKey(Publication, on_delete=models.CASCADE)
 
@@ -407,8 +407,8 @@ class Report(PublicationAbstract, AuthorEditor):
                                                      "individual research studies within the larger body of knowledge "
                                                      "on he topic")
 
-    organization = models.OneToOneField(Organization, on_delete=models.CASCADE, null=True, blank=True,
-                                        help_text="The name of the institution that consigned the report")
+    organization = models.ForeignKey(Organization, on_delete=models.PROTECT, null=True, blank=True,
+                                     help_text="The name of the institution that consigned the report")
     other_organization = models.OneToOneField(OtherOrganization, on_delete=models.CASCADE, null=True, blank=True)
     publication = models.ForeignKey(Publication, on_delete=models.CASCADE)
 
@@ -52,12 +52,18 @@ class Degree(Base):
                                               help_text="If doctorate degree, did the person transfer "
                                                         "directly to this degree without completing a Masters?")
 
-    organization = models.OneToOneField(Organization, on_delete=models.CASCADE, null=True, blank=True,
-                                        help_text="The institution that conferred the degree.")
+    organization = models.ForeignKey(Organization, on_delete=models.PROTECT, null=True, blank=True,
+                                     help_text="The institution that conferred the degree.")
     other_organization = models.OneToOneField(OtherOrganization, on_delete=models.CASCADE, null=True, blank=True, )
 
     education = models.ForeignKey(Education, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # degree_type filter of the CVs
+            models.Index(fields=['type', 'education'], name='degree_type_education_idx'),
+        ]
+
 
 class Supervisor(Base):
     """The persons responsible for mentoring, advising and guiding the student academically throughout this degree
@@ -82,8 +88,8 @@ class Credential(Base):
     description = models.CharField(max_length=1000, null=True, blank=True,
                                    help_text="A description of the person's designation")
 
-    organization = models.OneToOneField(Organization, on_delete=models.CASCADE, null=True, blank=True,
-                                        help_text="The organization that conferred this credential")
+    organization = models.ForeignKey(Organization, on_delete=models.PROTECT, null=True, blank=True,
+                                     help_text="The organization that conferred this credential")
     other_organization = models.OneToOneField(OtherOrganization, on_delete=models.CASCADE, null=True, blank=True)
 
     education = models.ForeignKey(Education, on_delete=models.CASCADE)
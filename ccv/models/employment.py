@@ -60,11 +60,18 @@ class AcademicWorkExperience(Base):
     tenure_end_date = models.DateField(null=True, blank=True, help_text="The date when the tenure stopped, "
                                                                         "if applicable")
 
-    organization = models.OneToOneField(Organization, on_delete=models.CASCADE, null=True, blank=True)
+    organization = models.ForeignKey(Organization, on_delete=models.PROTECT, null=True, blank=True)
     other_organization = models.OneToOneField(OtherOrganization, on_delete=models.CASCADE, null=True, blank=True, )
 
     employment = models.ForeignKey(Employment, on_delete=models.CASCADE, related_name='academic_work_experience')
 
+    class Meta:
+        indexes = [
+            # organization and active_between filters of the CVs
+            models.Index(fields=['organization', 'employment'], name='awe_organization_idx'),
+            models.Index(fields=['start_date', 'end_date', 'employment'], name='awe_dates_idx'),
+        ]
+
 
 class NonAcademicWorkExperience(Base):
     """Employment in a non-academic environment"""
@@ -85,8 +92,8 @@ class NonAcademicWorkExperience(Base):
     unit_division = models.CharField(max_length=100, null=True, blank=True,
                                      help_text="The department within the given company or organization")
 
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The name of the organization where the person worked")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The name of the organization where the person worked")
     other_organization = models.OneToOneField(OtherOrganization, on_delete=models.CASCADE, null=True, blank=True)
     employment = models.ForeignKey(Employment, on_delete=models.CASCADE)
 
@@ -105,8 +112,8 @@ class Affiliation(Base):
     end_date = models.DateField(null=True, blank=True,
                                 help_text="The date when the person's affiliation with this organization ended")
 
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The organization with which the person is affiliated.")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The organization with which the person is affiliated.")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
 
     employment = models.ForeignKey(Employment, on_delete=models.CASCADE)
@@ -135,6 +142,6 @@ class LeavesOfAbsence(Base):
     absence_description = models.CharField(max_length=1000, null=True, blank=True,
                                            help_text="description of the leave of absence")
 
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE)
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT)
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
     employment = models.ForeignKey(Employment, on_delete=models.CASCADE)
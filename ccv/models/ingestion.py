@@ -0,0 +1,35 @@
+import uuid
+
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+
+class IngestionJob(models.Model):
+    """A CCV document uploaded to the ingest endpoint, queued until an ingest_worker ingests it, see ccv.jobs"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = [(QUEUED, 'Queued'), (RUNNING, 'Running'), (DONE, 'Done'), (FAILED, 'Failed')]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=255, blank=True, default='', help_text="Name of the uploaded file")
+    document = models.BinaryField(null=True, help_text="Uploaded file, removed once it is ingested")
+    update = models.BooleanField(default=False, help_text="Ingest it with parse_ccv --update")
+    status = models.CharField(max_length=10, choices=STATUSES, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    ccv_ids = ArrayField(models.IntegerField(), default=list, blank=True,
+                         help_text="Ids of the CVs ingested from the file, several for an archive")
+    messages = models.TextField(blank=True, default='', help_text="Warnings of the ingestion")
+    error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Next queued job, and jobs left running by a worker which died
+            models.Index(fields=['status', 'created_at'], name='ingestion_job_status_idx'),
+        ]
@@ -29,16 +29,15 @@ class Recognition(Base):
     currency = models.CharField(max_length=50, null=True, blank=True,
                                 help_text="The currency in which the money was awarded")
 
-    organization = models.OneToOneField(Organization, on_delete=models.CASCADE, null=True, blank=True,
-                                        help_text="The organization that gave the recognition")
+    organization = models.ForeignKey(Organization, on_delete=models.PROTECT, null=True, blank=True,
+                                     help_text="The organization that gave the recognition")
     other_organization = models.OneToOneField(OtherOrganization, on_delete=models.CASCADE, null=True, blank=True)
 
     ccv = models.ForeignKey(CanadianCommonCv, on_delete=models.CASCADE)
 
-    def save(self, *args, **kwargs):
+    def normalize_fields(self):
         self.amount = parse_integer(self.amount)
         # TODO: Add amount conversion logic in CAN $
-        super().save(*args, **kwargs)
 
 
 class ResearchFundingHistory(Base):
@@ -194,9 +193,9 @@ class FundingSource(Base):
 
     research_funding_history = models.ForeignKey(ResearchFundingHistory, on_delete=models.CASCADE)
 
-    def save(self, *args, **kwargs):
+    def normalize_fields(self):
         # TODO: Add amount conversion logic in CAN $
-        super().save(*args, **kwargs)
+        pass
 
 
 class FundingByYear(Base):
@@ -227,9 +226,9 @@ class FundingByYear(Base):
                                                                            " on this project")
     research_funding_history = models.ForeignKey(ResearchFundingHistory, on_delete=models.CASCADE)
 
-    def save(self, *args, **kwargs):
+    def normalize_fields(self):
         # TODO: Add amount conversion logic in CAN $
-        super().save(*args, **kwargs)
+        pass
 
 
 class OtherInvestigator(Base):
@@ -279,8 +278,8 @@ class CommitteeMembership(Base):
                                    help_text="Description of services contributed by the person as part of a committee")
     end_date = models.DateField(null=True, blank=True, help_text="The date on which membership ended, if applicable")
 
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The name of the organisation of which the person is a member")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The name of the organisation of which the person is a member")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
     membership = models.ForeignKey(Membership, on_delete=models.CASCADE)
 
@@ -297,8 +296,8 @@ class OtherMembership(Base):
                                    help_text="Description of services contributed by the person as part of a committee")
     end_date = models.DateField(null=True, blank=True, help_text="The date on which membership ended, if applicable")
 
-    organization = models.OneToOneField(Organization, null=True, blank=True, on_delete=models.CASCADE,
-                                        help_text="The name of the organisation of which the person is a member")
+    organization = models.ForeignKey(Organization, null=True, blank=True, on_delete=models.PROTECT,
+                                     help_text="The name of the organisation of which the person is a member")
     other_organization = models.OneToOneField(OtherOrganization, null=True, blank=True, on_delete=models.CASCADE)
     membership = models.ForeignKey(Membership, on_delete=models.CASCADE)
 
@@ -343,9 +342,14 @@ class ResearchDiscipline(Base):
     research_funding_assessment_activity = models.ForeignKey(ResearchFundingApplicationAssessmentActivity,
                                                              null=True, blank=True, on_delete=models.CASCADE)
 
-    def save(self, *args, **kwargs):
+    class Meta:
+        indexes = [
+            # discipline filter of the CVs
+            models.Index(fields=['discipline', 'user_profile'], name='discipline_user_profile_idx'),
+        ]
+
+    def normalize_fields(self):
         self.order = parse_integer(self.order)
-        super().save(*args, **kwargs)
 
 
 class AreaOfResearch(Base):
@@ -378,9 +382,15 @@ class AreaOfResearch(Base):
                                                              null=True, blank=True, on_delete=models.CASCADE,
                                                              related_name="assessment_activity_aor")
 
-    def save(self, *args, **kwargs):
+    class Meta:
+        indexes = [
+            # research_area and sector filters of the CVs
+            models.Index(fields=['area', 'user_profile'], name='aor_area_user_profile_idx'),
+            models.Index(fields=['sector', 'user_profile'], name='aor_sector_user_profile_idx'),
+        ]
+
+    def normalize_fields(self):
         self.order = parse_integer(self.order)
-        super().save(*args, **kwargs)
 
 
 class FieldOfApplication(Base):
@@ -406,6 +416,5 @@ class FieldOfApplication(Base):
     research_funding_assessment_activity = models.ForeignKey(ResearchFundingApplicationAssessmentActivity,
                                                              null=True, blank=True, on_delete=models.CASCADE)
 
-    def save(self, *args, **kwargs):
+    def normalize_fields(self):
         self.order = parse_integer(self.order)
-        super().save(*args, **kwargs)
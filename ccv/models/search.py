@@ -0,0 +1,21 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+from .base import CanadianCommonCv
+
+
+class SearchDocument(models.Model):
+    """Text of a CV searched by the search endpoint, built by parse_ccv once the CV is ingested, see ccv.search"""
+
+    document = SearchVectorField(help_text="Weighted lexemes of the names, research interests and publications")
+
+    ccv = models.OneToOneField(CanadianCommonCv, on_delete=models.CASCADE, primary_key=True,
+                               related_name='search_document')
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['document'], name='ccv_search_document_idx'),
+        ]
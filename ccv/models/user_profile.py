@@ -45,9 +45,8 @@ class ResearchSpecializationKeyword(UserProfileAbstract):
 
     user_profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE)
 
-    def save(self, *args, **kwargs):
+    def normalize_fields(self):
         self.order = parse_integer(self.order)
-        super().save(*args, **kwargs)
 
 
 class ResearchCentre(UserProfileAbstract):
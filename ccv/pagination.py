@@ -0,0 +1,31 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class CcvCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the id of the CVs, newest first. A page is fetched with `WHERE id < <cursor> LIMIT <size>`
+    on the primary key index, without counting the CVs nor scanning the previous pages, so every page takes the same
+    time however deep it is. Clients follow the next and previous links, and may ask for up to
+    CCV_MAX_PAGE_SIZE CVs per page with page_size.
+    """
+
+    ordering = '-id'
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self) -> int:
+        return settings.CCV_MAX_PAGE_SIZE
+
+
+class CcvSearchPagination(PageNumberPagination):
+    """
+    Numbered pages of search results. Results are ordered by rank, which a cursor can't resume from, and searches are
+    narrow enough for their count to be cheap.
+    """
+
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self) -> int:
+        return settings.CCV_MAX_PAGE_SIZE
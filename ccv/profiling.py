@@ -0,0 +1,163 @@
+import cProfile
+import os
+import re
+import signal
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.apps import apps
+
+# Table a statement reads or writes, and whether it writes it
+STATEMENT_TABLE = re.compile(r'^\s*(?:(INSERT\s+INTO|UPDATE|DELETE\s+FROM)|SELECT\b.*?\bFROM)\s+"?(\w+)"?',
+                             re.IGNORECASE | re.DOTALL)
+
+
+class IngestionProfile:
+    """
+    Wall time, SQL statements and rows written of the stages of an ingestion, and statements, rows written and time
+    spent in the statements of each model. Stages nest: the time, statements and rows of a stage don't include the ones
+    of the stages run inside of it. Statements are counted once installed as a connection.execute_wrapper.
+    """
+
+    def __init__(self):
+        self.stages = defaultdict(lambda: [0.0, 0, 0])
+        self.models = defaultdict(lambda: [0.0, 0, 0])
+        self.tables = {model._meta.db_table: model.__name__ for model in apps.get_models(include_auto_created=True)}
+        self.running = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Times a stage. A stage run several times accumulates the time, statements and rows of every run
+        :param name:
+        :return: the running stage, [name, time of the nested stages]. Its name may be changed until the block ends
+        """
+        running = [name, 0.0]
+        self.running.append(running)
+        start = time.perf_counter()
+        try:
+            yield running
+        finally:
+            elapsed = time.perf_counter() - start
+            self.running.pop()
+            self.stages[running[0]][0] += elapsed - running[1]
+            if self.running:
+                self.running[-1][1] += elapsed
+
+    def iter_stages(self, items, prefix: str):
+        """
+        Times the production of each (label, value) of an iterator as the stage '<prefix> <label>'. The time taken
+        to find out there's no more items goes to the stage '<prefix>'
+        :param items: iterator of (label, value)
+        :param prefix:
+        :return: generator of the items
+        """
+        items = iter(items)
+        while True:
+            with self.stage(prefix) as running:
+                try:
+                    label, value = next(items)
+                except StopIteration:
+                    return
+                running[0] = f"{prefix} {label}"
+            yield label, value
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            stage = self.stages[self.running[-1][0]] if self.running else None
+            if stage is not None:
+                stage[1] += 1
+
+            match = STATEMENT_TABLE.match(sql)
+            if match:
+                model = self.models[self.tables.get(match.group(2), match.group(2))]
+                model[0] += time.perf_counter() - start
+                model[1] += 1
+                if match.group(1) and context['cursor'].rowcount > 0:
+                    model[2] += context['cursor'].rowcount
+                    if stage is not None:
+                        stage[2] += context['cursor'].rowcount
+
+    def write(self, output) -> None:
+        """
+        Writes the report
+        :param output: stream with a write method, such as the stdout of a command
+        :return:
+        """
+        output.write(f"{'stage':<60} {'seconds':>9} {'statements':>10} {'rows':>8}")
+        for name, (seconds, statements, rows) in self.stages.items():
+            output.write(f"{name:<60} {seconds:>9.3f} {statements:>10} {rows:>8}")
+        seconds, statements, rows = (sum(column) for column in zip(*self.stages.values())) if self.stages else (0, 0, 0)
+        output.write(f"{'total':<60} {seconds:>9.3f} {statements:>10} {rows:>8}")
+
+        output.write(f"\n{'model':<60} {'seconds':>9} {'statements':>10} {'rows':>8}")
+        for name, (seconds, statements, rows) in sorted(self.models.items(), key=lambda item: -item[1][0]):
+            output.write(f"{name:<60} {seconds:>9.3f} {statements:>10} {rows:>8}")
+
+
+class StackSampler:
+    """
+    Samples the Python stack every `interval` seconds of CPU time of the process. The samples are written in the
+    folded format read by flamegraph.pl and speedscope: one line per distinct stack, with its frames from the
+    outermost one separated by semicolons, then its number of samples. Only available on Unix, from the main thread.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self.previous_handler = None
+
+    def sample(self, signum, frame) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        self.stacks[';'.join(reversed(stack))] += 1
+
+    def __enter__(self):
+        if not hasattr(signal, 'SIGPROF'):
+            raise RuntimeError("Stack sampling requires SIGPROF, which isn't available on this platform")
+        self.previous_handler = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *args):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.previous_handler)
+
+    def dump(self, file_path: str) -> None:
+        with open(file_path, 'w', encoding='utf8') as output:
+            for stack, count in sorted(self.stacks.items()):
+                output.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profile_calls(stats_path: str = None, stacks_path: str = None):
+    """
+    Profiles the Python calls made inside of the block with cProfile, and samples their stacks
+    :param stats_path: file the cProfile statistics are dumped to, for pstats or snakeviz. Not profiled if None
+    :param stacks_path: file the folded stacks are written to, for flamegraph.pl. Not sampled if None
+    :return:
+    """
+    profiler = cProfile.Profile() if stats_path else None
+    sampler = StackSampler() if stacks_path else None
+
+    if sampler is not None:
+        sampler.__enter__()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        if sampler is not None:
+            sampler.__exit__()
+            sampler.dump(stacks_path)
+        if profiler is not None:
+            profiler.dump_stats(stats_path)
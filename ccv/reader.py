@@ -0,0 +1,123 @@
+import xml.etree.ElementTree as ET
+
+
+class Record(dict):
+    """Values of a section keyed by label. record_id is the recordId of the section, None for container sections"""
+
+    record_id = None
+
+
+def get_field_value(field):
+    """
+    Resolves the value of a <field> element
+    :param field: field element
+    :return: text of the lov or value, a dict of the linked values for a refTable, or '' when the field is empty
+    """
+    for tag in ('lov', 'value'):
+        child = field.find(tag)
+        if child is not None and (child.attrib or len(child)) and child.text and child.text.strip():
+            return child.text.strip()
+
+    ref_table = field.find('refTable')
+    if ref_table is not None:
+        return {
+            ref_table.get('label'): {
+                linked.get('label'): linked.get('value') for linked in ref_table.findall('linkedWith')
+            }
+        }
+
+    return ''
+
+
+def section_to_dict(section, schema=None) -> Record:
+    """
+    Converts a <section> element to a dictionary keyed by label. Fields map to their value and nested sections
+    to a list of dictionaries, one per occurrence
+    :param section: section element
+    :param schema: ccv.schema.Section of the element, only the fields and subsections it reads are converted
+    :return: Record
+    """
+    data = Record()
+    data.record_id = section.get('recordId')
+    for child in section:
+        if child.tag == 'field' and (schema is None or child.get('label') in schema.labels):
+            data[child.get('label')] = get_field_value(child)
+
+    for child in section:
+        if child.tag != 'section':
+            continue
+        if schema is None:
+            data.setdefault(child.get('label'), []).append(section_to_dict(child))
+        elif child.get('label') in schema.sections:
+            data.setdefault(child.get('label'), []).append(section_to_dict(child, schema.sections[child.get('label')]))
+
+    return data
+
+
+def iter_sections(source, schema: dict = None):
+    """
+    Streams the top level sections of a CCV xml document. Each section is converted as soon as its closing tag
+    is read and is then removed from the tree, so memory is bounded by the largest section instead of the file.
+    :param source: file path or file object
+    :param schema: ccv.schema.Section of the top level sections by label, the other ones are skipped
+    :return: generator of (label, section dictionary)
+    """
+    root = None
+    depth = 0
+
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1 and element.tag == 'section':
+            label = element.get('label')
+            if schema is None:
+                yield label, section_to_dict(element)
+            elif label in schema:
+                yield label, section_to_dict(element, schema[label])
+            element.clear()
+            root.remove(element)
+
+
+def read_submission(source) -> dict:
+    """
+    Reads the identifiers of the submission at the beginning of a CCV xml document, without parsing its sections
+    :param source: file path or file object
+    :return: ccv_identifier, confirmation_number and date_time_generated, None when missing from the document
+    """
+    submission = {'ccv_identifier': None, 'confirmation_number': None, 'date_time_generated': None}
+
+    for index, (event, element) in enumerate(ET.iterparse(source, events=('start',))):
+        if index == 0:
+            submission['date_time_generated'] = element.get('dateTimeGenerated')
+            continue
+
+        if element.tag == 'submission':
+            submission['ccv_identifier'] = element.get('ccvIdentifier')
+            submission['confirmation_number'] = element.get('confirmationNumber')
+        break
+
+    return submission
+
+
+def iter_organizations(source):
+    """
+    Streams the organizations referenced by a CCV xml document: the Organization reference table of the fields
+    labelled Organization
+    :param source: file path or file object
+    :return: generator of dictionaries of the linked values (Organization, Organization Type, Country, Subdivision)
+    """
+    for event, element in ET.iterparse(source):
+        # Children end before their parent: only fields and sections are cleared, once they are read
+        if element.tag == 'field':
+            if element.get('label') == 'Organization':
+                value = get_field_value(element)
+                if isinstance(value, dict) and isinstance(value.get('Organization'), dict):
+                    yield value['Organization']
+            element.clear()
+        elif element.tag == 'section':
+            element.clear()
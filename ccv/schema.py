@@ -0,0 +1,885 @@
+import copy
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .converters import DATE, YEAR, YEAR_MONTH, ConversionError, boolean, integer
+from .models.base import CanadianCommonCv
+from .models.contribution import Contribution, Presentation, ContributionFundingSource, BroadcastInterview, \
+    TextInterview, Publication, Journal, Book, ThesisDissertation, SupervisedStudentPublication, Litigation, \
+    NewspaperArticle, EncyclopediaEntry, MagazineEntry, IntellectualProperty, Patent, License, Disclosure, \
+    RegisteredCopyright, Trademark, ArtisticContribution, AudioRecording, ArtisticExhibition, ExhibitionCatalogue, \
+    MusicalPerformance, RadioAndTvProgram, Scripts, Fiction, TheatrePerformanceAndProduction, VideoRecording, \
+    VisualArtwork, SoundDesign, SetDesign, LightDesign, Choreography, MuseumExhibition, PerformanceArt, Poetry, \
+    OtherArtisticContribution, MusicalCompilation, Broadcast, MajorPerformanceDate, PerformanceDate
+from .models.education import Education, Degree, Supervisor, Credential
+from .models.employment import Employment, AcademicWorkExperience, NonAcademicWorkExperience, Affiliation, \
+    LeavesOfAbsence
+from .models.personal_information import Identification, CountryOfCitizenship, LanguageSkill, Address, Website, \
+    Telephone, Email
+from .models.recognitions import Recognition, FundingSource, FundingByYear, ResearchDiscipline, AreaOfResearch, \
+    FieldOfApplication, OtherMembership, ResearchSetting, ResearchUptakeHolder, OtherInvestigator, Membership, \
+    MostSignificantContribution, CommitteeMembership, ResearchFundingHistory
+from .models.user_profile import UserProfile, ResearchSpecializationKeyword, ResearchCentre, DisciplineTrainedIn, \
+    TemporalPeriod, GeographicalRegion, TechnologicalApplication
+
+
+class Section:
+    """
+    How the records of a CCV section are saved: the model of their rows and the model field each of their fields is
+    stored in. Subsections are saved after their parent record, linked to it by the foreign key of their model to the
+    model of the closest enclosing section, or by the many-to-many field of that model to theirs. A section without a
+    model only groups its subsections.
+    """
+
+    def __init__(self, label: str, model=None, columns: tuple = (), sections: tuple = (), constants: dict = None,
+                 organization: bool = False, parent=None):
+        """
+        :param label: label of the section in the CCV
+        :param model: model of the rows saved for its records, None for a section grouping its subsections
+        :param columns: (model field, label or path of labels, converter) of the values read from its fields
+        :param sections: its subsections
+        :param constants: values of model fields which don't come from a field
+        :param organization: whether its Organization field references the shared Organization of the record
+        :param parent: model the rows are linked to, the model of the closest enclosing section by default
+        """
+        self.label = label
+        self.model = model
+        self.columns = [
+            (name, (path,) if isinstance(path, str) else path, converter[0] if converter else None)
+            for name, path, *converter in columns
+        ]
+        self.sections = {section.label: section for section in sections}
+        self.constants = constants or {}
+        self.organization = organization
+        self.parent = parent
+        self.foreign_key = None
+        self.many_to_many = None
+        # Labels of the fields read, the reader skips the other ones
+        self.labels = frozenset([path[0] for _, path, _ in self.columns] + (['Organization'] if organization else []))
+
+    def compile(self, parent) -> 'Section':
+        """
+        :param parent: model of the closest enclosing section which has one
+        :return: a copy of the section and of its subsections, with the links of their rows resolved
+        """
+        section = copy.copy(self)
+        if self.model is not None:
+            section.parent = self.parent or parent
+            section.foreign_key = next((
+                field.name for field in self.model._meta.concrete_fields
+                if (field.many_to_one or field.one_to_one) and field.related_model is section.parent
+            ), None)
+            section.many_to_many = None if section.foreign_key else next((
+                field.name for field in section.parent._meta.many_to_many if field.related_model is self.model
+            ), None)
+            if section.foreign_key is None and section.many_to_many is None:
+                raise ImproperlyConfigured(f"{self.model.__name__} of the '{self.label}' section isn't linked to "
+                                           f"{section.parent.__name__}")
+
+        section.sections = {
+            label: subsection.compile(self.model or parent) for label, subsection in self.sections.items()
+        }
+        return section
+
+    def get_values(self, record: dict, errors: list = None) -> dict:
+        """
+        :param record: values of a record of the section, keyed by label
+        :param errors: list the (path of labels, ConversionError) of the values which can't be converted are added to,
+            these fields keep their default
+        :return: values of the model fields
+        """
+        values = dict(self.constants)
+        for name, path, converter in self.columns:
+            value = record.get(path[0])
+            for label in path[1:]:
+                value = value.get(label) if isinstance(value, dict) else None
+            if converter is not None:
+                try:
+                    value = converter(value)
+                except ConversionError as e:
+                    if errors is not None:
+                        errors.append((path, e))
+                    continue
+            values[name] = value
+        return values
+
+
+FUNDING_SOURCES = Section('Funding Sources', ContributionFundingSource, (
+    ('organisation', 'Funding Organization'),
+    ('other_organization', 'Other Funding Organization'),
+    ('reference_number', 'Funding Reference Number'),
+))
+
+AREAS_OF_RESEARCH = Section('Areas of Research', AreaOfResearch, (
+    ('order', 'Order'),
+    ('sector', ('Area of Research', 'Area of Research', 'Sector of Research')),
+    ('field', ('Area of Research', 'Area of Research', 'Field')),
+    ('subfield', ('Area of Research', 'Area of Research', 'Subfield')),
+    ('area', ('Area of Research', 'Area of Research', 'Area')),
+))
+
+RESEARCH_DISCIPLINES = Section('Research Disciplines', ResearchDiscipline, (
+    ('order', 'Order'),
+    ('field', ('Research Discipline', 'Research Discipline', 'Field')),
+    ('sector_of_discipline', ('Research Discipline', 'Research Discipline', 'Sector of Discipline')),
+    ('discipline', ('Research Discipline', 'Research Discipline', 'Discipline')),
+))
+
+FIELDS_OF_APPLICATION = Section('Fields of Application', FieldOfApplication, (
+    ('order', 'Order'),
+    ('field', ('Field of Application', 'Field of Application', 'Field of Application')),
+    ('subfield', ('Field of Application', 'Field of Application', 'Subfield')),
+))
+
+# Fields shared by most contributions
+CONTRIBUTION_VALUE = ('contribution_value', 'Description / Contribution Value')
+URL = ('url', 'URL')
+ROLE = ('role', 'Contribution Role')
+CONTRIBUTORS_COUNT = ('contributors_count', 'Number of Contributors', integer)
+CONTRIBUTORS = ('contributors', 'Contributors')
+AUTHORS = ('authors', 'Authors')
+EDITORS = ('editors', 'Editors')
+DOI = ('doi', 'DOI')
+CONTRIBUTION_PERCENTAGE = ('contribution_percentage', 'Contribution Percentage')
+DESCRIPTION_OF_ROLE = ('description_of_role', 'Description of Contribution Role')
+PUBLISHING_STATUS = ('publishing_status', 'Publishing Status')
+PUBLISHER = ('publisher', 'Publisher')
+PUBLICATION_LOCATION = ('publication_location', 'Publication Location')
+CONTRIBUTION_OR_IMPACT = ('contribution_or_impact', 'Description/Contribution Value/Impact')
+
+JOURNAL_COLUMNS = (
+    ('title', 'Article Title'),
+    ('journal', 'Journal'),
+    ('volume', 'Volume'),
+    ('issue', 'Issue'),
+    ('page_range', 'Page Range'),
+    PUBLISHING_STATUS,
+    PUBLISHER,
+    PUBLICATION_LOCATION,
+    CONTRIBUTION_VALUE,
+    URL,
+    ('is_refereed', 'Refereed?', boolean),
+    ('is_open_access', 'Open Access?', boolean),
+    ROLE,
+    CONTRIBUTORS_COUNT,
+    AUTHORS,
+    EDITORS,
+    DOI,
+    CONTRIBUTION_PERCENTAGE,
+    DESCRIPTION_OF_ROLE,
+)
+
+# Fields of the stage, light and sound designs
+DESIGN_COLUMNS = (
+    ('title', 'Show Title'),
+    ('writer', 'Writer'),
+    ('producer', 'Producer'),
+    ('venue', 'Venue'),
+    ('opening_date', 'Opening Date', DATE),
+    CONTRIBUTION_VALUE,
+    URL,
+    ROLE,
+    CONTRIBUTORS_COUNT,
+    CONTRIBUTORS,
+)
+
+PERSONAL_INFORMATION = Section('Personal Information', sections=(
+    Section('Identification', Identification, (
+        ('title', 'Title'),
+        ('family_name', 'Family Name'),
+        ('first_name', 'First Name'),
+        ('middle_name', 'Middle Name'),
+        ('previous_family_name', 'Previous Family Name'),
+        ('previous_first_name', 'Previous First Name'),
+        ('date_of_birth', 'Date of Birth'),
+        ('sex', 'Sex'),
+        ('designated_group', 'Designated Group'),
+        ('correspondence_language', 'Correspondence language'),
+        ('canadian_residency_status', 'Canadian Residency Status'),
+        ('permanent_residency', 'Applied for Permanent Residency?'),
+        ('permanent_residency_start_date', 'Permanent Residency Start Date', DATE),
+    ), sections=(
+        Section('Country of Citizenship', CountryOfCitizenship, (
+            ('name', 'Country of Citizenship'),
+        )),
+    )),
+    Section('Language Skills', LanguageSkill, (
+        ('language', 'Language'),
+        ('can_read', 'Read', boolean),
+        ('can_speak', 'Speak', boolean),
+        ('can_write', 'Write', boolean),
+        ('can_understand', 'Understand', boolean),
+        ('peer_review', 'Peer Review', boolean),
+    ), parent=Identification),
+    Section('Address', Address, (
+        ('type', 'Address Type'),
+        ('line_1', 'Address - Line 1'),
+        ('line_2', 'Line 2'),
+        ('line_3', 'Line 3'),
+        ('line_4', 'Line 4'),
+        ('line_5', 'Line 5'),
+        ('city', 'City'),
+        ('country', ('Location', 'Country-Subdivision', 'Country')),
+        ('subdivision', ('Location', 'Country-Subdivision', 'Subdivision')),
+        ('postal', 'Postal / Zip Code'),
+        ('start_date', 'Address Start Date', DATE),
+        ('end_date', 'Address End Date', DATE),
+    ), parent=Identification),
+    Section('Telephone', Telephone, (
+        ('phone_type', 'Phone Type'),
+        ('country_code', 'Country Code'),
+        ('area_code', 'Area Code'),
+        ('number', 'Telephone Number'),
+        ('extension', 'Extension'),
+        ('start_date', 'Telephone Start Date', DATE),
+        ('end_date', 'Telephone End Date', DATE),
+    ), parent=Identification),
+    Section('Email', Email, (
+        ('type', 'Email Type'),
+        ('address', 'Email Address'),
+        ('start_date', 'Email Start Date', YEAR_MONTH),
+        ('end_date', 'Email End Date', YEAR_MONTH),
+    ), parent=Identification),
+    Section('Website', Website, (
+        ('type', 'Website Type'),
+        ('url', 'URL'),
+    ), parent=Identification),
+))
+
+EDUCATION = Section('Education', Education, sections=(
+    Section('Degrees', Degree, (
+        ('type', 'Degree Type'),
+        ('name', 'Degree Name'),
+        ('specialization', 'Specialization'),
+        ('thesis_title', 'Thesis Title'),
+        ('status', 'Degree Status'),
+        ('start_date', 'Degree Start Date', YEAR_MONTH),
+        ('end_date', 'Degree Received Date', YEAR_MONTH),
+        ('expected_date', 'Degree Expected Date', YEAR_MONTH),
+        ('phd_without_masters', 'Transferred to PhD without completing Masters?', boolean),
+    ), organization=True, sections=(
+        AREAS_OF_RESEARCH,
+        RESEARCH_DISCIPLINES,
+        FIELDS_OF_APPLICATION,
+        Section('Supervisors', Supervisor, (
+            ('name', 'Supervisor Name'),
+            ('start_date', 'Start Date', YEAR_MONTH),
+            ('end_date', 'End Date', YEAR_MONTH),
+        )),
+    )),
+    Section('Credentials', Credential, (
+        ('title', 'Title'),
+        ('effective_date', 'Effective Date', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+        ('description', 'Description'),
+    ), organization=True, sections=(
+        AREAS_OF_RESEARCH,
+        RESEARCH_DISCIPLINES,
+        FIELDS_OF_APPLICATION,
+    )),
+))
+
+RECOGNITIONS = Section('Recognitions', Recognition, (
+    ('type', 'Recognition Type'),
+    ('name', 'Recognition Name'),
+    ('effective_date', 'Effective Date', YEAR_MONTH),
+    ('end_date', 'End Date', YEAR_MONTH),
+    ('amount', 'Amount', integer),
+    ('currency', 'Currency'),
+    ('description', 'Description'),
+), organization=True, sections=(
+    AREAS_OF_RESEARCH,
+    RESEARCH_DISCIPLINES,
+    FIELDS_OF_APPLICATION,
+))
+
+USER_PROFILE = Section('User Profile', UserProfile, (
+    ('researcher_status', 'Researcher Status'),
+    ('career_start_date', 'Research Career Start Date', DATE),
+    ('engaged_in_clinical_research', 'Engaged in Clinical Research?', boolean),
+    ('key_theory', 'Key Theory / Methodology'),
+    ('research_interest', 'Research Interests'),
+    ('experience_summary', 'Research Experience Summary'),
+), sections=(
+    FIELDS_OF_APPLICATION,
+    RESEARCH_DISCIPLINES,
+    AREAS_OF_RESEARCH,
+    Section('Research Specialization Keywords', ResearchSpecializationKeyword, (
+        ('keyword', 'Research Specialization Keywords'),
+        ('order', 'Order', integer),
+    )),
+    Section('Research Centres', ResearchCentre, (
+        ('name', ('Research Centre', 'Research Centre', 'Research Centre')),
+        ('country', ('Research Centre', 'Research Centre', 'Country')),
+        ('subdivision', ('Research Centre', 'Research Centre', 'Subdivision')),
+        ('order', ('Research Centre', 'Research Centre', 'Order'), integer),
+    )),
+    Section('Disciplines Trained In', DisciplineTrainedIn, (
+        ('order', 'Order', integer),
+        ('sector', ('Discipline Trained In', 'Research Discipline', 'Sector of Discipline')),
+        ('fields', ('Discipline Trained In', 'Research Discipline', 'Field')),
+        ('discipline', ('Discipline Trained In', 'Research Discipline', 'Discipline')),
+    )),
+    Section('Temporal Periods', TemporalPeriod, (
+        ('order', 'Order', integer),
+        ('from_year', 'From Year'),
+        ('from_year_period', 'From Year Period'),
+        ('to_year', 'To Year'),
+        ('to_year_period', 'To Year Period'),
+    )),
+    Section('Geographical Regions', GeographicalRegion, (
+        ('order', 'Order'),
+        ('region', 'Geographical Region'),
+    )),
+    Section('Technological Applications', TechnologicalApplication, (
+        ('order', 'Order'),
+        ('category', ('Technological Application', 'Technological Application', 'Technological Application Category')),
+        ('subfield', ('Technological Application', 'Technological Application', 'Subfield')),
+    )),
+))
+
+EMPLOYMENT = Section('Employment', Employment, sections=(
+    Section('Academic Work Experience', AcademicWorkExperience, (
+        ('position_type', 'Position Type'),
+        ('position_title', 'Position Title'),
+        ('position_status', 'Position Status'),
+        ('academic_rank', 'Academic Rank'),
+        ('start_date', 'Start Date', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+        ('work_description', 'Work Description'),
+        ('department', 'Department'),
+        ('campus', 'Faculty / School / Campus'),
+        ('tenure_status', 'Tenure Status'),
+        ('tenure_start_date', 'Tenure Start Date', YEAR_MONTH),
+        ('tenure_end_date', 'Tenure End Date', YEAR_MONTH),
+    ), organization=True),
+    Section('Non-academic Work Experience', NonAcademicWorkExperience, (
+        ('position_title', 'Position Title'),
+        ('position_status', 'Position Status'),
+        ('start_date', 'Start Date', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+        ('work_description', 'Work Description'),
+        ('unit_division', 'Unit / Division'),
+    ), organization=True),
+    Section('Affiliations', Affiliation, (
+        ('position_title', 'Position Title'),
+        ('department', 'Department'),
+        ('activity_description', 'Activity Description'),
+        ('start_date', 'Start Date', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+    ), organization=True),
+    Section('Leaves of Absence and Impact on Research', LeavesOfAbsence, (
+        ('leave_type', 'Leave Type'),
+        ('start_date', 'Start Date', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+        ('absence_description', 'Absence and Impact Description'),
+    ), organization=True),
+))
+
+RESEARCH_FUNDING_HISTORY = Section('Research Funding History', ResearchFundingHistory, (
+    ('funding_type', 'Funding Type'),
+    ('start_date', 'Funding Start Date', YEAR_MONTH),
+    ('end_date', 'Funding End Date', YEAR_MONTH),
+    ('funding_title', 'Funding Title'),
+    ('grant_type', 'Grant Type'),
+    ('project_description', 'Project Description'),
+    ('clinical_research_project', 'Clinical Research Project?'),
+    ('funding_status', 'Funding Status'),
+    ('funding_role', 'Funding Role'),
+    ('research_uptake', 'Research Uptake'),
+), sections=(
+    Section('Research Uptake Stakeholders', ResearchUptakeHolder, (
+        ('stakeholder', 'Stakeholder'),
+    )),
+    Section('Research Settings', ResearchSetting, (
+        ('country', ('Location', 'Country-Subdivision', 'Country')),
+        ('subdivision', ('Location', 'Country-Subdivision', 'Subdivision')),
+        ('setting_type', 'Setting Type'),
+    )),
+    Section('Funding Sources', FundingSource, (
+        ('organization', 'Funding Organization'),
+        ('other_organization', 'Other Funding Organization'),
+        ('program_name', 'Program Name'),
+        ('reference_no', 'Funding Reference Number'),
+        ('total_funding', 'Total Funding', integer),
+        ('total_funding_currency', 'Currency of Total Funding'),
+        ('funding_received', 'Portion of Funding Received', integer),
+        ('funding_received_currency', 'Currency of Portion of Funding Received'),
+        ('renewable', 'Funding Renewable?'),
+        ('competitive', 'Funding Competitive?'),
+        ('start_date', 'Funding Start Date', YEAR_MONTH),
+        ('end_date', 'Funding End Date', YEAR_MONTH),
+    )),
+    Section('Funding by Year', FundingByYear, (
+        ('start_date', 'Start Date', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+        ('total_funding', 'Total Funding', integer),
+        ('total_funding_currency', 'Currency of Total Funding'),
+        ('funding_received', 'Portion of Funding Received', integer),
+        ('funding_received_currency', 'Currency of Portion of Funding Received'),
+        ('time_commitment', 'Time Commitment', integer),
+    )),
+    Section('Other Investigators', OtherInvestigator, (
+        ('name', 'Investigator Name'),
+        ('role', 'Role'),
+    )),
+))
+
+MEMBERSHIPS = Section('Memberships', Membership, sections=(
+    Section('Committee Memberships', CommitteeMembership, (
+        ('role', 'Role'),
+        ('name', 'Committee Name'),
+        ('start_date', 'Membership Start Date', YEAR_MONTH),
+        ('end_date', 'Membership End Date', YEAR_MONTH),
+        ('description', 'Description'),
+    )),
+    Section('Other Memberships', OtherMembership, (
+        ('role', 'Role'),
+        ('start_date', 'Membership Start Date', YEAR_MONTH),
+        ('end_date', 'Membership End Date', YEAR_MONTH),
+        ('description', 'Description'),
+    )),
+))
+
+MOST_SIGNIFICANT_CONTRIBUTIONS = Section('Most Significant Contributions', MostSignificantContribution, (
+    ('title', 'Title'),
+    ('description', 'Description / Contribution Value/Impact'),
+    ('contribution_date', 'Contribution Date', YEAR_MONTH),
+))
+
+PUBLICATIONS = Section('Publications', Publication, sections=(
+    Section('Journal Articles', Journal, JOURNAL_COLUMNS + (
+        ('is_synthesis', 'Synthesis?', boolean),
+    ), constants={'journal_type': 'Article'}, sections=(FUNDING_SOURCES,)),
+    Section('Journal Issues', Journal, JOURNAL_COLUMNS, constants={'journal_type': 'Issue'},
+            sections=(FUNDING_SOURCES,)),
+    Section('Books', Book, (
+        ('title', 'Book Title'),
+        PUBLISHING_STATUS,
+        ('year', 'Year'),
+        PUBLISHER,
+        PUBLICATION_LOCATION,
+        ('publication_city', 'Publication City'),
+        CONTRIBUTION_VALUE,
+        URL,
+        ('is_refereed', 'Refereed?', boolean),
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        AUTHORS,
+        EDITORS,
+        DOI,
+        CONTRIBUTION_PERCENTAGE,
+        DESCRIPTION_OF_ROLE,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Thesis/Dissertation', ThesisDissertation, (
+        ('title', 'Dissertation Title'),
+        ('supervisor', 'Supervisor'),
+        ('completion_year', 'Completion Year'),
+        ('degree_type', 'Degree Type'),
+        ('pages_count', 'Number of Pages'),
+        CONTRIBUTION_VALUE,
+        URL,
+        DOI,
+        CONTRIBUTION_PERCENTAGE,
+        DESCRIPTION_OF_ROLE,
+    ), organization=True, sections=(FUNDING_SOURCES,)),
+    Section('Supervised Student Publications', SupervisedStudentPublication, (
+        ('student', 'Student'),
+        ('title', 'Publication Title'),
+        ('published_in', 'Published In'),
+        PUBLISHING_STATUS,
+        ('year', 'Year'),
+        PUBLISHER,
+        PUBLICATION_LOCATION,
+        ('student_contribution', 'Student Contribution (%)', integer),
+        CONTRIBUTION_VALUE,
+        URL,
+        DOI,
+        CONTRIBUTION_PERCENTAGE,
+        DESCRIPTION_OF_ROLE,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Litigations', Litigation, (
+        ('title', 'Case Name'),
+        ('person_acted_for', 'Person Acted For'),
+        ('court', 'Court'),
+        ('location', 'Location'),
+        ('year_started', 'Year Started'),
+        ('end_year', 'End Year'),
+        ('key_legal_issues', 'Key Legal Issues'),
+        CONTRIBUTION_VALUE,
+        URL,
+        DOI,
+        CONTRIBUTION_PERCENTAGE,
+        DESCRIPTION_OF_ROLE,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Newspaper Articles', NewspaperArticle, (
+        ('title', 'Article Title'),
+        ('newspaper', 'Page Range'),
+        ('year', 'Publication Year'),
+        PUBLICATION_LOCATION,
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        AUTHORS,
+        EDITORS,
+        DOI,
+        CONTRIBUTION_PERCENTAGE,
+        DESCRIPTION_OF_ROLE,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Encyclopedia Entries', EncyclopediaEntry, (
+        ('title', 'Entry Title'),
+        ('name', 'Encyclopedia Name'),
+        PUBLISHING_STATUS,
+        ('year', 'Year'),
+        PUBLISHER,
+        PUBLICATION_LOCATION,
+        ('publication_city', 'Publication City'),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        AUTHORS,
+        EDITORS,
+        DOI,
+        CONTRIBUTION_PERCENTAGE,
+        DESCRIPTION_OF_ROLE,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Magazine Entries', MagazineEntry, (
+        ('title', 'Article Title'),
+        ('name', 'Magazine Name'),
+        PUBLISHING_STATUS,
+        ('year', 'Year'),
+        PUBLISHER,
+        PUBLICATION_LOCATION,
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        AUTHORS,
+        EDITORS,
+        DOI,
+        CONTRIBUTION_PERCENTAGE,
+        DESCRIPTION_OF_ROLE,
+    ), sections=(FUNDING_SOURCES,)),
+))
+
+ARTISTIC_CONTRIBUTIONS = Section('Artistic Contributions', ArtisticContribution, sections=(
+    Section('Artistic Exhibitions', ArtisticExhibition, (
+        ('title', 'Title of Work'),
+        ('venue', 'Venue'),
+        ('first_performance_date', 'Date of First Performance', DATE),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Audio Recordings', AudioRecording, (
+        ('title', 'Piece Title'),
+        ('album_title', 'Album Title'),
+        ('producer', 'Producer'),
+        ('distributor', 'Distributor'),
+        ('release_date', 'Release Date', DATE),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Exhibition Catalogues', ExhibitionCatalogue, (
+        ('title', 'Catalogue Title'),
+        ('gallery_publisher', 'Gallery / Publisher'),
+        ('publication_date', 'Publication Date', YEAR_MONTH),
+        ('publication_city', 'Publication City'),
+        PUBLICATION_LOCATION,
+        ('pages_count', 'Number of Pages', integer),
+        ('artists', 'Artists'),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Musical Compositions', MusicalCompilation, (
+        ('title', 'Composition Title'),
+        ('instrumentation_tags', 'Instrumentation Tags'),
+        ('pages_count', 'Number of Pages', integer),
+        ('duration', 'Duration'),
+        PUBLISHER,
+        ('publication_date', 'Publication Date', YEAR_MONTH),
+        PUBLICATION_LOCATION,
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Musical Performances', MusicalPerformance, (
+        ('title', 'Title of work'),
+        ('venue', 'Venue'),
+        ('first_performance_date', 'Date of First Performance', DATE),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Radio and TV Programs', RadioAndTvProgram, (
+        ('title', 'Program Title'),
+        ('episode_title', 'Episode Title'),
+        ('no_of_episodes', 'Number of Episodes', integer),
+        ('series_title', 'Series Title'),
+        PUBLISHER,
+        PUBLICATION_LOCATION,
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(
+        Section('Broadcasts', Broadcast, (
+            ('date', 'Date', YEAR_MONTH),
+            ('network_name', 'Network Name'),
+        )),
+        FUNDING_SOURCES,
+    )),
+    Section('Scripts', Scripts, (
+        ('title', 'title'),
+        ('publication_date', '', YEAR_MONTH),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        AUTHORS,
+        EDITORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Fiction', Fiction, (
+        ('title', 'Title'),
+        ('appeared_in', 'Appeared In'),
+        ('volume', 'Volume'),
+        ('issue', 'Issue'),
+        ('page_range', 'Page Range'),
+        ('publication_date', 'Publication Date', YEAR_MONTH),
+        PUBLISHER,
+        PUBLICATION_LOCATION,
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        AUTHORS,
+        EDITORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Theatre Performances and Productions', TheatrePerformanceAndProduction, (
+        ('title', 'Title of Work'),
+        ('producer', 'Producer'),
+        ('venue', 'Venue'),
+        ('first_performance_date', 'First Performance Date', DATE),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Video Recordings', VideoRecording, (
+        ('title', 'Title'),
+        ('director', 'Director'),
+        ('producer', 'Producer'),
+        ('distributor', 'Distributor'),
+        ('release_date', 'Release Date', DATE),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Visual Artworks', VisualArtwork, (
+        ('title', 'Artwork Title'),
+        ('publication_date', 'Publication Date', YEAR_MONTH),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Sound Design', SoundDesign, DESIGN_COLUMNS, sections=(FUNDING_SOURCES,)),
+    Section('Set Design', SetDesign, DESIGN_COLUMNS, sections=(FUNDING_SOURCES,)),
+    Section('Light Design', LightDesign, DESIGN_COLUMNS, sections=(FUNDING_SOURCES,)),
+    Section('Choreography', Choreography, (
+        ('title', 'Show Title'),
+        ('composer', 'Composer'),
+        ('company', 'Company'),
+        ('premiere_date', 'Premiere Date', DATE),
+        ('media_release_date', 'Media Release Date', DATE),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+        ('principal_dancers', 'Principal Dancers'),
+    ), sections=(
+        Section('Major Performance Dates', MajorPerformanceDate, (
+            ('date', 'Major Performance Date', DATE),
+        )),
+        FUNDING_SOURCES,
+    )),
+    Section('Museum Exhibitions', MuseumExhibition, (
+        ('title', 'Exhibition Title'),
+        ('venue', 'Venue'),
+        ('start_date', 'Start Date', DATE),
+        ('end_date', 'End Date', DATE),
+        ('catalogue_title', 'Exhibition Catalogue Title'),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Performance Art', PerformanceArt, (
+        ('title', 'Exhibition Title'),
+        ('venue', 'Venue'),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        CONTRIBUTORS,
+    ), sections=(
+        Section('Performance Date', PerformanceDate, (
+            ('date', 'Performance Dates', DATE),
+        )),
+        FUNDING_SOURCES,
+    )),
+    Section('Poetry', Poetry, (
+        ('title', 'Title'),
+        ('venue', 'poetry'),
+        ('appeared_in', 'Appeared In'),
+        ('volume', 'Volume'),
+        ('issue', 'Issue'),
+        ('page_range', 'Page Range'),
+        ('date', 'Date', YEAR_MONTH),
+        PUBLISHER,
+        ('country', 'Country'),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+        AUTHORS,
+        EDITORS,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Other Artistic Contributions', OtherArtisticContribution, (
+        ('title', 'Title'),
+        ('venue', 'Venue'),
+        ('date', 'Date', YEAR_MONTH),
+        CONTRIBUTION_VALUE,
+        URL,
+        ROLE,
+        CONTRIBUTORS_COUNT,
+    ), sections=(FUNDING_SOURCES,)),
+))
+
+INTELLECTUAL_PROPERTY = Section('Intellectual Property', IntellectualProperty, sections=(
+    Section('Patents', Patent, (
+        ('title', 'Patent Title'),
+        ('number', 'Patent Number'),
+        ('location', 'Patent Location'),
+        ('status', 'Patent Status'),
+        ('filing_date', 'Filing Date', DATE),
+        ('date_issued', 'Year Issued', YEAR),
+        ('end_date', 'Year of End Term', YEAR),
+        CONTRIBUTION_OR_IMPACT,
+        URL,
+        ('inventors', 'Inventors'),
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Licenses', License, (
+        ('title', 'License Title'),
+        ('status', 'License Status'),
+        ('filing_date', 'Filing Date', DATE),
+        ('date_issued', 'Date Issued', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+        CONTRIBUTION_OR_IMPACT,
+        URL,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Disclosures', Disclosure, (
+        ('title', 'Disclosure Title'),
+        ('status', 'Disclosure Status'),
+        ('filing_date', 'Filing Date', DATE),
+        ('date_issued', 'Date Issued', YEAR_MONTH),
+        ('end_date', 'End Date', YEAR_MONTH),
+        CONTRIBUTION_OR_IMPACT,
+        URL,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Registered Copyrights', RegisteredCopyright, (
+        ('title', 'Copyright Title'),
+        ('status', 'Copyright Status'),
+        ('filing_date', 'Filing Date', DATE),
+        ('date_issued', 'Year Issued', YEAR),
+        ('end_date', 'End Year', YEAR),
+        CONTRIBUTION_OR_IMPACT,
+        URL,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Trademarks', Trademark, (
+        ('title', 'Trademark Title'),
+        ('status', 'Trademark Status'),
+        ('filing_date', 'Filing Date', DATE),
+        ('date_issued', 'Date Issued', YEAR_MONTH),
+        ('end_date', 'End Year', YEAR_MONTH),
+        CONTRIBUTION_OR_IMPACT,
+        URL,
+    ), sections=(FUNDING_SOURCES,)),
+))
+
+CONTRIBUTIONS = Section('Contributions', Contribution, sections=(
+    Section('Presentations', Presentation, (
+        ('title', 'Presentation Title'),
+        ('event_name', 'Conference / Event Name'),
+        ('location', 'Location'),
+        ('city', 'City'),
+        ('main_audience', 'Main Audience'),
+        ('is_invited', 'Invited?', boolean),
+        ('is_keynote', 'Keynote?', boolean),
+        ('is_competitive', 'Competitive?', boolean),
+        ('presentation_year', 'Presentation Year'),
+        ('description', 'Description / Contribution Value'),
+        ('co_presenters', 'Co-Presenters'),
+        URL,
+    ), sections=(FUNDING_SOURCES,)),
+    Section('Interviews and Media Relations', sections=(
+        Section('Broadcast Interviews', BroadcastInterview, (
+            ('topic', 'Topic'),
+            ('interviewer', 'Interviewer'),
+            ('program', 'Program'),
+            ('network', 'Network'),
+            ('first_broadcast_date', 'First Broadcast Date', DATE),
+            ('end_date', 'End Date', DATE),
+            ('description', 'Description / Contribution Value'),
+            URL,
+        ), sections=(FUNDING_SOURCES,)),
+        Section('Text Interviews', TextInterview, (
+            ('topic', 'Topic'),
+            ('interviewer', 'Interviewer'),
+            ('forum', 'Forum'),
+            ('publication_date', 'Publication Date', DATE),
+            ('description', 'Description / Contribution Value'),
+            URL,
+        ), sections=(FUNDING_SOURCES,)),
+    )),
+    PUBLICATIONS,
+    ARTISTIC_CONTRIBUTIONS,
+    INTELLECTUAL_PROPERTY,
+))
+
+# Top level sections of the CCV, saved in document order as soon as they are read. The links of the rows are resolved
+# once, when the module is imported
+SCHEMA = {
+    section.label: section.compile(CanadianCommonCv) for section in (
+        PERSONAL_INFORMATION,
+        EDUCATION,
+        RECOGNITIONS,
+        USER_PROFILE,
+        EMPLOYMENT,
+        RESEARCH_FUNDING_HISTORY,
+        MEMBERSHIPS,
+        MOST_SIGNIFICANT_CONTRIBUTIONS,
+        CONTRIBUTIONS,
+    )
+}
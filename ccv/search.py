@@ -0,0 +1,78 @@
+from functools import reduce
+from itertools import groupby
+from operator import add
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, Subquery
+
+from .models.contribution import Journal
+from .models.personal_information import Identification
+from .models.recognitions import AreaOfResearch
+from .models.search import SearchDocument
+from .models.user_profile import UserProfile, ResearchSpecializationKeyword
+
+# Columns of the search document of a CV, by weight: model, path from the model to the id of the CV, column.
+# Names and keywords rank first, then research interests and areas, then experience and publications.
+SEARCHED_COLUMNS = (
+    ('A', Identification, 'ccv_id', 'first_name'),
+    ('A', Identification, 'ccv_id', 'family_name'),
+    ('A', ResearchSpecializationKeyword, 'user_profile__ccv_id', 'keyword'),
+    ('B', UserProfile, 'ccv_id', 'research_interest'),
+    ('B', AreaOfResearch, 'user_profile__ccv_id', 'area'),
+    ('B', AreaOfResearch, 'user_profile__ccv_id', 'sector'),
+    ('B', AreaOfResearch, 'user_profile__ccv_id', 'field'),
+    ('C', UserProfile, 'ccv_id', 'experience_summary'),
+    ('C', Journal, 'publication__contribution__ccv_id', 'title'),
+    ('C', Journal, 'publication__contribution__ccv_id', 'journal'),
+)
+
+
+def get_text(model, path: str, column: str, ccv_id: int) -> Subquery:
+    """
+    :param model:
+    :param path: path from the model to the id of the CV
+    :param column:
+    :param ccv_id:
+    :return: the values of a column for a CV, concatenated
+    """
+    return Subquery(
+        model.objects.filter(**{path: ccv_id}).order_by().values(path).annotate(text=StringAgg(column, ' '))
+        .values('text')
+    )
+
+
+def get_document(ccv_id: int) -> SearchVector:
+    """
+    :param ccv_id:
+    :return: the search document of a CV, computed by the database from the rows of the CV
+    """
+    return reduce(add, (
+        SearchVector(*(get_text(model, path, column, ccv_id) for _, model, path, column in columns),
+                     weight=weight, config=settings.CCV_SEARCH_CONFIG)
+        for weight, columns in groupby(SEARCHED_COLUMNS, key=lambda searched: searched[0])
+    ))
+
+
+def update_document(ccv_id: int, using: str = 'default') -> None:
+    """
+    Builds the search document of a CV, replacing the previous one
+    :param ccv_id:
+    :param using:
+    :return:
+    """
+    if not SearchDocument.objects.using(using).filter(ccv_id=ccv_id).update(document=get_document(ccv_id)):
+        SearchDocument.objects.using(using).create(ccv_id=ccv_id, document=get_document(ccv_id))
+
+
+def search(queryset, text: str):
+    """
+    :param queryset: CanadianCommonCv queryset
+    :param text: words to search, all of them have to match
+    :return: the CVs matching the text, the most relevant first, annotated with their rank
+    """
+    query = SearchQuery(text, config=settings.CCV_SEARCH_CONFIG)
+    return queryset.filter(search_document__document=query).annotate(
+        rank=SearchRank(F('search_document__document'), query)
+    ).order_by('-rank', '-id')
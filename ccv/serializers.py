@@ -1,11 +1,91 @@
-from rest_framework.serializers import CharField, ModelSerializer
+from rest_framework.serializers import BaseSerializer, CharField, ListSerializer, ModelSerializer
 
 from .models.base import CanadianCommonCv
 from .models.employment import AcademicWorkExperience, Employment
+from .models.ingestion import IngestionJob
 from .models.personal_information import Identification, Email, Website
 from .models.recognitions import AreaOfResearch
 from .models.user_profile import UserProfile
 
+# Selection of every field, the nested objects included
+ALL = None
+# Name standing for the fields of an object which aren't nested objects
+OWN_FIELDS = '*'
+
+
+def get_selection(fields: str = None, expand: str = None):
+    """
+    Parses the fields and expand query parameters
+    :param fields: comma separated names of the fields to render, dotted paths for the fields of nested objects. Naming
+    a nested object renders its own fields, not the objects nested in it. * stands for the own fields of an object.
+    :param expand: comma separated names or dotted paths of the nested objects to render in full
+    :return: ALL when neither is given, otherwise a dict mapping the selected names to the selection of their fields
+    """
+    if not fields and not expand:
+        return ALL
+
+    selection = {}
+    for paths, leaf in ((fields, OWN_FIELDS), (expand, ALL)):
+        for path in filter(None, (path.strip() for path in (paths or '').split(','))):
+            node = selection
+            *parents, name = path.split('.')
+            for parent in parents:
+                if node.get(parent, {}) is ALL:
+                    break
+                node = node.setdefault(parent, {})
+            else:
+                if leaf is ALL:
+                    node[name] = ALL
+                elif node.get(name, {}) is not ALL:
+                    node.setdefault(name, {})[OWN_FIELDS] = {}
+
+    return selection
+
+
+def select_fields(serializer, selection) -> None:
+    """
+    Removes the fields which aren't selected from a serializer and from the serializers nested in it
+    :param serializer:
+    :param selection: see get_selection
+    :return:
+    """
+    if selection is ALL:
+        return
+
+    for name, field in list(serializer.fields.items()):
+        nested = field.child if isinstance(field, ListSerializer) else field
+        if name in selection and isinstance(nested, BaseSerializer):
+            select_fields(nested, selection[name])
+        elif name not in selection and (OWN_FIELDS not in selection or isinstance(nested, BaseSerializer)):
+            serializer.fields.pop(name)
+
+
+def get_eager_loading(serializer, prefix: str = '', joined: bool = True) -> tuple:
+    """
+    Lists what a queryset has to load for the fields of a serializer
+    :param serializer:
+    :param prefix: path of the model of the serializer from the model of the queryset
+    :param joined: whether the model of the serializer is joined to the queryset, otherwise it is prefetched
+    :return: select_related paths, prefetch_related paths and only columns of the joined models
+    """
+    select_related, prefetch_related, columns = [], [], [f'{prefix}id']
+    for field in serializer.fields.values():
+        path = f'{prefix}{field.source}'
+        if isinstance(field, ListSerializer):
+            prefetch_related.append(path)
+            nested = get_eager_loading(field.child, f'{path}__', joined=False)
+            prefetch_related += nested[0] + nested[1]
+        elif isinstance(field, BaseSerializer):
+            (select_related if joined else prefetch_related).append(path)
+            nested = get_eager_loading(field, f'{path}__', joined)
+            select_related += nested[0]
+            prefetch_related += nested[1]
+            columns += nested[2]
+        else:
+            columns.append(path)
+
+    return select_related, prefetch_related, columns if joined else []
+
 
 class AreaOfResearchSerializer(ModelSerializer):
     class Meta:
@@ -77,15 +157,56 @@ class UserProfileSerializer(ModelSerializer):
 
 
 class CanadianCommonCvSerializer(ModelSerializer):
+    """
+    Renders the fields selected by the selection of the context, see get_selection. Every field by default.
+    """
+
     identification = IdentificationSerializer(read_only=True)
     employment = EmploymentSerializer(read_only=True)
     user_profile = UserProfileSerializer(read_only=True)
 
+    # Fields of the user profile rendered with the fields of the CV
+    user_profile_fields = ('research_description', 'research_interests')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        select_fields(self, self.get_selection(self.context.get('selection', ALL)))
+
+    @classmethod
+    def get_selection(cls, selection):
+        """
+        :param selection: selection of the rendered fields
+        :return: selection of the serializer fields
+        """
+        if selection is ALL:
+            return ALL
+
+        selection = dict(selection)
+        user_profile = {name: selection.pop(name) for name in cls.user_profile_fields if name in selection}
+        if OWN_FIELDS in selection:
+            user_profile[OWN_FIELDS] = {}
+        if user_profile:
+            selection['user_profile'] = user_profile
+        return selection
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, selection=ALL):
+        """
+        Loads the related rows the serializer renders along with the CVs, so that a page costs the same number of
+        queries whatever its size. Only the selected columns are loaded when fields are selected.
+        :param queryset: CanadianCommonCv queryset
+        :param selection: see get_selection
+        :return:
+        """
+        select_related, prefetch_related, columns = get_eager_loading(cls(context={'selection': selection}))
+        queryset = queryset.select_related(*select_related).prefetch_related(*prefetch_related)
+        return queryset if selection is ALL else queryset.only(*columns)
+
     def to_representation(self, instance):
         ret = super().to_representation(instance)
-        ret['research_description'] = ret['user_profile']['research_description']
-        ret['research_interests'] = ret['user_profile']['research_interests']
-        ret.pop('user_profile')
+        user_profile = ret.pop('user_profile', None)
+        if user_profile is not None:
+            ret.update(user_profile)
         return ret
 
     class Meta:
@@ -95,3 +216,21 @@ class CanadianCommonCvSerializer(ModelSerializer):
             'employment',
             'user_profile'
         ]
+
+
+class IngestionJobSerializer(ModelSerializer):
+    class Meta:
+        model = IngestionJob
+        fields = [
+            'id',
+            'name',
+            'status',
+            'update',
+            'attempts',
+            'created_at',
+            'started_at',
+            'finished_at',
+            'ccv_ids',
+            'messages',
+            'error'
+        ]
@@ -0,0 +1,52 @@
+import gzip
+import io
+import zipfile
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZIP_MAGIC = b'PK\x03\x04'
+
+# Extensions of the members of a zip archive which are read, others (readme, manifest...) are skipped
+MEMBER_EXTENSIONS = ('.xml', '.xml.gz')
+
+STDIN = '-'
+
+
+def iter_documents(file_path: str, stdin=None):
+    """
+    Opens the CCV xml documents of a file: a plain or gzip compressed xml file, or a zip archive of them. Documents
+    are decompressed while they are read, without being written to disk
+    :param file_path: path of the file, or '-' to read it from stdin
+    :param stdin: binary stream read for '-'
+    :return: generator of (name, seekable binary file object), each one is closed once the next one is opened
+    """
+    if file_path == STDIN:
+        # The documents are read more than once, and stdin can't be rewound: it is kept in memory
+        source, name = io.BytesIO(stdin.read()), '<stdin>'
+    else:
+        source, name = open(file_path, 'rb'), file_path
+
+    with source:
+        yield from iter_file_documents(source, name)
+
+
+def iter_file_documents(source, name: str):
+    """
+    :param source: seekable binary file object
+    :param name: name of the file in the errors and results
+    :return: generator of (name, seekable binary file object) of the documents of the file, in the order of the archive
+    """
+    magic = source.read(len(ZIP_MAGIC))
+    source.seek(0)
+
+    if magic.startswith(GZIP_MAGIC):
+        with gzip.GzipFile(fileobj=source) as document:
+            yield name, document
+    elif magic == ZIP_MAGIC:
+        with zipfile.ZipFile(source) as archive:
+            for member in archive.infolist():
+                if member.is_dir() or not member.filename.lower().endswith(MEMBER_EXTENSIONS):
+                    continue
+                with archive.open(member) as document:
+                    yield from iter_file_documents(document, f"{name}:{member.filename}")
+    else:
+        yield name, source
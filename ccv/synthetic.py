@@ -0,0 +1,203 @@
+import datetime
+import random
+import re
+import xml.etree.ElementTree as ET
+
+NAMESPACE = 'http://www.cihr-irsc.gc.ca/generic-cv/1.0.0'
+ET.register_namespace('generic-cv', NAMESPACE)
+
+# strftime directives of the Java date formats of the CCV values
+DATE_DIRECTIVES = {'yyyy': '%Y', 'MM': '%m', 'dd': '%d', 'mm': '%M', 'ss': '%S'}
+DATE_FORMAT = re.compile('|'.join(DATE_DIRECTIVES))
+
+FIRST_DATE = datetime.datetime(1960, 1, 1)
+LAST_DATE = datetime.datetime(2020, 12, 31)
+
+
+def random_id(rng: random.Random) -> str:
+    return '%032x' % rng.getrandbits(128)
+
+
+def random_date(rng: random.Random, first: datetime.datetime = FIRST_DATE,
+                last: datetime.datetime = LAST_DATE) -> datetime.datetime:
+    """
+    :return: a date and time between first, included, and last, excluded
+    """
+    return first + datetime.timedelta(seconds=rng.randrange(int((last - first).total_seconds())))
+
+
+class FieldTemplate:
+    """
+    What the fields of a label look like in the sample CVs: the element holding their value, how often they are
+    filled in, and the values they were filled in with
+    """
+
+    def __init__(self, field_id: str, label: str):
+        self.id = field_id
+        self.label = label
+        self.kind = None
+        self.attributes = {}
+        self.values = []
+        self.count = 0
+
+    def observe(self, field) -> None:
+        self.count += 1
+        for child in field:
+            if child.tag == 'lov' and child.text and child.text.strip():
+                self.kind, self.attributes = 'lov', {}
+                self.values.append((child.get('id'), child.text.strip()))
+            elif child.tag == 'value' and ''.join(child.itertext()).strip():
+                self.kind, self.attributes = 'value', dict(child.attrib)
+                self.values.append(' '.join(''.join(child.itertext()).split()))
+            elif child.tag == 'refTable':
+                self.kind, self.attributes = 'refTable', {}
+                self.values.append(child)
+            else:
+                continue
+            return
+
+    def generate_text(self, rng: random.Random) -> str:
+        """
+        :return: words of the observed values, no longer than one of them so that it fits in its column
+        """
+        model = rng.choice(self.values)
+        words = [rng.choice(rng.choice(self.values).split()) for _ in model.split()]
+        return ' '.join(words)[:len(model)].strip() or model
+
+    def generate_value(self, rng: random.Random) -> str:
+        if 'format' in self.attributes:
+            return random_date(rng).strftime(DATE_FORMAT.sub(lambda m: DATE_DIRECTIVES[m.group()],
+                                                             self.attributes['format']))
+        if self.attributes.get('type') == 'Number' and all(value.isdigit() for value in self.values):
+            numbers = [int(value) for value in self.values]
+            return str(rng.randint(min(numbers), max(numbers)))
+        return self.generate_text(rng)
+
+    def generate(self, rng: random.Random, parent) -> None:
+        """
+        Adds a field to a section element, filled in as often as the observed fields
+        :param rng:
+        :param parent: section element
+        :return:
+        """
+        field = ET.SubElement(parent, 'field', id=self.id, label=self.label)
+        if not self.values or rng.random() * self.count >= len(self.values):
+            return
+
+        if self.kind == 'lov':
+            lov_id, text = rng.choice(self.values)
+            ET.SubElement(field, 'lov', id=lov_id).text = text
+        elif self.kind == 'refTable':
+            field.append(rng.choice(self.values))
+        else:
+            text = self.generate_value(rng)
+            ET.SubElement(field, 'value', self.attributes).text = text
+            if self.attributes.get('type') == 'Bilingual':
+                ET.SubElement(ET.SubElement(field, 'bilingual'), 'english').text = text
+
+
+class SectionTemplate:
+    """
+    What the sections of a label look like in the sample CVs: their fields, their subsections and how many records
+    of them there are per record of their parent
+    """
+
+    def __init__(self, section_id: str = None, label: str = None):
+        self.id = section_id
+        self.label = label
+        self.record = False
+        self.fields = {}
+        self.sections = {}
+        self.count = 0
+
+    def observe(self, section) -> None:
+        """
+        Adds a section of the samples to the template
+        :param section: section element, or root element of a CV
+        :return:
+        """
+        self.count += 1
+        self.record = self.record or section.get('recordId') is not None
+        for child in section:
+            label = child.get('label')
+            if child.tag == 'field':
+                self.fields.setdefault(label, FieldTemplate(child.get('id'), label)).observe(child)
+            elif child.tag == 'section':
+                self.sections.setdefault(label, SectionTemplate(child.get('id'), label)).observe(child)
+
+    def get_count(self, rng: random.Random, parent_count: int, counts: dict) -> int:
+        """
+        :return: number of records to generate for a record of the parent section, the number of counts for its label
+            if given, otherwise as many as observed on average
+        """
+        if self.label in counts:
+            return counts[self.label]
+        whole, fraction = divmod(self.count / parent_count, 1)
+        return int(whole) + (rng.random() < fraction)
+
+    def generate(self, rng: random.Random, parent, counts: dict) -> None:
+        """
+        Adds the records of the section to a parent element
+        :param rng:
+        :param parent: element of a record of the parent section
+        :param counts: number of records per parent record, by label
+        :return:
+        """
+        element = ET.SubElement(parent, 'section', id=self.id, label=self.label)
+        if self.record:
+            element.set('recordId', random_id(rng))
+        for field in self.fields.values():
+            field.generate(rng, element)
+        self.generate_sections(rng, element, counts)
+
+    def generate_sections(self, rng: random.Random, element, counts: dict) -> None:
+        for section in self.sections.values():
+            for _ in range(section.get_count(rng, self.count, counts)):
+                section.generate(rng, element, counts)
+
+
+def observe(file_paths: list) -> SectionTemplate:
+    """
+    :param file_paths: sample CCV xml files
+    :return: template of the root of the CVs, whose sections are the top level sections
+    """
+    template = SectionTemplate()
+    for file_path in file_paths:
+        template.observe(ET.parse(file_path).getroot())
+    return template
+
+
+class CcvGenerator:
+    """
+    Generates CCV xml documents shaped like the samples the template was observed on, with random values drawn from
+    theirs. A document only depends on the seed and its index, so corpora can be generated again, or in parallel.
+    """
+
+    def __init__(self, template: SectionTemplate, seed: int = 0, counts: dict = None):
+        """
+        :param template: see observe
+        :param seed:
+        :param counts: number of records of the sections of a label per record of their parent, instead of the
+            observed average, e.g. {'Journal Articles': 50, 'Degrees': 3}
+        """
+        self.template = template
+        self.seed = seed
+        self.counts = counts or {}
+
+    def generate(self, index: int) -> ET.ElementTree:
+        """
+        :param index: index of the CV in the corpus
+        :return: xml document of the CV
+        """
+        rng = random.Random(f'{self.seed}:{index}')
+        generated = random_date(rng, datetime.datetime(2015, 1, 1), datetime.datetime(2021, 1, 1))
+        root = ET.Element(f'{{{NAMESPACE}}}generic-cv', lang='en',
+                          dateTimeGenerated=generated.strftime('%Y-%m-%d %H:%M:%S'))
+        ET.SubElement(root, 'submission', dateTimeSubmitted=generated.strftime('%Y-%m-%d %H:%M:%S'),
+                      confirmationNumber=str(rng.randint(1000000, 9999999)),
+                      ccvIdentifier=f'synthetic-{self.seed}-{index}', templateName='Full CV')
+        self.template.generate_sections(rng, root, self.counts)
+        return ET.ElementTree(root)
+
+    def write(self, index: int, file_path: str) -> None:
+        self.generate(index).write(file_path, encoding='UTF-8', xml_declaration=True)
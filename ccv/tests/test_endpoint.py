@@ -1,13 +1,30 @@
+import gzip
+import json
+import os
 import sys
+import tempfile
 from io import StringIO
+from unittest import mock
 
 import pytest
+from django.contrib.auth.models import User
 from django.core import management
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from .. import cache, jobs, search
+from ..db import schedule_health_checks
+from ..iteration import iter_chunks
 from ..models.base import CanadianCommonCv
+from ..models.contribution import Journal, Presentation
+from ..models.ingestion import IngestionJob
+from ..models.personal_information import Identification
+from ..models.search import SearchDocument
 from ..serializers import CanadianCommonCvSerializer
 
 client = APIClient()
@@ -42,6 +59,9 @@ class TestParser(TestCase):
 
         return output
 
+    def setUp(self) -> None:
+        cache.get_cache().clear()
+
     def test_ccv_endpoint(self):
         """
         It tests the /ccv endpoint
@@ -50,7 +70,464 @@ class TestParser(TestCase):
         response = client.get('/ccv')
 
         # getting data from db
-        ccvs = CanadianCommonCv.objects.all()
-        ccv_serializer = CanadianCommonCvSerializer(ccvs, many=True)
+        ccvs = CanadianCommonCvSerializer.setup_eager_loading(CanadianCommonCv.objects.all())
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == [
+            data for chunk in iter_chunks(ccvs) for data in CanadianCommonCvSerializer(chunk, many=True).data
+        ]
+
+    def test_ccv_endpoint_query_count(self):
+        """
+        A page of the /ccv endpoint costs the same number of queries whatever the number of CVs on it, and only the
+        validator and the ids of the page once they are cached
+        """
+        with CaptureQueriesContext(connection) as single:
+            client.get('/ccv')
+
+        for filepath in ("sample_ccv/ccv_sample_1.xml", "sample_ccv/ccv_sample_2.xml",
+                         "sample_ccv/ccv_sample_harshit.xml"):
+            self.parse_ccv(filepath)
+
+        with CaptureQueriesContext(connection) as page:
+            response = client.get('/ccv')
+
+        assert len(response.data['results']) == 4
+        assert len(page) == len(single)
+
+        with CaptureQueriesContext(connection) as cached:
+            assert client.get('/ccv').data == response.data
+        assert len(cached) == 2
+
+    def test_ccv_endpoint_cursor_pagination(self):
+        """
+        Following the next links of the /ccv endpoint walks through every CV once, newest first, each page costing the
+        same number of queries
+        """
+        for filepath in ("sample_ccv/ccv_sample_1.xml", "sample_ccv/ccv_sample_2.xml"):
+            self.parse_ccv(filepath)
+        identifications = list(CanadianCommonCv.objects.values_list('identification__family_name', flat=True))
+
+        family_names = []
+        query_counts = set()
+        url = '/ccv?page_size=1'
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            assert not any('OFFSET' in query['sql'] for query in queries.captured_queries)
+            query_counts.add(len(queries))
+            assert len(response.data['results']) == 1
+            family_names += [ccv['identification']['family_name'] for ccv in response.data['results']]
+            url = response.data['next']
+
+        assert family_names == identifications
+        assert len(query_counts) == 1
+
+    @override_settings(CCV_MAX_PAGE_SIZE=2)
+    def test_ccv_endpoint_page_size_is_capped(self):
+        for filepath in ("sample_ccv/ccv_sample_1.xml", "sample_ccv/ccv_sample_2.xml"):
+            self.parse_ccv(filepath)
+
+        response = client.get('/ccv?page_size=50')
+
+        assert len(response.data['results']) == 2
+
+    def test_ccv_detail_endpoint(self):
+        """
+        It tests the /ccv/<id> endpoint, by id and by _id
+        """
+        ccv = CanadianCommonCv.objects.get(id=self.id)
+        data = CanadianCommonCvSerializer(ccv).data
+
+        for lookup in (ccv.id, ccv._id):
+            response = client.get(f'/ccv/{lookup}')
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data == data
+            assert response['Last-Modified']
+
+            response = client.get(f'/ccv/{lookup}', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        for lookup in (ccv.id + 1, 'not-a-cv', '00000000-0000-0000-0000-000000000000', '²', '١٢'):
+            assert client.get(f'/ccv/{lookup}').status_code == status.HTTP_404_NOT_FOUND
+
+    def test_ccv_endpoints_field_selection(self):
+        """
+        Selecting fields renders only them, and loads only their columns
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(f'/ccv/{self.id}?fields=identification.first_name,identification.family_name')
+
+        identification = Identification.objects.get(ccv_id=self.id)
+        assert response.data == {
+            'identification': {'family_name': identification.family_name, 'first_name': identification.first_name}
+        }
+        # The validators, then the CV
+        assert len(queries) == 2
+        assert 'ccv_email' not in queries.captured_queries[1]['sql']
+        assert '"ccv_identification"."title"' not in queries.captured_queries[1]['sql']
+
+        response = client.get('/ccv?fields=research_description&expand=identification.email')
+        data = CanadianCommonCvSerializer(CanadianCommonCv.objects.get(id=self.id)).data
+        assert response.data['results'] == [{
+            'identification': {'email': data['identification']['email']},
+            'research_description': data['research_description'],
+        }]
+
+    def test_ccv_search_endpoint(self):
+        """
+        The /ccv/search endpoint finds CVs by the words of their names, research interests and publications
+        """
+        other_id = self.parse_ccv("sample_ccv/ccv_sample_2.xml")
+        family_name = Identification.objects.get(ccv_id=self.id).family_name
+
+        response = client.get(f'/ccv/search?q={family_name}')
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['results'] == ccv_serializer.data
+        assert response.data['results'] == [CanadianCommonCvSerializer(CanadianCommonCv.objects.get(id=self.id)).data]
+
+        # Stemmed: ethical matches ethics
+        assert list(search.search(CanadianCommonCv.objects.all(), 'ethical').values_list('id', flat=True)) == [self.id]
+        # Ranked: genomics is all over the other CV, this one only mentions it
+        response = client.get('/ccv/search?q=genomics&fields=identification.family_name')
+        assert [ccv['identification']['family_name'] for ccv in response.data['results']] == [
+            Identification.objects.get(ccv_id=other_id).family_name, family_name
+        ]
+
+        for text in ('', 'xylophonist'):
+            assert client.get(f'/ccv/search?q={text}').data['results'] == []
+
+    def test_update_search_documents(self):
+        SearchDocument.objects.all().delete()
+        assert not search.search(CanadianCommonCv.objects.all(), 'ethics').exists()
+
+        output = StringIO()
+        management.call_command('update_search_documents', stdout=output)
+        assert output.getvalue().strip() == "1 search documents updated"
+        assert search.search(CanadianCommonCv.objects.all(), 'ethics').exists()
+
+    def test_ccv_endpoint_filters(self):
+        """
+        The structured filters of /ccv keep the CVs having a matching row, repeated values match any of them
+        """
+        self.parse_ccv("sample_ccv/ccv_sample_2.xml")
+
+        def get_family_names(query: str) -> set:
+            response = client.get(f'/ccv?{query}&fields=identification.family_name')
+            assert response.status_code == status.HTTP_200_OK
+            return {ccv['identification']['family_name'] for ccv in response.data['results']}
+
+        assert get_family_names('research_area=Genomics') == {'Bourque'}
+        assert get_family_names('sector=Human+and+social+sciences') == {'Joly'}
+        assert get_family_names('discipline=Law') == {'Joly'}
+        assert get_family_names('discipline=Law&discipline=Applied+Mathematics') == {'Joly', 'Bourque'}
+        assert get_family_names('organization=National+University+of+Singapore') == {'Bourque'}
+        assert get_family_names('degree_type=Post-doctorate') == {'Bourque'}
+        assert get_family_names('degree_type=Certificate&research_area=Genomics') == set()
+        assert get_family_names('active_between=2000-01-01,2000-12-31') == {'Joly'}
+        assert get_family_names('active_between=,2003-01-01') == {'Joly'}
+        assert get_family_names('active_between=2019-08-01,') == {'Joly', 'Bourque'}
+
+        assert client.get('/ccv?active_between=2019-13-01,').status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_ccv_export(self):
+        """
+        The export_ccv command and the /ccv/export.ndjson endpoint write one JSON document per CV, reading the CVs
+        by chunks
+        """
+        self.parse_ccv("sample_ccv/ccv_sample_2.xml")
+        expected = [
+            json.loads(json.dumps(CanadianCommonCvSerializer(ccv).data))
+            for ccv in CanadianCommonCv.objects.order_by('id')
+        ]
+
+        output = StringIO()
+        management.call_command('export_ccv', chunk_size=1, stdout=output)
+        assert [json.loads(line) for line in output.getvalue().splitlines()] == expected
+
+        response = client.get('/ccv/export.ndjson?fields=identification.family_name')
+        assert response.streaming
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()] == [
+            {'identification': {'family_name': ccv['identification']['family_name']}} for ccv in expected
+        ]
+
+    def test_iter_chunks(self):
+        """
+        iter_chunks reads the rows from a server side cursor, declared by the first chunk, and runs the prefetches of
+        each chunk, which then costs the same number of queries
+        """
+        self.parse_ccv("sample_ccv/ccv_sample_2.xml")
+        queryset = CanadianCommonCvSerializer.setup_eager_loading(CanadianCommonCv.objects.order_by('id'))
+
+        ids, statements = [], []
+        chunks = iter_chunks(queryset, 1)
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            ids += [ccv.id for ccv in chunk]
+            statements.append([query['sql'].split()[0] for query in queries.captured_queries])
+
+        assert ids == list(CanadianCommonCv.objects.order_by('id').values_list('id', flat=True))
+        assert statements[0][0] == 'DECLARE'
+        assert statements[0][1:] == statements[1] == ['SELECT'] * len(statements[1])
+
+    def test_iter_chunks_without_server_side_cursors(self):
+        """
+        Behind a pooler in transaction mode, iter_chunks queries each chunk by id instead of declaring a cursor
+        """
+        self.parse_ccv("sample_ccv/ccv_sample_2.xml")
+        queryset = CanadianCommonCvSerializer.setup_eager_loading(CanadianCommonCv.objects.order_by('-id'))
+
+        connection.settings_dict['DISABLE_SERVER_SIDE_CURSORS'] = True
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                chunks = list(iter_chunks(queryset, 1))
+        finally:
+            connection.settings_dict['DISABLE_SERVER_SIDE_CURSORS'] = False
+
+        assert [ccv.id for chunk in chunks for ccv in chunk] == \
+            list(CanadianCommonCv.objects.order_by('-id').values_list('id', flat=True))
+        assert all(chunk[0].identification for chunk in chunks)
+        assert 'DECLARE' not in {query['sql'].split()[0] for query in queries.captured_queries}
+
+    def test_contribution_export(self):
+        """
+        The export_contributions command writes a typed Parquet file per contribution model, with the id of the CV
+        of each row, in row groups of the chunk size
+        """
+        pq = pytest.importorskip('pyarrow.parquet')
+        with tempfile.TemporaryDirectory() as output_dir:
+            management.call_command('export_contributions', output_dir, chunk_size=2,
+                                    models=['journal', 'presentation', 'patent'], stdout=StringIO())
+            assert sorted(os.listdir(output_dir)) == [
+                'journal.parquet', 'organization.parquet', 'patent.parquet', 'presentation.parquet'
+            ]
+
+            journals = pq.ParquetFile(os.path.join(output_dir, 'journal.parquet'))
+            assert journals.schema_arrow.names[:2] == ['ccv_id', 'id']
+            assert str(journals.schema_arrow.field('is_refereed').type) == 'bool'
+            assert str(journals.schema_arrow.field('created_at').type) == 'timestamp[us, tz=UTC]'
+            assert journals.num_row_groups == -(-Journal.objects.count() // 2)
+            table = journals.read(columns=['ccv_id', 'id', 'title'])
+            assert table.to_pylist() == [
+                {'ccv_id': self.id, 'id': id, 'title': title}
+                for id, title in Journal.objects.order_by('id').values_list('id', 'title')
+            ]
+
+            presentations = pq.read_table(os.path.join(output_dir, 'presentation.parquet'))
+            assert presentations.num_rows == Presentation.objects.count()
+            assert set(presentations.column('ccv_id').to_pylist()) == {self.id}
+            assert pq.read_table(os.path.join(output_dir, 'patent.parquet')).num_rows == 0
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRepresentationCache(TransactionTestCase):
+
+    def setUp(self) -> None:
+        cache.get_cache().clear()
+
+    @staticmethod
+    def get_family_names() -> list:
+        return [ccv['identification']['family_name'] for ccv in client.get('/ccv').data['results']]
+
+    @staticmethod
+    def ingest(filepath: str, date_time_generated: str, family_name: str, *args) -> None:
+        """
+        Ingests sample 3 with another generation date and family name
+        """
+        with open("sample_ccv/ccv_sample_3.xml", encoding="utf8") as xml_file:
+            xml = xml_file.read().replace('dateTimeGenerated="2020-05-25 14:47:41"',
+                                          f'dateTimeGenerated="{date_time_generated}"')
+        with open(filepath, 'w', encoding="utf8") as xml_file:
+            xml_file.write(xml.replace('<value type="String">Joly</value>',
+                                       f'<value type="String">{family_name}</value>'))
+
+        management.call_command('parse_ccv', filepath, *args, stdout=StringIO(), stderr=StringIO())
+
+    def test_ingestion_and_deletion_invalidate_the_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'ccv.xml')
+
+            self.ingest(filepath, "2020-05-25 14:47:41", "Joly")
+            assert self.get_family_names() == ["Joly"]
+
+            self.ingest(filepath, "2020-06-01 08:00:00", "Replaced")
+            assert self.get_family_names() == ["Replaced"]
+
+            self.ingest(filepath, "2020-06-02 08:00:00", "Updated", '--update')
+            assert self.get_family_names() == ["Updated"]
+
+        CanadianCommonCv.objects.all().delete()
+        assert self.get_family_names() == []
+
+    def test_stale_representation_is_not_served(self) -> None:
+        """
+        A request which read a CV before an ingestion and caches it after the commit caches it under the previous
+        updated_at of the CV, which isn't read anymore
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'ccv.xml')
+            self.ingest(filepath, "2020-05-25 14:47:41", "Joly")
+            state = CanadianCommonCv.objects.values_list('id', 'updated_at').get()
+            stale = CanadianCommonCvSerializer(CanadianCommonCv.objects.get()).data
+
+            self.ingest(filepath, "2020-06-01 08:00:00", "Replaced")
+            cache.get_cache().set(cache.get_key(*state), stale)
+
+        assert self.get_family_names() == ["Replaced"]
+        assert client.get(f'/ccv/{state[0]}').data['identification']['family_name'] == "Replaced"
+
+    def test_ccv_endpoint_conditional_get(self) -> None:
+        """
+        The /ccv endpoint answers 304 with a single query until a CV is ingested or deleted, by this process or
+        another one, whose ingestions don't reach the cache of this one
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'ccv.xml')
+            self.ingest(filepath, "2020-05-25 14:47:41", "Joly")
+            etag = client.get('/ccv')['ETag']
+
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get('/ccv', HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert len(queries) == 1
+
+            self.ingest(filepath, "2020-06-01 08:00:00", "Replaced")
+            response = client.get('/ccv', HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == status.HTTP_200_OK
+            assert response['ETag'] != etag
+
+        # An ingestion by another process, which doesn't invalidate the cache of this one
+        etag = response['ETag']
+        CanadianCommonCv.objects.update(updated_at=timezone.now())
+        response = client.get('/ccv', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+        etag = response['ETag']
+        CanadianCommonCv.objects.all().delete()
+        response = client.get('/ccv', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+
+@pytest.mark.django_db
+class TestIngestion(TestCase):
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('curator', is_staff=True))
+
+    def upload(self, name: str, content: bytes, **data):
+        return self.client.post('/ccv/ingest', {'file': SimpleUploadedFile(name, content), **data}, format='multipart')
+
+    def test_ingest_endpoint(self) -> None:
+        with open("sample_ccv/ccv_sample_3.xml", 'rb') as xml_file:
+            response = self.upload('ccv_sample_3.xml.gz', gzip.compress(xml_file.read()))
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data['status'] == IngestionJob.QUEUED
+        assert response['Location'] == response.data['url']
+
+        output = StringIO()
+        management.call_command('ingest_worker', burst=True, stdout=output)
+        assert output.getvalue() == "1 jobs run\n"
+
+        job = self.client.get(response['Location']).data
+        assert job['status'] == IngestionJob.DONE
+        assert job['attempts'] == 1
+        assert job['ccv_ids'] == list(CanadianCommonCv.objects.values_list('id', flat=True))
+        assert IngestionJob.objects.get(pk=job['id']).document is None
+
+    def test_failed_job(self) -> None:
+        job_id = self.upload('ccv.xml', b'<not a ccv').data['id']
+        assert jobs.run_next_job()
+        assert not jobs.run_next_job()
+
+        job = self.client.get(f'/ccv/ingest/{job_id}').data
+        assert job['status'] == IngestionJob.FAILED
+        assert job['error']
+        assert job['ccv_ids'] == []
+
+    def test_stale_jobs_are_queued_again(self) -> None:
+        job = jobs.enqueue(b'<not a ccv')
+        assert jobs.claim_job().pk == job.pk
+        assert jobs.claim_job() is None
+
+        with override_settings(CCV_INGEST_JOB_TIMEOUT=-1, CCV_INGEST_MAX_ATTEMPTS=2):
+            assert jobs.requeue_stale_jobs() == 1
+            assert jobs.claim_job().attempts == 2
+
+            # The worker died again
+            assert jobs.requeue_stale_jobs() == 0
+        job.refresh_from_db()
+        assert job.status == IngestionJob.FAILED
+        assert job.error
+        assert jobs.claim_job() is None
+
+    def test_ingest_endpoint_limits(self) -> None:
+        assert self.client.post('/ccv/ingest', {}, format='multipart').status_code == status.HTTP_400_BAD_REQUEST
+        with override_settings(CCV_INGEST_MAX_SIZE=4):
+            assert self.upload('ccv.xml', b'<ccv/>').status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        with override_settings(CCV_INGEST_MAX_QUEUED=1):
+            assert self.upload('ccv.xml', b'<ccv/>').status_code == status.HTTP_202_ACCEPTED
+            response = self.upload('ccv.xml', b'<ccv/>')
+            assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+            assert response['Retry-After']
+
+        self.client.force_authenticate(User.objects.create_user('visitor'))
+        assert self.upload('ccv.xml', b'<ccv/>').status_code == status.HTTP_403_FORBIDDEN
+        self.client.force_authenticate(None)
+        response = self.upload('ccv.xml', b'<ccv/>')
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConnections(TransactionTestCase):
+
+    def test_dropped_connection_is_replaced(self) -> None:
+        """
+        A persistent connection which the server dropped is replaced when the next request uses it
+        """
+        assert connection.settings_dict['CONN_HEALTH_CHECKS']
+        assert client.get('/ccv').status_code == status.HTTP_200_OK
+        pid = connection.connection.get_backend_pid()
+
+        other = connection.get_new_connection(connection.get_connection_params())
+        try:
+            with other.cursor() as cursor:
+                cursor.execute("SELECT pg_terminate_backend(%s)", [pid])
+                while True:
+                    cursor.execute("SELECT count(*) FROM pg_stat_activity WHERE pid = %s", [pid])
+                    if not cursor.fetchone()[0]:
+                        break
+        finally:
+            other.close()
+
+        assert client.get('/ccv').status_code == status.HTTP_200_OK
+        assert connection.connection.get_backend_pid() != pid
+
+    def test_connection_is_checked_once_per_request(self) -> None:
+        """
+        The connection is checked on its first use in a request, not when the request starts
+        """
+        connection.ensure_connection()
+        with mock.patch.object(connection, 'is_usable', wraps=connection.is_usable) as is_usable:
+            schedule_health_checks()
+            assert not is_usable.called
+            CanadianCommonCv.objects.count()
+            CanadianCommonCv.objects.count()
+            assert is_usable.call_count == 1
+
+    @override_settings(PG_DB_POOL_MODE='transaction', PG_DB_POOL_SIZE=8, PG_DB_POOL_MAX_CLIENTS=64)
+    def test_pgbouncer_config(self) -> None:
+        """
+        The configuration of the pooler follows the settings
+        """
+        output = StringIO()
+        management.call_command('pgbouncer_config', stdout=output)
+        config = dict(line.split(' = ', 1) for line in output.getvalue().splitlines() if ' = ' in line)
+        assert config['pool_mode'] == 'transaction'
+        assert config['default_pool_size'] == '8'
+        assert config['max_client_conn'] == '64'
+        assert config[connection.settings_dict['NAME']].endswith(f"dbname={connection.settings_dict['NAME']}")
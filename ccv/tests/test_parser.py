@@ -1,17 +1,35 @@
+import copy
+import datetime
+import gzip
+import json
+import os
+import re
 import sys
-from io import StringIO
+import tempfile
+import xml.etree.ElementTree as ET
+import zipfile
+from io import BytesIO, StringIO
 
 import pytest
 from django.core import management
-from django.test import TestCase
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 
+from .. import synthetic
 from ..constants.test_constants import SAMPLE_TEST_CONSTANTS
-from ..models.base import CanadianCommonCv
+from ..converters import DATE, YEAR_MONTH, ConversionError, boolean, integer
+from ..lookup import OrganizationLookup
+from ..models.base import CanadianCommonCv, Organization
 from ..models.personal_information import Identification
-from ..models.education import Credential, Degree
+from ..models.contribution import Journal
+from ..models.education import Credential, Degree, Supervisor
 from ..models.employment import Employment, AcademicWorkExperience, NonAcademicWorkExperience
-from ..models.recognitions import Recognition, CommitteeMembership, Membership, MostSignificantContribution
+from ..models.recognitions import Recognition, CommitteeMembership, FundingSource, Membership, \
+    MostSignificantContribution
 from ..models.user_profile import UserProfile, ResearchCentre, DisciplineTrainedIn
+from ..reader import iter_organizations
 from ..utils import normalize_date
 
 
@@ -87,6 +105,9 @@ class TestParser(TestCase):
             assert normalize_date(degree.end_date, '%Y-%m-%d') == sample_data[index]['end_date']
             assert degree.phd_without_masters == sample_data[index]['phd_without_masters']
 
+        # Supervisors are nested in the degrees
+        assert Supervisor.objects.filter(degree__education__ccv__id=self.id).exists()
+
         credentials = Credential.objects.filter(education__ccv__id=self.id).order_by('id')
         sample_data = SAMPLE_TEST_CONSTANTS['education']['credentials']
 
@@ -216,3 +237,553 @@ class TestParser(TestCase):
             assert normalize_date(non_academic_work_experience.end_date, '%Y-%m-%d') == sample_data[index]['end_date']
             assert non_academic_work_experience.work_description == sample_data[index]['work_description']
             assert non_academic_work_experience.unit_division == sample_data[index]['unit_division']
+
+    def test_field_mappings(self) -> None:
+        """
+        Fields whose label or date format used to be mistyped, filled in a copy of ccv_sample_harshit.xml
+        """
+        with open("sample_ccv/ccv_sample_harshit.xml", encoding="utf8") as xml_file:
+            xml = xml_file.read()
+        xml = xml.replace('label="Permanent Residency Start Date"><value format="yyyy-MM-dd" type="Date"></value>',
+                          'label="Permanent Residency Start Date"><value format="yyyy-MM-dd" type="Date">2019-05-12'
+                          '</value>')
+        # Fills in the first academic work experience
+        head, tail = xml.split('label="Academic Work Experience"', 1)
+        for label, value in [('Department', 'Human Genetics'), ('Tenure Start Date', '2015/07'),
+                             ('Tenure End Date', '2019/05')]:
+            tail = re.sub(f'(label="{label}"><value[^>]*>)(</value>)', rf'\g<1>{value}\2', tail, count=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'ccv.xml')
+            with open(file_path, 'w', encoding="utf8") as xml_file:
+                xml_file.write(head + 'label="Academic Work Experience"' + tail)
+            ccv = CanadianCommonCv.objects.get(id=self.parse_ccv(file_path))
+
+        assert ccv.identification.permanent_residency_start_date == datetime.date(2019, 5, 12)
+        experience = AcademicWorkExperience.objects.get(employment__ccv=ccv, department='Human Genetics')
+        assert experience.tenure_start_date == datetime.date(2015, 7, 1)
+        assert experience.tenure_end_date == datetime.date(2019, 5, 1)
+        assert 'United States dollar' in FundingSource.objects.filter(research_funding_history__ccv=ccv) \
+            .values_list('total_funding_currency', flat=True)
+
+
+@pytest.mark.django_db
+class TestBulkParser(TestParser):
+    """Runs the parser tests against a ccv ingested with --bulk"""
+
+    @staticmethod
+    def parse_ccv(filepath: str) -> int:
+        """
+        it calls the parse_ccv django custom command in bulk mode
+        :param filepath: Filepath of the ccv xml file
+        :return: id of the ingested ccv
+        """
+
+        output = StringIO()
+        management.call_command('parse_ccv', filepath, '--bulk', stdout=output)
+        sys.stderr.write(f'{output.getvalue()}')
+        output = int(output.getvalue().strip())
+
+        return output
+
+    def test_statement_count(self) -> None:
+        """
+        Bulk mode writes each model with a single statement instead of one per row
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.parse_ccv("sample_ccv/ccv_sample_3.xml")
+
+        assert len(queries) < 60
+
+
+INVALID_DEGREE_CCV = """<?xml version="1.0" encoding="UTF-8"?>
+<generic-cv:generic-cv xmlns:generic-cv="http://www.cihr-irsc.gc.ca/generic-cv/1.0.0" lang="en">
+    <section id="f589cbc028c64fdaa783da01647e5e3c" label="Personal Information">
+        <section id="2687e70e5d45487c93a8a02626543f64" label="Identification">
+            <field label="Title"><lov id="00000000000000000000000000000001">Professor</lov></field>
+            <field label="Family Name"><value type="String">Joly</value></field>
+            <field label="First Name"><value type="String">Yann</value></field>
+            <field label="Middle Name"/>
+            <field label="Previous Family Name"/>
+            <field label="Previous First Name"/>
+            <field label="Date of Birth"><value format="MM/dd" type="MonthDay">7/04</value></field>
+            <field label="Sex"><lov id="00000000000000000000000000000001">Male</lov></field>
+            <field label="Designated Group"/>
+            <field label="Correspondence language"><lov id="00000000000000000000000000000001">French</lov></field>
+            <field label="Canadian Residency Status"/>
+            <field label="Applied for Permanent Residency?"/>
+            <field label="Permanent Residency Start Date"/>
+        </section>
+    </section>
+    <section id="0d82220f95f043e0bc9608bbb6bf413a" label="Education">
+        <section id="aee5a225a504442fb83f716235cfb587" label="Degrees">
+            <field label="Degree Type"><lov id="00000000000000000000000000000001">%s</lov></field>
+            <field label="Degree Name"/>
+            <field label="Specialization"/>
+            <field label="Thesis Title"/>
+            <field label="Degree Status"/>
+            <field label="Degree Start Date"/>
+            <field label="Degree Received Date"/>
+            <field label="Degree Expected Date"/>
+            <field label="Transferred to PhD without completing Masters?"/>
+        </section>
+    </section>
+</generic-cv:generic-cv>
+""" % ('Doctorate' * 10)
+
+
+@pytest.mark.django_db
+class TestAtomicIngestion(TestCase):
+
+    def setUp(self) -> None:
+        with tempfile.NamedTemporaryFile('w', suffix='.xml', delete=False, encoding='utf8') as xml_file:
+            xml_file.write(INVALID_DEGREE_CCV)
+        self.filepath = xml_file.name
+
+    def tearDown(self) -> None:
+        os.remove(self.filepath)
+
+    def assert_rolled_back(self, *args) -> None:
+        """
+        Ingests a ccv whose degree doesn't fit in the database and checks that nothing was saved
+        """
+        with pytest.raises(CommandError, match="'Education' section"):
+            management.call_command('parse_ccv', self.filepath, *args, stdout=StringIO(), stderr=StringIO())
+
+        assert not CanadianCommonCv.objects.exists()
+        assert not Identification.objects.exists()
+
+    def test_failed_section_is_rolled_back(self) -> None:
+        self.assert_rolled_back()
+
+    def test_failed_bulk_insert_is_rolled_back(self) -> None:
+        with pytest.raises(CommandError, match="bulk insert of Degree rows"):
+            management.call_command('parse_ccv', self.filepath, '--bulk', stdout=StringIO())
+
+        assert not CanadianCommonCv.objects.exists()
+
+    def test_failure_before_the_sections_is_described(self) -> None:
+        """
+        An organization whose name doesn't fit in the database fails before any section is saved
+        """
+        organization = """
+            <field label="Organization">
+                <refTable label="Organization">
+                    <linkedWith label="Organization" value="%s" refOrLovId="00000000000000000000000000000001"/>
+                </refTable>
+            </field>""" % ('University' * 20)
+        with open(self.filepath, 'w', encoding='utf8') as xml_file:
+            xml_file.write(INVALID_DEGREE_CCV.replace('Doctorate' * 10, 'Doctorate')
+                           .replace('<field label="Degree Name"/>', organization + '<field label="Degree Name"/>'))
+
+        with pytest.raises(CommandError, match=r"in the reading of the document, nothing was saved"):
+            management.call_command('parse_ccv', self.filepath, stdout=StringIO(), stderr=StringIO())
+
+    def test_async_commit(self) -> None:
+        self.assert_rolled_back('--async-commit')
+
+    def test_truncated_xml_is_rolled_back(self) -> None:
+        """
+        Sections are saved while the file is read: the ones before the end of a truncated file must not be kept
+        """
+        with open(self.filepath, 'w', encoding='utf8') as xml_file:
+            xml_file.write(INVALID_DEGREE_CCV.split('<section id="0d82220f95f043e0bc9608bbb6bf413a"')[0])
+
+        with pytest.raises(CommandError, match="invalid XML"):
+            management.call_command('parse_ccv', self.filepath, stdout=StringIO())
+
+        assert not CanadianCommonCv.objects.exists()
+        assert not Identification.objects.exists()
+
+
+@pytest.mark.django_db
+class TestProfiling(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_profile(self) -> None:
+        """
+        The report accounts for every statement of the ingestion, by stage and by model
+        """
+        stacks = os.path.join(self.directory.name, 'ingest.folded')
+        stats = os.path.join(self.directory.name, 'ingest.prof')
+        stderr = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            management.call_command('parse_ccv', 'sample_ccv/ccv_sample_3.xml', '--bulk', '--profile',
+                                    profile_stacks=stacks, profile_stats=stats, stdout=StringIO(), stderr=stderr)
+
+        report = dict(re.findall(r'^(\w.*?) +([\d.]+ +\d+ +\d+)$', stderr.getvalue(), re.MULTILINE))
+        assert {'read Education', 'save Education', 'bulk insert'} <= set(report)
+        assert int(report['total'].split()[1]) == len(queries)
+        assert report['Journal'].split()[2] == str(Journal.objects.count())
+        assert int(report['bulk insert'].split()[2]) >= Journal.objects.count()
+        model_rows = re.findall(r' (\d+)$', stderr.getvalue().split('\nmodel')[1], re.MULTILINE)
+        assert int(report['total'].split()[2]) == sum(int(rows) for rows in model_rows)
+
+        with open(stacks, encoding='utf8') as folded:
+            lines = folded.read().splitlines()
+        assert lines and all(re.match(r'^[^;]+(;[^;]+)* \d+$', line) for line in lines)
+        assert os.path.getsize(stats)
+
+
+@pytest.mark.django_db
+class TestBenchmark(TestCase):
+
+    def test_benchmark(self) -> None:
+        """
+        Files already ingested are measured as well, and nothing is kept in the database
+        """
+        ccv_id = TestParser.parse_ccv("sample_ccv/ccv_sample_3.xml")
+        output = StringIO()
+        management.call_command('benchmark', 'sample_ccv/ccv_sample_3.xml', 'sample_ccv/ccv_sample_2.xml',
+                                sizes=[1, 3], page_sizes=[2], repeat=1, stdout=output, stderr=StringIO())
+
+        results = json.loads(output.getvalue())
+        assert [result['file'] for result in results['files']] == [
+            'sample_ccv/ccv_sample_3.xml', 'sample_ccv/ccv_sample_2.xml',
+        ]
+        assert all(result['ingest']['statements'] > result['bulk_ingest']['statements'] > 1
+                   for result in results['files'])
+        assert [(corpus['ccvs'], corpus['ccvs_in_database']) for corpus in results['corpora']] == [(1, 2), (3, 4)]
+        assert all(corpus['list']['2']['cold']['statements'] > corpus['list']['2']['warm']['statements'] > 0
+                   for corpus in results['corpora'])
+        assert list(CanadianCommonCv.objects.values_list('id', flat=True)) == [ccv_id]
+
+
+@pytest.mark.django_db
+class TestSyntheticCorpus(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def generate(self, directory: str, *args) -> list:
+        management.call_command('generate_ccv', directory, '--count', '2', '--seed', '3', *args, stdout=StringIO())
+        return sorted(os.path.join(directory, name) for name in os.listdir(directory))
+
+    def test_generated_ccvs_are_ingested(self) -> None:
+        """
+        The same seed generates the same CVs, which are ingested with the number of records asked for
+        """
+        paths = self.generate(self.directory.name, '--set', 'Journal Articles=7', '--set', 'Degrees=2')
+        again = self.generate(os.path.join(self.directory.name, 'again'), '--set', 'Journal Articles=7',
+                              '--set', 'Degrees=2')
+        for path, same in zip(paths, again):
+            with open(path, 'rb') as generated, open(same, 'rb') as regenerated:
+                assert generated.read() == regenerated.read()
+
+        for path in paths:
+            output, stderr = StringIO(), StringIO()
+            management.call_command('parse_ccv', path, stdout=output, stderr=stderr)
+            ccv_id = int(output.getvalue())
+            assert Journal.objects.filter(publication__contribution__ccv_id=ccv_id, journal_type='Article').count() == 7
+            assert Degree.objects.filter(education__ccv_id=ccv_id).count() == 2
+            # Every generated value is read
+            assert not stderr.getvalue()
+
+        assert CanadianCommonCv.objects.filter(ccv_identifier__in=['synthetic-3-0', 'synthetic-3-1']).count() == 2
+
+    def test_every_index_is_generated(self) -> None:
+        """
+        The submission dates of thousands of CVs, which used to fail on February 29th, generated from a template of a
+        single section so that it stays fast
+        """
+        file_path = os.path.join(self.directory.name, 'ccv.xml')
+        with open(file_path, 'w', encoding='utf8') as xml_file:
+            xml_file.write(INVALID_DEGREE_CCV)
+
+        template = synthetic.observe([file_path])
+        for seed in (0, 1):
+            generator = synthetic.CcvGenerator(template, seed)
+            for index in range(4000):
+                generated = generator.generate(index).getroot().get('dateTimeGenerated')
+                assert 2015 <= datetime.datetime.strptime(generated, '%Y-%m-%d %H:%M:%S').year <= 2020
+
+
+@pytest.mark.django_db
+class TestSources(TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.samples = []
+        for file_path in ('sample_ccv/ccv_sample_1.xml', 'sample_ccv/ccv_sample_2.xml'):
+            with open(file_path, 'rb') as sample:
+                self.samples.append(sample.read())
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def parse_ccv(self, file_path: str, **options) -> list:
+        output = StringIO()
+        management.call_command('parse_ccv', file_path, stdout=output, stderr=StringIO(), **options)
+        return [int(line) for line in output.getvalue().split()]
+
+    def test_gzip(self) -> None:
+        file_path = os.path.join(self.directory.name, 'ccv.xml.gz')
+        with gzip.open(file_path, 'wb') as compressed:
+            compressed.write(self.samples[0])
+
+        assert self.parse_ccv(file_path, bulk=True) == list(CanadianCommonCv.objects.values_list('id', flat=True))
+
+    def test_zip(self) -> None:
+        """
+        Every CV of an archive is ingested in its own transaction, compressed ones as well, other files are skipped
+        """
+        file_path = os.path.join(self.directory.name, 'ccvs.zip')
+        with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('README.txt', 'Nightly export')
+            archive.writestr('2020/ccv_1.xml', self.samples[0])
+            archive.writestr('2020/ccv_2.xml.gz', gzip.compress(self.samples[1]))
+
+        ccv_ids = self.parse_ccv(file_path)
+        assert len(ccv_ids) == 2
+        assert set(ccv_ids) == set(CanadianCommonCv.objects.values_list('id', flat=True))
+
+    def test_stdin(self) -> None:
+        for content in (self.samples[0], gzip.compress(self.samples[1])):
+            self.parse_ccv('-', stdin=BytesIO(content))
+
+        assert CanadianCommonCv.objects.count() == 2
+
+    def test_invalid_archive(self) -> None:
+        with pytest.raises(CommandError, match="Failed to read -"):
+            self.parse_ccv('-', stdin=BytesIO(gzip.compress(self.samples[0])[:100]))
+
+
+@pytest.mark.django_db
+class TestBatchIngestion(TestCase):
+
+    def setUp(self) -> None:
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf8') as manifest:
+            manifest.write("# nightly export\nsample_ccv/ccv_sample_1.xml\n\nsample_ccv/missing.xml\n")
+        self.manifest = manifest.name
+
+    def tearDown(self) -> None:
+        os.remove(self.manifest)
+
+    def test_sources_and_manifest(self) -> None:
+        """
+        Every file is ingested once, and a failed file neither stops the batch nor undoes the other files
+        """
+        output = StringIO()
+        with pytest.raises(CommandError, match="1 of 4 CCV files failed"):
+            management.call_command('batch_parse_ccv', 'sample_ccv/ccv_sample_[23].xml', 'sample_ccv/ccv_sample_2.xml',
+                                    manifest=self.manifest, workers=1, stdout=output)
+
+        lines = output.getvalue().splitlines()
+        assert [line.split()[:2] for line in lines[:3]] == [
+            ['OK', 'sample_ccv/ccv_sample_2.xml'],
+            ['OK', 'sample_ccv/ccv_sample_3.xml'],
+            ['OK', 'sample_ccv/ccv_sample_1.xml'],
+        ]
+        assert lines[3].startswith('FAILED  sample_ccv/missing.xml')
+        assert CanadianCommonCv.objects.count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBatchIngestionPool(TransactionTestCase):
+
+    def test_workers(self) -> None:
+        """
+        Files ingested by the worker processes are committed through the workers' own connections
+        """
+        output = StringIO()
+        management.call_command('batch_parse_ccv', 'sample_ccv', workers=2, stdout=output)
+
+        ids = {int(line.split()[2]) for line in output.getvalue().splitlines() if line.startswith('OK')}
+        assert len(ids) == len(os.listdir('sample_ccv'))
+        assert set(CanadianCommonCv.objects.values_list('id', flat=True)) == ids
+
+
+@pytest.mark.django_db
+class TestReingestion(TestCase):
+
+    @staticmethod
+    def parse_ccv(filepath: str, *args) -> int:
+        output = StringIO()
+        management.call_command('parse_ccv', filepath, *args, stdout=output, stderr=StringIO())
+        return int(output.getvalue().strip())
+
+    def write_submission(self, date_time_generated: str) -> str:
+        """
+        Copies sample 3 with another generation date
+        :param date_time_generated:
+        :return: path of the copy
+        """
+        with open("sample_ccv/ccv_sample_3.xml", encoding="utf8") as xml_file:
+            xml = xml_file.read().replace('dateTimeGenerated="2020-05-25 14:47:41"',
+                                          f'dateTimeGenerated="{date_time_generated}"')
+
+        with tempfile.NamedTemporaryFile('w', suffix='.xml', delete=False, encoding='utf8') as copy:
+            copy.write(xml)
+        self.addCleanup(os.remove, copy.name)
+        return copy.name
+
+    def test_submission_is_stored(self) -> None:
+        ccv = CanadianCommonCv.objects.get(id=self.parse_ccv("sample_ccv/ccv_sample_3.xml"))
+
+        assert ccv.ccv_identifier == "28670"
+        assert ccv.confirmation_number == "1152145"
+        assert normalize_date(ccv.date_time_generated, '%Y-%m-%d %H:%M:%S') == "2020-05-25 14:47:41"
+
+    def test_same_or_older_submission_is_skipped(self) -> None:
+        db_id = self.parse_ccv("sample_ccv/ccv_sample_3.xml")
+        identification_id = Identification.objects.get(ccv_id=db_id).id
+
+        with CaptureQueriesContext(connection) as queries:
+            assert self.parse_ccv("sample_ccv/ccv_sample_3.xml") == db_id
+            assert self.parse_ccv(self.write_submission("2020-01-01 00:00:00"), '--bulk') == db_id
+
+        assert len(queries) < 10
+        assert CanadianCommonCv.objects.count() == 1
+        assert Identification.objects.get().id == identification_id
+
+    def test_newer_submission_replaces_the_previous_one(self) -> None:
+        for args in ((), ('--bulk',)):
+            db_id = self.parse_ccv("sample_ccv/ccv_sample_3.xml")
+            ccv_uuid = CanadianCommonCv.objects.get(id=db_id)._id
+            degrees = Degree.objects.filter(education__ccv_id=db_id).count()
+
+            assert self.parse_ccv(self.write_submission("2020-06-01 08:00:00"), *args) == db_id
+
+            ccv = CanadianCommonCv.objects.get()
+            assert ccv._id == ccv_uuid
+            assert normalize_date(ccv.date_time_generated, '%Y-%m-%d') == "2020-06-01"
+            assert Identification.objects.filter(ccv_id=db_id).count() == 1
+            assert Degree.objects.filter(education__ccv_id=db_id).count() == degrees
+
+            CanadianCommonCv.objects.all().delete()
+
+    def test_update_only_writes_the_changed_records(self) -> None:
+        """
+        With --update, a newer submission which renames a degree, adds a journal article and removes another one
+        updates, inserts and deletes one row each, then updates the search document
+        """
+        tree = ET.parse("sample_ccv/ccv_sample_3.xml")
+        root = tree.getroot()
+        root.set('dateTimeGenerated', "2020-06-01 08:00:00")
+
+        publications = next(section for section in root.iter('section') if section.get('label') == 'Publications')
+        articles = [section for section in publications if section.get('label') == 'Journal Articles']
+        added = copy.deepcopy(articles[0])
+        added.set('recordId', 'ffffffffffffffffffffffffffffffff')
+        for nested in added.findall('section'):
+            added.remove(nested)
+        publications.append(added)
+        publications.remove(articles[-1])
+
+        degree = next(section for section in root.iter('section') if section.get('label') == 'Degrees')
+        next(field for field in degree if field.get('label') == 'Degree Name').find('value').text = "Renamed"
+
+        filepath = self.write_submission("2020-05-25 14:47:41")
+        tree.write(filepath, encoding='unicode')
+
+        for args in ((), ('--bulk',)):
+            db_id = self.parse_ccv("sample_ccv/ccv_sample_3.xml")
+            degree_ids = list(Degree.objects.order_by('id').values_list('id', flat=True))
+            journal_ids = set(Journal.objects.values_list('id', flat=True))
+
+            with CaptureQueriesContext(connection) as queries:
+                assert self.parse_ccv(filepath, '--update', *args) == db_id
+
+            writes = [re.match(r'(\w+)\D+?"(\w+)"', query['sql']).groups() for query in queries.captured_queries
+                      if query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))]
+            assert sorted(writes) == [
+                ('DELETE', 'ccv_journal'), ('DELETE', 'ccv_journal_funding_source'), ('INSERT', 'ccv_journal'),
+                ('UPDATE', 'ccv_canadiancommoncv'), ('UPDATE', 'ccv_degree'), ('UPDATE', 'ccv_searchdocument'),
+            ]
+            assert list(Degree.objects.order_by('id').values_list('id', flat=True)) == degree_ids
+            assert Degree.objects.get(id=degree_ids[0]).name == "Renamed"
+            new_journal = Journal.objects.exclude(id__in=journal_ids).get()
+            assert new_journal.record_id == 'ffffffffffffffffffffffffffffffff'
+            assert len(journal_ids - set(Journal.objects.values_list('id', flat=True))) == 1
+
+            CanadianCommonCv.objects.all().delete()
+
+
+@pytest.mark.django_db
+class TestOrganizations(TestCase):
+
+    def test_organizations_are_shared(self) -> None:
+        """
+        Every distinct organization is stored once, whichever CV or mode referenced it
+        """
+        keys = {
+            OrganizationLookup.get_key({
+                'name': organization.get('Organization'), 'type': organization.get('Organization Type'),
+                'country': organization.get('Country'), 'subdivision': organization.get('Subdivision'),
+            })
+            for filepath in ("sample_ccv/ccv_sample_1.xml", "sample_ccv/ccv_sample_3.xml")
+            for organization in iter_organizations(filepath)
+        }
+
+        for args in ((), ('--bulk',)):
+            for filepath in ("sample_ccv/ccv_sample_1.xml", "sample_ccv/ccv_sample_3.xml"):
+                management.call_command('parse_ccv', filepath, *args, stdout=StringIO(), stderr=StringIO())
+
+        stored = Organization.objects.values_list('name', 'type', 'country', 'subdivision')
+        assert len(stored) == len(keys)
+        assert set(stored) == keys
+        assert Degree.objects.values('organization_id').distinct().count() < Degree.objects.count()
+
+
+class TestConverters(TestCase):
+
+    def test_dates(self) -> None:
+        for converter, format, values in ((YEAR_MONTH, '%Y/%m', ('2019/05', '2019/5', '1999/12')),
+                                          (DATE, '%Y-%m-%d', ('2019-05-31', '2020-02-29'))):
+            for value in values:
+                assert converter(value) == datetime.datetime.strptime(value, format)
+            assert converter('') is None
+            assert converter(None) is None
+            for value in ('2019-13-01', '2019-02-30', '05/2019', '/05'):
+                with pytest.raises(ConversionError):
+                    converter(value)
+        assert YEAR_MONTH('2019/') == datetime.datetime(2019, 1, 1)
+        with pytest.raises(ConversionError):
+            DATE('2019/')
+
+    def test_sample_ccvs_are_converted(self) -> None:
+        """
+        Every value of the sample CVs is converted: parse_ccv reports nothing
+        """
+        for file_name in sorted(os.listdir('sample_ccv')):
+            errors = StringIO()
+            management.call_command('parse_ccv', os.path.join('sample_ccv', file_name), stdout=StringIO(),
+                                    stderr=errors)
+            assert errors.getvalue() == '', file_name
+
+    def test_booleans_and_integers(self) -> None:
+        assert boolean('Yes') is True
+        assert boolean('No') is False
+        assert boolean(None) is False
+        assert integer('42') == 42
+        assert integer('') is None
+        for converter in (boolean, integer):
+            with pytest.raises(ConversionError):
+                converter('maybe')
+
+    @pytest.mark.django_db
+    def test_invalid_values_are_reported(self) -> None:
+        """
+        A value which can't be converted is reported, and its field left empty, without failing the ingestion
+        """
+        with open('sample_ccv/ccv_sample_1.xml', encoding='utf8') as xml_file:
+            xml = xml_file.read().replace('>2009/<', '>2009/13<')
+
+        stderr = StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'ccv.xml')
+            with open(file_path, 'w', encoding='utf8') as xml_file:
+                xml_file.write(xml)
+            management.call_command('parse_ccv', file_path, stdout=StringIO(), stderr=stderr)
+
+        assert "'Committee Memberships > Membership Start Date': '2009/13' is not a date" in stderr.getvalue()
+        assert CommitteeMembership.objects.filter(start_date=None).exists()
+        assert Journal.objects.filter(contributors_count__gt=0).exists()
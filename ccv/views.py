@@ -1,11 +1,215 @@
-from rest_framework.generics import ListAPIView
-from rest_framework.pagination import PageNumberPagination
+import hashlib
+import uuid
 
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import Http404, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from rest_framework import status
+from rest_framework.generics import GenericAPIView, ListAPIView, RetrieveAPIView, get_object_or_404
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from . import cache, jobs
+from .export import iter_ndjson
 from .models.base import CanadianCommonCv
-from .serializers import CanadianCommonCvSerializer
+from .models.ingestion import IngestionJob
+from .filters import CcvFilter, FullTextSearchFilter
+from .pagination import CcvCursorPagination, CcvSearchPagination
+from .serializers import ALL, CanadianCommonCvSerializer, IngestionJobSerializer, get_selection
+
+
+def get_etag(request, *values) -> str:
+    """
+    :param request:
+    :param values: state of the rendered CVs
+    :return: entity tag of a response rendering CVs in that state. It also depends on the version of the
+    representation, on the selected fields and on the negotiated format, which is read from the request before it is
+    negotiated.
+    """
+    content = [
+        cache.REPRESENTATION_VERSION, request.GET.get('fields'), request.GET.get('expand'),
+        request.META.get('HTTP_ACCEPT'), request.GET.get('format'), *values
+    ]
+    return hashlib.md5(repr(content).encode()).hexdigest()
+
+
+def get_list_etag(request, *args, **kwargs) -> str:
+    """
+    Any ingestion updates the updated_at of its CV, and any deletion changes the number of CVs: both are read with a
+    single aggregate on the CV table, without loading the CVs. Unlike a token kept in the cache, it also sees the CVs
+    ingested by other processes
+    """
+    state = CanadianCommonCv.objects.aggregate(count=Count('id'), last_modified=Max('updated_at'))
+    return get_etag(request, state['count'], state['last_modified'])
+
+
+def get_lookup(value: str) -> dict:
+    """
+    :param value: id or _id of a CV
+    :return: filter of the CV
+    """
+    # isdigit accepts digits such as '²' which int can't read
+    if value.isascii() and value.isdecimal():
+        return {'id': int(value)}
+    try:
+        return {'_id': uuid.UUID(value)}
+    except ValueError:
+        raise Http404
+
+
+def get_ccv_state(request, lookup: str) -> dict:
+    """
+    :param request:
+    :param lookup: id or _id of the CV
+    :return: id and updated_at of the CV, read once per request, None if it doesn't exist
+    """
+    if not hasattr(request, 'ccv_state'):
+        request.ccv_state = CanadianCommonCv.objects.filter(**get_lookup(lookup)).values('id', 'updated_at').first()
+    return request.ccv_state
+
+
+def get_detail_etag(request, lookup: str):
+    state = get_ccv_state(request, lookup)
+    return state and get_etag(request, state['id'], state['updated_at'])
+
 
+def get_detail_last_modified(request, lookup: str):
+    state = get_ccv_state(request, lookup)
+    return state and state['updated_at']
 
-class CcvList(ListAPIView):
+
+class SelectionMixin:
+    """
+    Renders the fields selected with the fields and expand query parameters, see get_selection. Only the selected
+    relations and columns are loaded.
+    """
+
+    def get_selection(self):
+        return get_selection(self.request.query_params.get('fields'), self.request.query_params.get('expand'))
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), 'selection': self.get_selection()}
+
+    def get_queryset(self):
+        return self.get_serializer_class().setup_eager_loading(super().get_queryset(), self.get_selection())
+
+
+@method_decorator(condition(etag_func=get_list_etag), name='get')
+class CcvList(SelectionMixin, ListAPIView):
     queryset = CanadianCommonCv.objects.all()
     serializer_class = CanadianCommonCvSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = CcvCursorPagination
+    filter_backends = [CcvFilter]
+
+    def list(self, request, *args, **kwargs):
+        if self.get_selection() is not ALL:
+            return super().list(request, *args, **kwargs)
+
+        # Only the ids and updated_at of the CVs of the page are queried, the CVs are rendered from their cached
+        # representation
+        ccvs = self.filter_queryset(CanadianCommonCv.objects.only('id', 'updated_at'))
+        page = self.paginate_queryset(ccvs)
+        data = cache.get_representations([(ccv.id, ccv.updated_at) for ccv in (ccvs if page is None else page)],
+                                         self.get_queryset())
+
+        if page is None:
+            return Response(data)
+        return self.get_paginated_response(data)
+
+
+class CcvSearch(CcvList):
+    """
+    CVs matching the words of the q query parameter, the most relevant first
+    """
+
+    filter_backends = [CcvFilter, FullTextSearchFilter]
+    pagination_class = CcvSearchPagination
+
+
+@method_decorator(condition(etag_func=get_list_etag), name='get')
+class CcvExport(SelectionMixin, GenericAPIView):
+    """
+    Every CV as newline delimited JSON, streamed in a single response. Takes the filters and field selection of /ccv.
+    """
+
+    queryset = CanadianCommonCv.objects.all()
+    serializer_class = CanadianCommonCvSerializer
+    filter_backends = [CcvFilter]
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        # The eager loading is set up by iter_ndjson, for each chunk
+        queryset = self.filter_queryset(CanadianCommonCv.objects.all())
+        return StreamingHttpResponse(iter_ndjson(queryset, self.get_selection()), content_type='application/x-ndjson')
+
+
+@method_decorator(condition(etag_func=get_detail_etag, last_modified_func=get_detail_last_modified), name='get')
+class CcvDetail(SelectionMixin, RetrieveAPIView):
+    """
+    A CV, by id or by _id
+    """
+
+    queryset = CanadianCommonCv.objects.all()
+    serializer_class = CanadianCommonCvSerializer
+
+    def get_object(self):
+        ccv = get_object_or_404(self.get_queryset(), **get_lookup(self.kwargs['lookup']))
+        self.check_object_permissions(self.request, ccv)
+        return ccv
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.get_selection() is not ALL:
+            return super().retrieve(request, *args, **kwargs)
+
+        # The CV is rendered from its cached representation
+        state = get_ccv_state(request, kwargs['lookup'])
+        data = state and cache.get_representations([(state['id'], state['updated_at'])], self.get_queryset())
+        if not data:
+            raise Http404
+        return Response(data[0])
+
+
+class CcvIngest(GenericAPIView):
+    """
+    Queues the CCV xml file uploaded as file, gzip compressed or a zip archive of CVs, to be ingested by an
+    ingest_worker. Answers 202 with the job, which is polled at its url. Only staff users may ingest CVs.
+    """
+
+    queryset = IngestionJob.objects.all()
+    serializer_class = IngestionJobSerializer
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'file': ["Upload a CCV xml file."]}, status=status.HTTP_400_BAD_REQUEST)
+        if upload.size > settings.CCV_INGEST_MAX_SIZE:
+            return Response({'file': [f"The file is larger than {settings.CCV_INGEST_MAX_SIZE} bytes."]},
+                            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        # The workers bound how many files are ingested at once, the queue how many wait for them
+        if IngestionJob.objects.filter(status=IngestionJob.QUEUED).count() >= settings.CCV_INGEST_MAX_QUEUED:
+            return Response({'detail': "Too many files are waiting to be ingested, retry later."},
+                            status=status.HTTP_503_SERVICE_UNAVAILABLE, headers={'Retry-After': '60'})
+
+        update = str(request.data.get('update', '')).lower() in ('1', 'true', 'yes')
+        job = jobs.enqueue(upload.read(), name=upload.name, update=update)
+        url = request.build_absolute_uri(reverse('ccv-ingest-job', kwargs={'job': job.id}))
+        return Response({**self.get_serializer(job).data, 'url': url}, status=status.HTTP_202_ACCEPTED,
+                        headers={'Location': url})
+
+
+class CcvIngestJob(RetrieveAPIView):
+    """
+    An ingestion job, with the ids of the ingested CVs once it is done
+    """
+
+    queryset = IngestionJob.objects.defer('document')
+    serializer_class = IngestionJobSerializer
+    permission_classes = [IsAdminUser]
+    lookup_url_kwarg = 'job'
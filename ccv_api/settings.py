@@ -48,7 +48,8 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'ccv',
+    'django.contrib.postgres',
+    'ccv.apps.CcvConfig',
     'rest_framework',
     'drf_yasg'
 ]
@@ -87,16 +88,55 @@ WSGI_APPLICATION = 'ccv_api.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/3.0/ref/settings/#databases
 
+# Connections are kept open for PG_CONN_MAX_AGE seconds and reused by the following requests of the same thread, 0
+# closes them at the end of each request. With PG_CONN_HEALTH_CHECKS, a connection dropped by the server is replaced
+# when a request first uses it, see ccv.backends.postgresql.
+# PG_DB_POOL_MODE=transaction connects through a pooler such as PgBouncer in transaction pooling mode, which may
+# give each transaction another server connection: server side cursors, which outlive their transaction, are then
+# disabled. Session pooling needs no change.
+PG_DB_POOL_MODE = os.getenv('PG_DB_POOL_MODE') or 'session'
+# Configuration of the pooler written by the pgbouncer_config command: PostgreSQL behind it, server connections per
+# database and user, and most connections of the API
+PG_DB_SERVER_HOST = os.getenv('PG_DB_SERVER_HOST') or 'localhost'
+PG_DB_SERVER_PORT = int(os.getenv('PG_DB_SERVER_PORT') or 5432)
+PG_DB_POOL_SIZE = int(os.getenv('PG_DB_POOL_SIZE') or 20)
+PG_DB_POOL_MAX_CLIENTS = int(os.getenv('PG_DB_POOL_MAX_CLIENTS') or 200)
+
 DATABASES = {
      'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'ccv.backends.postgresql',
         'NAME': os.getenv('PG_DBNAME'),
         'USER': os.getenv('PG_DB_USER'),
         'PASSWORD': os.getenv('PG_DB_PASSWORD'),
         'HOST': os.getenv('PG_DB_HOST'),
-        'PORT': os.getenv('PG_DB_PORT')
+        'PORT': os.getenv('PG_DB_PORT'),
+        'CONN_MAX_AGE': int(os.getenv('PG_CONN_MAX_AGE') or 10 * 60),
+        'CONN_HEALTH_CHECKS': os.getenv('PG_CONN_HEALTH_CHECKS', "True").lower() == "true",
+        'DISABLE_SERVER_SIDE_CURSORS': PG_DB_POOL_MODE == 'transaction',
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('PG_DB_CONNECT_TIMEOUT') or 10),
+        },
+    }
+}
+
+# Cache of the serialized CVs. Any Django cache backend can be used, e.g.
+# django.core.cache.backends.filebased.FileBasedCache with a directory as location, or a Redis backend such as
+# django_redis.cache.RedisCache with a redis:// url. Defaults to the memory of each process.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND') or 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
     }
 }
+CCV_CACHE = 'default'
+# Seconds a serialized CV is kept. CVs are cached under their updated_at, which each ingestion bumps: a CV ingested
+# again is served anew by every process, even with a cache of its own. The timeout only bounds how long changes made
+# outside of parse_ccv, which don't bump it, take to show
+CCV_CACHE_TIMEOUT = int(os.getenv('CCV_CACHE_TIMEOUT') or 24 * 60 * 60)
+
+# Text search configuration of the search documents and queries. Changing it requires running
+# update_search_documents
+CCV_SEARCH_CONFIG = os.getenv('CCV_SEARCH_CONFIG') or 'english'
 
 
 # Password validation
@@ -118,11 +158,23 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 5,
+    'DEFAULT_PAGINATION_CLASS': 'ccv.pagination.CcvCursorPagination',
+    'PAGE_SIZE': int(os.getenv('PAGE_SIZE') or 5),
     'TEST_REQUEST_DEFAULT_FORMAT': 'json'
 }
 
+# Largest page size clients may ask for with the page_size query parameter
+CCV_MAX_PAGE_SIZE = int(os.getenv('CCV_MAX_PAGE_SIZE') or 100)
+
+# Uploads to /ccv/ingest are queued and ingested by the ingest_worker command. The endpoint answers 503 while more
+# than CCV_INGEST_MAX_QUEUED jobs are waiting, and 413 for files larger than CCV_INGEST_MAX_SIZE bytes. A job running
+# for longer than CCV_INGEST_JOB_TIMEOUT seconds was left by a worker which died, and is queued again, unless it already
+# ran CCV_INGEST_MAX_ATTEMPTS times
+CCV_INGEST_MAX_QUEUED = int(os.getenv('CCV_INGEST_MAX_QUEUED') or 100)
+CCV_INGEST_MAX_SIZE = int(os.getenv('CCV_INGEST_MAX_SIZE') or 50 * 1024 * 1024)
+CCV_INGEST_JOB_TIMEOUT = int(os.getenv('CCV_INGEST_JOB_TIMEOUT') or 60 * 60)
+CCV_INGEST_MAX_ATTEMPTS = int(os.getenv('CCV_INGEST_MAX_ATTEMPTS') or 3)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/3.0/topics/i18n/
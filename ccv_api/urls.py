@@ -35,5 +35,10 @@ urlpatterns = [
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
     path('admin/', admin.site.urls),
-    path('ccv', views.CcvList.as_view())
+    path('ccv', views.CcvList.as_view()),
+    path('ccv/search', views.CcvSearch.as_view()),
+    path('ccv/export.ndjson', views.CcvExport.as_view()),
+    path('ccv/ingest', views.CcvIngest.as_view(), name='ccv-ingest'),
+    path('ccv/ingest/<uuid:job>', views.CcvIngestJob.as_view(), name='ccv-ingest-job'),
+    path('ccv/<str:lookup>', views.CcvDetail.as_view())
 ]